@@ -3,20 +3,26 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+import time
+from dataclasses import asdict, dataclass
+from functools import partial
+from typing import TYPE_CHECKING, Any
 
 from aula import (
     AulaAuthenticationError,
     AulaConnectionError,
     AulaRateLimitError,
     AulaServerError,
+    Profile,
     create_client,
 )
-from aula.http_httpx import HttpxHttpClient
+from homeassistant.const import Platform
+from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.start import async_at_started
 
 from .const import (
     CONF_TOKEN_DATA,
@@ -32,9 +38,8 @@ from .const import (
     WIDGET_EASYIQ_WEEKPLAN,
     WIDGET_HUSKELISTEN,
     WIDGET_MEEBOOK,
-    WIDGET_MIN_UDDANNELSE_SSO,
-    WIDGET_MIN_UDDANNELSE_TASKS,
     WIDGET_MIN_UDDANNELSE_UGEPLAN,
+    WIDGET_REFRESH_STAGGER,
 )
 from .coordinator import (
     AulaCalendarCoordinator,
@@ -47,15 +52,23 @@ from .coordinator import (
     AulaMUUgeplanCoordinator,
     AulaNotificationsCoordinator,
     AulaPresenceCoordinator,
+    _AulaCoordinator,
+    _AulaWidgetCoordinator,
     _get_child_institution_code,
     _get_child_widget_id,
+    _load_models,
+    _model_raw,
 )
 from .data import AulaRuntimeData, WidgetContext
+from .http_client import async_create_http_client
+from .scheduler import AulaRequestScheduler, RequestPriority
 from .services import async_setup_services
+from .singleflight import AulaSingleFlight
+from .store import AulaSnapshotStore
 from .token_manager import AulaTokenManager
 
 if TYPE_CHECKING:
-    from aula import AulaApiClient, Profile
+    from aula import AulaApiClient
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.typing import ConfigType
 
@@ -63,17 +76,9 @@ if TYPE_CHECKING:
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
-# All widget/feature IDs that require building a widget context.
-_ALL_WIDGET_IDS = (
-    WIDGET_BIBLIOTEKET,
-    WIDGET_MIN_UDDANNELSE_TASKS,
-    WIDGET_MIN_UDDANNELSE_SSO,
-    WIDGET_MIN_UDDANNELSE_UGEPLAN,
-    WIDGET_EASYIQ_WEEKPLAN,
-    WIDGET_EASYIQ_HOMEWORK,
-    WIDGET_MEEBOOK,
-    WIDGET_HUSKELISTEN,
-)
+# Snapshot store slot caching the profile and widget context between setups.
+_PROFILE_SLOT = "profile"
+_PROFILE_SCHEMA = 1
 
 
 @dataclass
@@ -87,6 +92,21 @@ class _WidgetCoordinators:
     meebook: AulaMeebookCoordinator | None = None
     huskelisten: AulaHuskelistenCoordinator | None = None
 
+    def active(self) -> list[_AulaCoordinator[Any]]:
+        """Return the widget coordinators that were created."""
+        return [
+            coord
+            for coord in (
+                self.library,
+                self.mu_tasks,
+                self.mu_ugeplan,
+                self.easyiq,
+                self.meebook,
+                self.huskelisten,
+            )
+            if coord
+        ]
+
 
 def is_widget_enabled(entry: AulaConfigEntry, widget_id: str) -> bool:
     """Return True if the given widget ID is selected in the config entry."""
@@ -108,9 +128,65 @@ def _mu_task_widget_id(entry: AulaConfigEntry) -> str | None:
     )
 
 
-def _create_http_client(cookies: dict[str, str]) -> HttpxHttpClient:
-    """Create HTTP client in a thread to avoid blocking SSL cert loading."""
-    return HttpxHttpClient(cookies=cookies)
+def _selected_widget_coordinators(
+    entry: AulaConfigEntry,
+) -> list[type[_AulaWidgetCoordinator[Any]]]:
+    """Return the widget coordinators for the widgets selected in the entry."""
+    selected: list[type[_AulaWidgetCoordinator[Any]]] = []
+    if is_widget_enabled(entry, WIDGET_BIBLIOTEKET):
+        selected.append(AulaLibraryCoordinator)
+    if _mu_task_widget_id(entry):
+        selected.append(AulaMUTasksCoordinator)
+    if is_widget_enabled(entry, WIDGET_MIN_UDDANNELSE_UGEPLAN):
+        selected.append(AulaMUUgeplanCoordinator)
+    if is_widget_enabled(entry, WIDGET_EASYIQ_WEEKPLAN) or is_widget_enabled(
+        entry, WIDGET_EASYIQ_HOMEWORK
+    ):
+        selected.append(AulaEasyIQCoordinator)
+    if is_widget_enabled(entry, WIDGET_MEEBOOK):
+        selected.append(AulaMeebookCoordinator)
+    if is_widget_enabled(entry, WIDGET_HUSKELISTEN):
+        selected.append(AulaHuskelistenCoordinator)
+    return selected
+
+
+def _wanted_widget_coordinators(
+    hass: HomeAssistant,
+    entry: AulaConfigEntry,
+    profile: Profile,
+) -> set[type[_AulaWidgetCoordinator[Any]]]:
+    """
+    Return the selected widget coordinators that have an entity to feed.
+
+    A coordinator whose sensors are all registered and disabled in the
+    entity registry is left out, so it never polls. One with a sensor not
+    registered yet, as on the first setup or for a child new to the
+    profile, is kept so that sensor gets created. Enabling a sensor reloads
+    the entry, which brings its coordinator back.
+    """
+    registry = er.async_get(hass)
+    disabled_by_unique_id = {
+        entity.unique_id: entity.disabled_by is not None
+        for entity in er.async_entries_for_config_entry(registry, entry.entry_id)
+        if entity.domain == Platform.SENSOR
+    }
+    wanted: set[type[_AulaWidgetCoordinator[Any]]] = set()
+    for coordinator_cls in _selected_widget_coordinators(entry):
+        expected = [
+            f"{child.id}_{key}"
+            for child in profile.children
+            for key in coordinator_cls.entity_keys
+        ]
+        if expected and all(
+            disabled_by_unique_id.get(unique_id, False) for unique_id in expected
+        ):
+            LOGGER.debug(
+                "Not polling %s, all of its sensors are disabled",
+                coordinator_cls.__name__,
+            )
+            continue
+        wanted.add(coordinator_cls)
+    return wanted
 
 
 async def _build_widget_context(
@@ -137,14 +213,10 @@ async def _build_widget_context(
 
 
 async def _try_build_widget_context(
-    entry: AulaConfigEntry,
     client: AulaApiClient,
     profile: Profile,
 ) -> WidgetContext | None:
-    """Build widget context if any widget is enabled, else return None."""
-    if not any(is_widget_enabled(entry, w) for w in _ALL_WIDGET_IDS):
-        return None
-
+    """Build the widget context, or None if Aula fails to provide it."""
     try:
         return await _build_widget_context(client, profile)
     except (
@@ -164,39 +236,38 @@ def _create_widget_coordinators(  # noqa: PLR0913
     profile: Profile,
     widget_context: WidgetContext,
     token_manager: AulaTokenManager,
+    wanted: set[type[_AulaWidgetCoordinator[Any]]],
 ) -> _WidgetCoordinators:
-    """Create widget coordinators for enabled widgets."""
+    """Create the wanted widget coordinators; see _wanted_widget_coordinators."""
     wc = _WidgetCoordinators()
 
-    if is_widget_enabled(entry, WIDGET_BIBLIOTEKET):
+    if AulaLibraryCoordinator in wanted:
         wc.library = AulaLibraryCoordinator(
             hass, client, profile, widget_context, token_manager
         )
 
     mu_task_widget = _mu_task_widget_id(entry)
-    if mu_task_widget:
+    if mu_task_widget and AulaMUTasksCoordinator in wanted:
         wc.mu_tasks = AulaMUTasksCoordinator(
             hass, client, profile, widget_context, token_manager, mu_task_widget
         )
 
-    if is_widget_enabled(entry, WIDGET_MIN_UDDANNELSE_UGEPLAN):
+    if AulaMUUgeplanCoordinator in wanted:
         wc.mu_ugeplan = AulaMUUgeplanCoordinator(
             hass, client, profile, widget_context, token_manager
         )
 
-    if is_widget_enabled(entry, WIDGET_EASYIQ_WEEKPLAN) or is_widget_enabled(
-        entry, WIDGET_EASYIQ_HOMEWORK
-    ):
+    if AulaEasyIQCoordinator in wanted:
         wc.easyiq = AulaEasyIQCoordinator(
             hass, client, profile, widget_context, token_manager
         )
 
-    if is_widget_enabled(entry, WIDGET_MEEBOOK):
+    if AulaMeebookCoordinator in wanted:
         wc.meebook = AulaMeebookCoordinator(
             hass, client, profile, widget_context, token_manager
         )
 
-    if is_widget_enabled(entry, WIDGET_HUSKELISTEN):
+    if AulaHuskelistenCoordinator in wanted:
         wc.huskelisten = AulaHuskelistenCoordinator(
             hass, client, profile, widget_context, token_manager
         )
@@ -244,16 +315,38 @@ async def async_migrate_entry(
     return True
 
 
-async def async_setup_entry(
+async def _async_connect(
     hass: HomeAssistant,
     entry: AulaConfigEntry,
-) -> bool:
-    """Set up Aula from a config entry."""
-    token_manager = AulaTokenManager(hass, entry)
+    token_manager: AulaTokenManager,
+    cached_profile: Profile | None = None,
+) -> tuple[AulaApiClient, Profile]:
+    """
+    Create the API client and fetch the profile, refreshing the session once.
+
+    With a cached profile the fetch is skipped; it is revalidated after setup.
+    No request then shows whether the session still holds, so a session past
+    its expiry is refreshed up front.
+    """
     token_data = entry.data[CONF_TOKEN_DATA]
+    if cached_profile is not None and _session_expired(token_data):
+        try:
+            client, _new_token_data = await token_manager.async_refresh_token()
+        except AulaAuthenticationError as refresh_err:
+            raise ConfigEntryAuthFailed(
+                translation_domain=DOMAIN,
+                translation_key="auth_failed",
+            ) from refresh_err
+        except (AulaConnectionError, AulaServerError, AulaRateLimitError) as err:
+            raise ConfigEntryNotReady(
+                translation_domain=DOMAIN,
+                translation_key="connection_failed",
+            ) from err
+        return client, cached_profile
+
     cookies = token_data.get("cookies", {})
 
-    http_client = await hass.async_add_executor_job(_create_http_client, cookies)
+    http_client = async_create_http_client(hass, cookies)
     try:
         client = await create_client(token_data, http_client=http_client)
     except AulaAuthenticationError:
@@ -272,6 +365,9 @@ async def async_setup_entry(
             translation_key="connection_failed",
         ) from err
 
+    if cached_profile is not None:
+        return client, cached_profile
+
     try:
         profile = await client.get_profile()
     except AulaAuthenticationError:
@@ -297,6 +393,23 @@ async def async_setup_entry(
             translation_key="connection_failed",
         ) from err
 
+    return client, profile
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: AulaConfigEntry,
+) -> bool:
+    """Set up Aula from a config entry."""
+    setup_started = time.monotonic()
+    token_manager = AulaTokenManager(hass, entry)
+    snapshot_store = AulaSnapshotStore(hass, entry.entry_id)
+    await snapshot_store.async_load()
+    cached = _cached_profile(snapshot_store)
+    client, profile = await _async_connect(
+        hass, entry, token_manager, cached[0] if cached else None
+    )
+
     presence_coordinator = AulaPresenceCoordinator(hass, client, profile, token_manager)
     calendar_coordinator = AulaCalendarCoordinator(hass, client, profile, token_manager)
     notifications_coordinator = AulaNotificationsCoordinator(
@@ -306,38 +419,50 @@ async def async_setup_entry(
 
     # Create widget coordinators if any widgets are enabled
     wc = _WidgetCoordinators()
-    widget_context = await _try_build_widget_context(entry, client, profile)
+    wanted = _wanted_widget_coordinators(hass, entry, profile)
+    widget_context: WidgetContext | None = None
+    if wanted:
+        widget_context = cached[1] if cached else None
+        if widget_context is None:
+            widget_context = await _try_build_widget_context(client, profile)
+    _cache_profile(snapshot_store, profile, widget_context)
     if widget_context:
         wc = _create_widget_coordinators(
-            hass, entry, client, profile, widget_context, token_manager
+            hass, entry, client, profile, widget_context, token_manager, wanted
         )
 
-    # First refresh all coordinators in parallel
-    first_refreshes = [
-        presence_coordinator.async_config_entry_first_refresh(),
-        calendar_coordinator.async_config_entry_first_refresh(),
-        notifications_coordinator.async_config_entry_first_refresh(),
-        messages_coordinator.async_config_entry_first_refresh(),
+    # Start the core coordinators from their snapshot where there is one, and
+    # from Aula where there is not. Restored ones revalidate once the
+    # platforms are up, so a slow endpoint no longer holds up setup. Widgets
+    # never hold it up: they start from their snapshot or unavailable, and
+    # first refresh once Home Assistant has started.
+    core_coordinators: list[_AulaCoordinator[Any]] = [
+        presence_coordinator,
+        calendar_coordinator,
+        notifications_coordinator,
+        messages_coordinator,
     ]
-    first_refreshes.extend(
-        coord.async_config_entry_first_refresh()
-        for coord in (
-            wc.library,
-            wc.mu_tasks,
-            wc.mu_ugeplan,
-            wc.easyiq,
-            wc.meebook,
-            wc.huskelisten,
-        )
-        if coord
+    widget_coordinators = wc.active()
+    request_scheduler = AulaRequestScheduler()
+    single_flight = AulaSingleFlight()
+    for coord in (*core_coordinators, *widget_coordinators):
+        coord.request_scheduler = request_scheduler
+        coord.single_flight = single_flight
+    restored = await asyncio.gather(
+        *(_async_first_refresh(coord, snapshot_store) for coord in core_coordinators)
     )
-
-    await asyncio.gather(*first_refreshes)
+    for coord in widget_coordinators:
+        # Without a snapshot, its sensors stay unavailable until the first
+        # refresh; see AulaEntity.available.
+        coord.async_restore_snapshot(snapshot_store)
 
     entry.runtime_data = AulaRuntimeData(
         client=client,
         token_manager=token_manager,
         profile=profile,
+        request_scheduler=request_scheduler,
+        single_flight=single_flight,
+        snapshot_store=snapshot_store,
         presence_coordinator=presence_coordinator,
         calendar_coordinator=calendar_coordinator,
         notifications_coordinator=notifications_coordinator,
@@ -354,9 +479,202 @@ async def async_setup_entry(
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    for coord, was_restored in zip(core_coordinators, restored, strict=True):
+        if was_restored:
+            entry.async_create_background_task(
+                hass, coord.async_refresh(), f"{coord.name} revalidation"
+            )
+    if cached:
+        entry.async_create_background_task(
+            hass,
+            _async_revalidate_profile(
+                hass, entry, snapshot_store, profile, widget_context
+            ),
+            "Aula profile revalidation",
+        )
+    if widget_coordinators:
+        entry.async_on_unload(
+            async_at_started(
+                hass, partial(_async_refresh_widgets, entry, widget_coordinators)
+            )
+        )
+
+    LOGGER.debug(
+        "Set up %s in %.2f s, %d of %d core coordinators from snapshots",
+        entry.title,
+        time.monotonic() - setup_started,
+        sum(restored),
+        len(core_coordinators),
+    )
     return True
 
 
+@callback
+def _async_refresh_widgets(
+    entry: AulaConfigEntry,
+    coordinators: list[_AulaCoordinator[Any]],
+    hass: HomeAssistant,
+) -> None:
+    """
+    First refresh the widget coordinators, spread out over time.
+
+    The first starts right away; the rest follow one at a time, so their
+    token exchanges do not all hit Aula together.
+    """
+    first, *rest = coordinators
+    entry.async_create_background_task(
+        hass, first.async_refresh(), f"{first.name} first refresh"
+    )
+    if rest:
+        entry.async_create_background_task(
+            hass,
+            _async_refresh_staggered(hass, entry, rest),
+            "Aula widget first refreshes",
+        )
+
+
+async def _async_refresh_staggered(
+    hass: HomeAssistant,
+    entry: AulaConfigEntry,
+    coordinators: list[_AulaCoordinator[Any]],
+) -> None:
+    """Start one coordinator refresh per stagger interval."""
+    for coord in coordinators:
+        await asyncio.sleep(WIDGET_REFRESH_STAGGER)
+        entry.async_create_background_task(
+            hass, coord.async_refresh(), f"{coord.name} first refresh"
+        )
+
+
+def _session_expired(token_data: dict[str, Any]) -> bool:
+    """Return whether the stored access token is past its expiry."""
+    expires_at = token_data.get("tokens", {}).get("expires_at")
+    return expires_at is not None and time.time() >= expires_at
+
+
+def _profile_identity(profile: Profile) -> tuple[Any, ...]:
+    """
+    Return what setup builds on from the profile.
+
+    The account, and each child's ID, name, widget ID and institution code:
+    the devices, entities and widget requests setup creates. Other fields may
+    change without a reload.
+    """
+    return (
+        profile.profile_id,
+        sorted(
+            (
+                child.id,
+                child.name,
+                _get_child_widget_id(child),
+                _get_child_institution_code(child),
+            )
+            for child in profile.children
+        ),
+    )
+
+
+def _cached_profile(
+    store: AulaSnapshotStore,
+) -> tuple[Profile, WidgetContext | None] | None:
+    """Return the profile and widget context cached by a previous setup."""
+    snapshot = store.async_get(_PROFILE_SLOT, _PROFILE_SCHEMA)
+    if snapshot is None:
+        return None
+    payload, _saved_at = snapshot
+    try:
+        [profile] = _load_models(Profile, [payload["profile"]])
+        context = payload["widget_context"]
+        widget_context = WidgetContext(**context) if context else None
+    except (AttributeError, KeyError, TypeError, ValueError) as err:
+        LOGGER.debug("Ignoring the cached profile: %s", err)
+        return None
+    return profile, widget_context
+
+
+@callback
+def _cache_profile(
+    store: AulaSnapshotStore,
+    profile: Profile,
+    widget_context: WidgetContext | None,
+) -> None:
+    """Cache the profile and widget context for the next setup."""
+    raw = _model_raw(profile)
+    if raw is None:
+        return
+    store.async_set(
+        _PROFILE_SLOT,
+        _PROFILE_SCHEMA,
+        {
+            "profile": raw,
+            "widget_context": asdict(widget_context) if widget_context else None,
+        },
+    )
+
+
+async def _async_revalidate_profile(
+    hass: HomeAssistant,
+    entry: AulaConfigEntry,
+    store: AulaSnapshotStore,
+    cached_profile: Profile,
+    cached_context: WidgetContext | None,
+) -> None:
+    """
+    Fetch the profile and widget context the entry was set up from again.
+
+    The entry is reloaded only if what setup built on has changed, for
+    instance when a child has moved school; otherwise the cache is just
+    refreshed.
+    """
+    runtime_data = entry.runtime_data
+    await runtime_data.request_scheduler.async_acquire(
+        RequestPriority.BACKGROUND, 2 if cached_context else 1
+    )
+    client = runtime_data.client
+    try:
+        profile = await client.get_profile()
+        widget_context = (
+            await _build_widget_context(client, profile) if cached_context else None
+        )
+    except (
+        AulaAuthenticationError,
+        AulaConnectionError,
+        AulaServerError,
+        AulaRateLimitError,
+    ) as err:
+        LOGGER.debug("Could not revalidate the cached profile: %s", err)
+        return
+
+    _cache_profile(store, profile, widget_context)
+    if (
+        _profile_identity(profile) != _profile_identity(cached_profile)
+        or widget_context != cached_context
+    ):
+        LOGGER.info("The Aula profile has changed, reloading %s", entry.title)
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+
+
+async def _async_first_refresh(
+    coordinator: _AulaCoordinator[Any],
+    snapshot_store: AulaSnapshotStore,
+) -> bool:
+    """
+    Give a coordinator its first data, returning True if it came from a snapshot.
+
+    Without a usable snapshot this is the regular first refresh, which fails
+    setup the same way it always has.
+    """
+    if coordinator.async_restore_snapshot(snapshot_store):
+        LOGGER.debug(
+            "Restored %s from a snapshot %s old",
+            coordinator.name,
+            coordinator.data_age,
+        )
+        return True
+    await coordinator.async_config_entry_first_refresh()
+    return False
+
+
 async def async_unload_entry(
     hass: HomeAssistant,
     entry: AulaConfigEntry,
@@ -364,10 +682,19 @@ async def async_unload_entry(
     """Unload an Aula config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
+        await entry.runtime_data.snapshot_store.async_flush()
         await entry.runtime_data.client.close()
     return unload_ok
 
 
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: AulaConfigEntry,
+) -> None:
+    """Delete the coordinator snapshots of a removed config entry."""
+    await AulaSnapshotStore(hass, entry.entry_id).async_remove()
+
+
 def _async_remove_stale_devices(
     hass: HomeAssistant,
     entry: AulaConfigEntry,
@@ -0,0 +1,81 @@
+"""Shared HTTP transport for MitID and Aula's login and token endpoints."""
+
+from __future__ import annotations
+
+import time
+from typing import TYPE_CHECKING
+
+import httpx
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import callback
+from homeassistant.util.hass_dict import HassKey
+from homeassistant.util.ssl import get_default_context
+
+from .const import AUTH_KEEPALIVE_EXPIRY, DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import Event, HomeAssistant
+
+DATA_AUTH_TRANSPORT: HassKey[AulaAuthTransport] = HassKey(f"{DOMAIN}_auth_transport")
+
+
+@callback
+def async_get_auth_transport(hass: HomeAssistant) -> AulaAuthTransport:
+    """
+    Return the auth transport, creating it on first use.
+
+    One transport serves every config entry and config flow. It verifies with
+    Home Assistant's cached SSL context, so no context is loaded per refresh,
+    and keeps connections to the auth hosts open between uses. It is closed
+    when Home Assistant stops.
+    """
+    if (transport := hass.data.get(DATA_AUTH_TRANSPORT)) is None:
+        transport = hass.data[DATA_AUTH_TRANSPORT] = AulaAuthTransport()
+
+        async def _async_close(_: Event) -> None:
+            await transport.async_shutdown()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close)
+    return transport
+
+
+class AulaAuthTransport(httpx.AsyncBaseTransport):
+    """
+    A connection pool that outlives the httpx clients using it.
+
+    Each login or refresh still makes a client of its own, for its own
+    cookies, and closes it when done; closing a client leaves this pool open.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with no connections open yet."""
+        self._transport = httpx.AsyncHTTPTransport(
+            verify=get_default_context(),
+            limits=httpx.Limits(keepalive_expiry=AUTH_KEEPALIVE_EXPIRY),
+        )
+        self._last_used: float | None = None
+        self.requests = 0
+
+    @property
+    def is_warm(self) -> bool:
+        """Return whether a request now would likely reuse an open connection."""
+        return (
+            self._last_used is not None
+            and time.monotonic() - self._last_used < AUTH_KEEPALIVE_EXPIRY
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Send a request over a pooled connection."""
+        self.requests += 1
+        try:
+            return await self._transport.handle_async_request(request)
+        finally:
+            self._last_used = time.monotonic()
+
+    async def aclose(self) -> None:
+        """Leave the pool open; clients close this when they are done with it."""
+
+    async def async_shutdown(self) -> None:
+        """Close the pool and its connections."""
+        self._last_used = None
+        await self._transport.aclose()
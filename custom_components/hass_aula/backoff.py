@@ -0,0 +1,65 @@
+"""Poll backoff for the Aula integration."""
+
+from __future__ import annotations
+
+import random
+from datetime import timedelta
+from typing import Any
+
+from .const import BACKOFF_MAX_INTERVAL
+
+# Draws the poll jitter, leaving the module-level generator's state alone.
+_random = random.SystemRandom()
+
+
+class AulaBackoff:
+    """
+    Exponential backoff with full jitter for one coordinator's polls.
+
+    Each failure in a row doubles the window the next delay is drawn from,
+    starting at the regular poll interval and capped at the ceiling. The
+    delay is never shorter than the interval. One success resets it.
+    """
+
+    def __init__(self, ceiling: float = BACKOFF_MAX_INTERVAL) -> None:
+        """Initialize the backoff in its reset state."""
+        self._ceiling = ceiling
+        self.failures = 0
+        self.backoffs = 0
+        self.last_delay: float | None = None
+        # Polls that would have gone out at the regular interval while we
+        # were backing off instead.
+        self.polls_saved = 0.0
+
+    @property
+    def active(self) -> bool:
+        """Return whether polls are currently backed off."""
+        return self.failures > 0
+
+    def next_delay(self, interval: timedelta) -> timedelta:
+        """Record a failure and return how long to wait before the next poll."""
+        self.failures += 1
+        self.backoffs += 1
+        base = interval.total_seconds()
+        window = min(self._ceiling, base * 2**self.failures)
+        delay = _random.uniform(base, max(base, window))
+        self.last_delay = delay
+        if base > 0:
+            self.polls_saved += delay / base - 1
+        return timedelta(seconds=delay)
+
+    def reset(self) -> None:
+        """Forget the failure streak after a good poll."""
+        self.failures = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the backoff state for diagnostics."""
+        return {
+            "active": self.active,
+            "consecutive_failures": self.failures,
+            "backoffs": self.backoffs,
+            "last_delay_seconds": (
+                round(self.last_delay) if self.last_delay is not None else None
+            ),
+            "polls_saved": round(self.polls_saved, 1),
+        }
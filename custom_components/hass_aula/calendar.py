@@ -4,19 +4,13 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from aula import (
-    AulaAuthenticationError,
-    AulaConnectionError,
-    AulaRateLimitError,
-    AulaServerError,
-)
-from aula import CalendarEvent as AulaCalendarEvent
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
 from homeassistant.util import dt as dt_util
 
 from .const import PARALLEL_UPDATES as PARALLEL_UPDATES  # noqa: PLC0414
 from .coordinator import AulaCalendarCoordinator
 from .entity import AulaEntity
+from .timeline import convert_event
 
 if TYPE_CHECKING:
     from datetime import datetime
@@ -43,25 +37,6 @@ async def async_setup_entry(
     )
 
 
-def _convert_event(event: AulaCalendarEvent) -> CalendarEvent:
-    """Convert an Aula calendar event to a HA calendar event."""
-    description_parts: list[str] = []
-    if event.teacher_name:
-        description_parts.append(f"Teacher: {event.teacher_name}")
-    if event.has_substitute and event.substitute_name:
-        description_parts.append(f"Substitute: {event.substitute_name}")
-    if event.location:
-        description_parts.append(f"Location: {event.location}")
-
-    return CalendarEvent(
-        summary=event.title,
-        start=event.start_datetime,
-        end=event.end_datetime,
-        description="\n".join(description_parts) if description_parts else None,
-        location=event.location,
-    )
-
-
 class AulaCalendarEntity(AulaEntity[AulaCalendarCoordinator], CalendarEntity):
     """Representation of an Aula school calendar."""
 
@@ -79,15 +54,10 @@ class AulaCalendarEntity(AulaEntity[AulaCalendarCoordinator], CalendarEntity):
     @property
     def event(self) -> CalendarEvent | None:
         """Return the next upcoming event."""
-        events = self.coordinator.data.get(self._child.id, [])
-        if not events:
-            return None
-        now = dt_util.now()
-        upcoming = [e for e in events if e.end_datetime > now]
-        if not upcoming:
-            return None
-        upcoming.sort(key=lambda e: e.start_datetime)
-        return _convert_event(upcoming[0])
+        # CalendarEntity sets timers for this event's start and end whenever
+        # the state is written, so the state flips on time between polls and
+        # moves on to the next event when one ends; no timers of our own.
+        return self.coordinator.timeline(self._child.id).next_event(dt_util.now())
 
     async def async_get_events(
         self,
@@ -96,18 +66,7 @@ class AulaCalendarEntity(AulaEntity[AulaCalendarCoordinator], CalendarEntity):
         end_date: datetime,
     ) -> list[CalendarEvent]:
         """Return calendar events within a date range."""
-        try:
-            events = await self.coordinator.client.get_calendar_events(
-                institution_profile_ids=[self._child.id],
-                start=start_date,
-                end=end_date,
-            )
-        except (
-            AulaAuthenticationError,
-            AulaConnectionError,
-            AulaServerError,
-            AulaRateLimitError,
-        ):
-            return []
-
-        return [_convert_event(event) for event in events]
+        events = await self.coordinator.async_get_events(
+            self._child.id, start_date, end_date
+        )
+        return [convert_event(event) for event in events]
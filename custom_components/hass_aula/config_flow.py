@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import ssl
 import time
 from typing import TYPE_CHECKING, Any
 
@@ -12,7 +11,6 @@ import voluptuous as vol
 from aula import WidgetConfiguration, authenticate, create_client
 from aula.auth.exceptions import PasswordInvalidError, TokenInvalidError
 from aula.auth.mitid_client import MitIDAuthClient
-from aula.http_httpx import HttpxHttpClient
 from homeassistant.config_entries import (
     ConfigEntry,
     ConfigFlow,
@@ -21,6 +19,7 @@ from homeassistant.config_entries import (
 from homeassistant.helpers import selector
 from slugify import slugify
 
+from .auth_transport import async_get_auth_transport
 from .const import (
     AUTH_METHOD_APP,
     AUTH_METHOD_TOKEN,
@@ -38,6 +37,7 @@ from .const import (
     SUPPORTED_WIDGETS,
     TOKEN_CODE_LENGTH,
 )
+from .http_client import async_create_http_client
 from .qr_view import AulaQRView, generate_animated_qr_svg
 
 if TYPE_CHECKING:
@@ -201,13 +201,9 @@ class AulaFlowHandler(ConfigFlow, domain=DOMAIN):
                     self._wait_for_qr_ready(),
                     "hass_aula_qr_ready",
                 )
-            # Build the SSL context in an executor to avoid blocking the event
-            # loop with ssl.SSLContext.load_verify_locations.
-            ssl_context = await self.hass.async_add_executor_job(
-                ssl.create_default_context,
-            )
+            # A client of its own for the login's cookies, on the shared pool.
             self._httpx_client = httpx.AsyncClient(
-                verify=ssl_context,
+                transport=async_get_auth_transport(self.hass),
                 follow_redirects=False,
                 timeout=30,
             )
@@ -552,7 +548,7 @@ class AulaFlowHandler(ConfigFlow, domain=DOMAIN):
         if self._token_data is None:
             return []
         cookies = self._token_data.get("cookies", {})
-        http_client = await self.hass.async_add_executor_job(HttpxHttpClient, cookies)
+        http_client = async_create_http_client(self.hass, cookies)
         try:
             client = await create_client(self._token_data, http_client=http_client)
             widgets = [
@@ -571,11 +567,10 @@ class AulaFlowHandler(ConfigFlow, domain=DOMAIN):
         self, token_data: dict[str, Any], refresh_token: str
     ) -> dict[str, Any]:
         """Attempt to refresh the access token using the stored refresh token."""
-        ssl_context = await self.hass.async_add_executor_job(
-            ssl.create_default_context,
-        )
         httpx_client = httpx.AsyncClient(
-            verify=ssl_context, follow_redirects=False, timeout=30
+            transport=async_get_auth_transport(self.hass),
+            follow_redirects=False,
+            timeout=30,
         )
         try:
             auth_client = MitIDAuthClient(mitid_username="", httpx_client=httpx_client)
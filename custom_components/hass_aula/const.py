@@ -88,6 +88,10 @@ PRESENCE_POLL_INTERVAL = 300  # 5 minutes
 NOTIFICATIONS_POLL_INTERVAL = 300  # 5 minutes
 CALENDAR_POLL_INTERVAL = 3600  # 60 minutes
 MESSAGES_POLL_INTERVAL = 1800  # 30 minutes
+# Longest the unread count is taken from the thread listing alone, by its
+# read flags or by it showing no change, before the unread listing is
+# fetched again to confirm it.
+MESSAGES_UNREAD_RECHECK_INTERVAL = 7200  # 2 hours
 
 # Widget poll intervals (seconds)
 LIBRARY_POLL_INTERVAL = 3600  # 60 minutes
@@ -97,6 +101,83 @@ EASYIQ_POLL_INTERVAL = 1800  # 30 minutes
 MEEBOOK_POLL_INTERVAL = 3600  # 60 minutes
 HUSKELISTEN_POLL_INTERVAL = 1800  # 30 minutes
 
+# Widget coordinators first refresh once Home Assistant has started, one
+# every this many seconds, so their token exchanges do not pile up at startup.
+WIDGET_REFRESH_STAGGER = 10  # seconds
+
+# How long an idle connection to the MitID and Aula login hosts stays open.
+# Entries refreshing close together, and the steps of a login, reuse it.
+AUTH_KEEPALIVE_EXPIRY = 120  # seconds
+
+# Week-keyed widget caches. Widgets that fetch by ISO week reuse a week's
+# response until its TTL runs out: the current week's lasts one poll interval,
+# later weeks' last WIDGET_NEXT_WEEK_TTL, as they change less often. Widgets
+# showing only the current week fetch next week ahead from the prefetch
+# weekday on, so the first poll after the week turns finds it cached.
+WIDGET_NEXT_WEEK_TTL = 10800  # 3 hours
+WIDGET_PREFETCH_WEEKDAY = 4  # Friday
+# A cached week counts as expired this long before its TTL runs out, so a
+# poll landing a moment early still refreshes it.
+WIDGET_WEEK_CACHE_MARGIN = 60  # seconds
+
+# Adaptive presence polling (seconds), driven by the children's planned check-in,
+# check-out and self-decider times. PRESENCE_POLL_INTERVAL stays the rate when
+# no plan is known. Around a planned time presence polls fast; between planned
+# times it slows down; outside the day's plan it waits for the next one, but
+# never longer than the idle ceiling, in case a child turns up unplanned.
+PRESENCE_BOUNDARY_POLL_INTERVAL = 60  # 1 minute
+PRESENCE_BOUNDARY_WINDOW = 900  # 15 minutes either side of a planned time
+PRESENCE_MIDDAY_POLL_INTERVAL = 900  # 15 minutes
+PRESENCE_IDLE_POLL_INTERVAL = 10800  # 3 hours
+PRESENCE_PLAN_DAYS = 7  # days of templates fetched ahead, to span weekends
+
+# Day-bucketed calendar sync. The coordinator keeps CALENDAR_WINDOW_DAYS days
+# from today and, on each poll, refetches only the days whose bucket has aged
+# past the refresh interval of its distance from today. The first
+# CALENDAR_NEAR_DAYS are refetched on every poll.
+CALENDAR_WINDOW_DAYS = 30
+CALENDAR_NEAR_DAYS = 3
+CALENDAR_MID_DAYS = 14
+CALENDAR_MID_REFRESH_INTERVAL = 21600  # 6 hours
+CALENDAR_FAR_REFRESH_INTERVAL = 86400  # 24 hours
+# Ranges outside the window, fetched for calendar views, are kept this long
+# and served past it when Aula fails.
+CALENDAR_RANGE_CACHE_SIZE = 32
+CALENDAR_RANGE_CACHE_TTL = 900  # 15 minutes
+# How long a range request waits for sibling calendars asking for the same.
+CALENDAR_BATCH_DELAY = 0.05  # seconds
+
+# Incremental notification fetching. A poll pages from the top of the list
+# until it reaches a notification it has seen; in steady state that is one
+# small page. Every full sync interval the whole list is fetched again, to
+# catch notifications read further down. A catch-up after downtime stops at
+# the catch-up limit. The coordinator keeps the newest NOTIFICATIONS_MAX_ITEMS.
+NOTIFICATIONS_PAGE_SIZE = 10
+NOTIFICATIONS_FULL_PAGE_SIZE = 50
+NOTIFICATIONS_MAX_ITEMS = 50
+NOTIFICATIONS_CATCH_UP_LIMIT = 500
+NOTIFICATIONS_FULL_SYNC_INTERVAL = 1800  # 30 minutes
+# Notifications listed in the notification sensors' "recent" attribute.
+NOTIFICATIONS_RECENT_ITEMS = 5
+
+# Notification IDs already announced, kept across restarts. An ID is forgotten
+# once Aula has not listed it for the maximum age, or to stay within the bound.
+NOTIFICATIONS_SEEN_MAX_IDS = 1000
+NOTIFICATIONS_SEEN_MAX_AGE = 2592000  # 30 days
+
+# Coordinator snapshots. Bump the storage version only for a change to the
+# store's own layout; each coordinator versions its serialized data itself.
+SNAPSHOT_STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 10  # seconds
+
+# Per-account request budget, in requests. The bucket covers a full startup
+# burst and then refills at a pace well below Aula's rate limit.
+REQUEST_BUDGET_CAPACITY = 40
+REQUEST_BUDGET_REFILL_RATE = 0.5  # requests per second
+
+# Longest a coordinator backs off after Aula rate-limits it or fails.
+BACKOFF_MAX_INTERVAL = 14400  # 4 hours
+
 # Latest-messages sensor shaping
 MAX_MESSAGE_ITEMS = 5
 MAX_PREVIEW_CHARS = 200
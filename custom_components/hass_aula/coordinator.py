@@ -3,9 +3,15 @@
 from __future__ import annotations
 
 import asyncio
+import hashlib
+import json
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
 from contextlib import asynccontextmanager
-from datetime import date, timedelta
-from typing import TYPE_CHECKING
+from dataclasses import asdict, dataclass, fields, is_dataclass, replace
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Any
 
 from aula import (
     AulaAuthenticationError,
@@ -15,14 +21,36 @@ from aula import (
     CalendarEvent,
     DailyOverview,
 )
-from aula.models import Message, MessageThread, MUTask, MUWeeklyPerson, Notification
+from aula.models import (
+    Appointment,
+    EasyIQHomework,
+    LibraryLoan,
+    Message,
+    MessageThread,
+    MUTask,
+    MUWeeklyPerson,
+    Notification,
+)
 from aula.models.meebook_weekplan import MeebookTask
+from aula.models.momo_huskeliste import AssignmentReminder, TeamReminder
+from aula.models.mu_weekly_letter import MUWeeklyLetter
+from aula.models.presence import PresenceState
+from homeassistant.core import callback
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.util import dt as dt_util
 
+from .backoff import AulaBackoff
 from .const import (
+    CALENDAR_BATCH_DELAY,
+    CALENDAR_FAR_REFRESH_INTERVAL,
+    CALENDAR_MID_DAYS,
+    CALENDAR_MID_REFRESH_INTERVAL,
+    CALENDAR_NEAR_DAYS,
     CALENDAR_POLL_INTERVAL,
+    CALENDAR_RANGE_CACHE_SIZE,
+    CALENDAR_RANGE_CACHE_TTL,
+    CALENDAR_WINDOW_DAYS,
     DOMAIN,
     EASYIQ_POLL_INTERVAL,
     EVENT_NOTIFICATION,
@@ -33,15 +61,33 @@ from .const import (
     MAX_PREVIEW_CHARS,
     MEEBOOK_POLL_INTERVAL,
     MESSAGES_POLL_INTERVAL,
+    MESSAGES_UNREAD_RECHECK_INTERVAL,
     MU_TASKS_POLL_INTERVAL,
     MU_UGEPLAN_POLL_INTERVAL,
+    NOTIFICATIONS_CATCH_UP_LIMIT,
+    NOTIFICATIONS_FULL_PAGE_SIZE,
+    NOTIFICATIONS_FULL_SYNC_INTERVAL,
+    NOTIFICATIONS_MAX_ITEMS,
+    NOTIFICATIONS_PAGE_SIZE,
     NOTIFICATIONS_POLL_INTERVAL,
+    NOTIFICATIONS_RECENT_ITEMS,
+    NOTIFICATIONS_SEEN_MAX_AGE,
+    NOTIFICATIONS_SEEN_MAX_IDS,
+    PRESENCE_BOUNDARY_POLL_INTERVAL,
+    PRESENCE_BOUNDARY_WINDOW,
+    PRESENCE_IDLE_POLL_INTERVAL,
+    PRESENCE_MIDDAY_POLL_INTERVAL,
+    PRESENCE_PLAN_DAYS,
     PRESENCE_POLL_INTERVAL,
     WIDGET_BIBLIOTEKET,
     WIDGET_EASYIQ_WEEKPLAN,
     WIDGET_MIN_UDDANNELSE_UGEPLAN,
+    WIDGET_NEXT_WEEK_TTL,
+    WIDGET_PREFETCH_WEEKDAY,
+    WIDGET_WEEK_CACHE_MARGIN,
 )
 from .data import (
+    ChildNotifications,
     EasyIQChildData,
     HuskelistenChildData,
     LibraryChildData,
@@ -49,16 +95,23 @@ from .data import (
     MessagesData,
     WidgetContext,
 )
+from .names import ChildNameIndex
+from .scheduler import RequestPriority
+from .timeline import EventTimeline
 
 if TYPE_CHECKING:
-    from collections.abc import AsyncIterator
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+    from logging import Logger
 
     from aula import AulaApiClient, Child, Profile
-    from aula.models.mu_weekly_letter import MUWeeklyLetter
+    from aula.models.meebook_weekplan import MeebookStudentPlan
     from aula.models.presence_template import PresenceWeekTemplate
     from homeassistant.core import HomeAssistant
 
     from .data import AulaConfigEntry
+    from .scheduler import AulaRequestScheduler
+    from .singleflight import AulaSingleFlight
+    from .store import AulaSnapshotStore
     from .token_manager import AulaTokenManager
 
 
@@ -106,6 +159,288 @@ def _get_child_institution_code(child: Child) -> str:
     return ""
 
 
+def _model_raw(model: Any) -> dict[str, Any] | None:
+    """Return the API dict an aula model was parsed from, if it kept one."""
+    raw = getattr(model, "_raw", None)
+    return raw if isinstance(raw, dict) else None
+
+
+def _dump_models(models: Iterable[Any]) -> list[dict[str, Any]]:
+    """Serialize aula models as the API dicts they were parsed from."""
+    return [raw for model in models if (raw := _model_raw(model)) is not None]
+
+
+def _load_models[M](model_cls: type[M], raws: list[dict[str, Any]]) -> list[M]:
+    """Rebuild aula models from the API dicts stored by _dump_models."""
+    return [model_cls.from_dict(raw) for raw in raws]  # type: ignore[attr-defined]
+
+
+def _dump_per_child[V](data: dict[int, V], dump: Callable[[V], Any]) -> dict[str, Any]:
+    """Serialize a per-child mapping; JSON object keys must be strings."""
+    return {str(child_id): dump(value) for child_id, value in data.items()}
+
+
+def _load_per_child[V](
+    payload: dict[str, Any], load: Callable[[Any], V]
+) -> dict[int, V]:
+    """Rebuild a per-child mapping stored by _dump_per_child."""
+    return {int(child_id): load(value) for child_id, value in payload.items()}
+
+
+def _changed_contexts(
+    old: dict[int | None, str | None] | None,
+    new: dict[int | None, str | None] | None,
+) -> set[int | None] | None:
+    """Return the listener contexts whose digest changed, or None if unknown."""
+    if old is None or new is None:
+        return None
+    return {
+        context
+        for context in old.keys() | new.keys()
+        if (digest := new.get(context)) is None or digest != old.get(context)
+    }
+
+
+def _digest_default(value: Any) -> Any:
+    """
+    Return what JSON-encodes a value for a digest, failing if nothing does.
+
+    A model stands in as its API dict; the integration's own dataclasses as
+    their fields, one level at a time.
+    """
+    if (raw := _model_raw(value)) is not None:
+        return raw
+    if is_dataclass(value) and not isinstance(value, type):
+        return {f.name: getattr(value, f.name) for f in fields(value)}
+    if isinstance(value, date):
+        return value.isoformat()
+    msg = f"{type(value).__name__} cannot be digested"
+    raise TypeError(msg)
+
+
+def _payload_digest(payload: Any) -> str | None:
+    """Return a digest of a response or data, or None if it cannot tell."""
+    try:
+        encoded = json.dumps(payload, sort_keys=True, default=_digest_default)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+class _AulaCoordinator[T](DataUpdateCoordinator[T], ABC):
+    """
+    Shared base for all Aula coordinators.
+
+    Subclasses fetch in ``_async_fetch_data`` and describe how their data is
+    snapshotted; the base keeps the snapshot store current after every good
+    poll, so the next setup can start from it instead of from Aula.
+
+    After each poll, only the listeners whose data changed are called back.
+    ``_fingerprint`` digests the data each listener context reads, keyed by
+    child ID for entities of one child; an entity registered without a
+    context is called back whenever anything changed.
+    """
+
+    config_entry: AulaConfigEntry
+
+    # Slot in the snapshot store. Bump snapshot_schema whenever the serialized
+    # shape changes, so an older snapshot is dropped instead of misread.
+    snapshot_key: str
+    snapshot_schema: int = 1
+    snapshot_store: AulaSnapshotStore | None = None
+
+    # When the current data was fetched from Aula, and whether it came from a
+    # snapshot rather than from this run.
+    data_updated_at: datetime | None = None
+    restored_from_snapshot: bool = False
+    # Bumped whenever data is replaced; entities memoize what they derive
+    # from the data until it moves on.
+    data_generation: int = 0
+
+    # The account's shared request budget, and this coordinator's place in it.
+    request_scheduler: AulaRequestScheduler | None = None
+    request_priority: RequestPriority = RequestPriority.CORE
+    # Shared with the account's other callers, so identical requests that
+    # overlap go to Aula once.
+    single_flight: AulaSingleFlight | None = None
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        *,
+        logger: Logger,
+        name: str,
+        update_interval: timedelta,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass, logger=logger, name=name, update_interval=update_interval
+        )
+        self.backoff = AulaBackoff()
+        # The regular interval, put back once Aula answers again.
+        self._interval_before_backoff: timedelta | None = None
+        self._fingerprints: dict[int | None, str | None] | None = None
+        # Listener contexts the last poll changed; None to call back all.
+        self._changed_contexts: set[int | None] | None = None
+        self.listener_stats: dict[str, int] = {"called": 0, "skipped": 0}
+        self.entity_cache_stats: dict[str, int] = {"hits": 0, "misses": 0}
+
+    async def _async_update_data(self) -> T:
+        """Fetch from Aula and snapshot the result."""
+        # Listeners of a coordinator that failed last time are all called
+        # back, since their entities become available again.
+        was_available = self.last_update_success
+        self._changed_contexts = None
+        cost = self._request_cost()
+        if (
+            self.request_scheduler is not None
+            and cost > 0
+            and not (
+                await self.request_scheduler.async_acquire(
+                    self.request_priority,
+                    cost,
+                    can_defer=self.data is not None,
+                )
+            )
+        ):
+            # Deferred: keep what we have and try again on the next poll.
+            if was_available:
+                self._changed_contexts = set()
+            return self.data
+        if self._interval_before_backoff is not None:
+            self.update_interval = self._interval_before_backoff
+        try:
+            data = await self._async_fetch_data()
+        except UpdateFailed as err:
+            if isinstance(err.__cause__, (AulaRateLimitError, AulaServerError)):
+                self._back_off()
+            raise
+        if self.backoff.active:
+            LOGGER.debug("%s recovered, resuming regular polling", self.name)
+            self.backoff.reset()
+        self._interval_before_backoff = None
+        self.data_updated_at = dt_util.utcnow()
+        self.restored_from_snapshot = False
+        self.data_generation += 1
+        fingerprints = self._fingerprint(data)
+        if was_available:
+            self._changed_contexts = _changed_contexts(self._fingerprints, fingerprints)
+        self._fingerprints = fingerprints
+        if self.snapshot_store is not None:
+            self.snapshot_store.async_set(
+                self.snapshot_key,
+                self.snapshot_schema,
+                self._dump_snapshot(data),
+            )
+        return data
+
+    @abstractmethod
+    async def _async_fetch_data(self) -> T:
+        """Fetch fresh data from Aula."""
+
+    def _request_cost(self) -> int:
+        """Return roughly how many requests one fetch makes."""
+        return 1
+
+    async def async_call_shared[**P, R](
+        self,
+        method: Callable[P, Awaitable[R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        """Call a client method, joining an identical call already in flight."""
+        if self.single_flight is None:
+            return await method(*args, **kwargs)
+        return await self.single_flight.async_call(method, *args, **kwargs)
+
+    def _fingerprint(self, data: T) -> dict[int | None, str | None] | None:
+        """
+        Return a digest of the data each listener context reads.
+
+        Data keyed by child ID is digested per child, anything else as a
+        whole. A None digest, or None for all of it, means the change cannot
+        be told and the listeners are called back regardless.
+        """
+        if isinstance(data, dict):
+            return {
+                child_id: _payload_digest(child_data)
+                for child_id, child_data in data.items()
+            }
+        return {None: _payload_digest(data)}
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Call back the listeners whose data the last poll changed."""
+        changed, self._changed_contexts = self._changed_contexts, None
+        listeners = list(self._listeners.values())
+        if changed is None or None in changed:
+            called = listeners
+        else:
+            called = [
+                (update_callback, context)
+                for update_callback, context in listeners
+                if context in changed or (context is None and changed)
+            ]
+        self.listener_stats["called"] += len(called)
+        self.listener_stats["skipped"] += len(listeners) - len(called)
+        for update_callback, _ in called:
+            update_callback()
+
+    def _back_off(self) -> None:
+        """Stretch the poll interval after Aula rate-limited us or failed."""
+        if self.update_interval is None:
+            return
+        if self._interval_before_backoff is None:
+            self._interval_before_backoff = self.update_interval
+        self.update_interval = self.backoff.next_delay(self._interval_before_backoff)
+        LOGGER.debug(
+            "%s backing off for %s after %d failure(s) in a row",
+            self.name,
+            self.update_interval,
+            self.backoff.failures,
+        )
+
+    @abstractmethod
+    def _dump_snapshot(self, data: T) -> Any:
+        """Serialize data for the snapshot store."""
+
+    @abstractmethod
+    def _load_snapshot(self, payload: Any) -> T:
+        """Rebuild data from a snapshot written by _dump_snapshot."""
+
+    @callback
+    def async_restore_snapshot(self, store: AulaSnapshotStore) -> bool:
+        """
+        Attach the snapshot store and take the last good data from it.
+
+        Returns False when there is nothing usable to restore, in which case
+        the coordinator still has to be refreshed from Aula before use.
+        """
+        self.snapshot_store = store
+        snapshot = store.async_get(self.snapshot_key, self.snapshot_schema)
+        if snapshot is None:
+            return False
+        payload, saved_at = snapshot
+        try:
+            data = self._load_snapshot(payload)
+        except (AttributeError, KeyError, TypeError, ValueError) as err:
+            LOGGER.debug("Discarding unreadable %s snapshot: %s", self.name, err)
+            return False
+        self.data = data
+        self.data_updated_at = saved_at
+        self.restored_from_snapshot = True
+        self.data_generation += 1
+        self._fingerprints = self._fingerprint(data)
+        return True
+
+    @property
+    def data_age(self) -> timedelta | None:
+        """Return how long ago the current data was fetched from Aula."""
+        if self.data_updated_at is None:
+            return None
+        return dt_util.utcnow() - self.data_updated_at
+
+
 class _PresenceChildData:
     """Presence data for a single child (overview + today's template)."""
 
@@ -123,11 +458,12 @@ class _PresenceChildData:
 
 
 class AulaPresenceCoordinator(
-    DataUpdateCoordinator[dict[int, _PresenceChildData]],
+    _AulaCoordinator[dict[int, _PresenceChildData]],
 ):
     """Coordinator for fetching presence data for all children."""
 
     config_entry: AulaConfigEntry
+    snapshot_key = "presence"
 
     def __init__(
         self,
@@ -146,25 +482,47 @@ class AulaPresenceCoordinator(
         self.client = client
         self.profile = profile
         self.token_manager = token_manager
+        # Planned check-in, check-out and self-decider times for the coming
+        # days, which set the poll rate.
+        self.plan_boundaries: list[datetime] = []
+
+    def _request_cost(self) -> int:
+        """Return one overview per child plus the templates."""
+        return len(self.profile.children) + 1
 
-    async def _async_update_data(self) -> dict[int, _PresenceChildData]:
-        """Fetch presence data and today's templates for all children."""
+    async def _async_fetch_data(self) -> dict[int, _PresenceChildData]:
+        """Fetch presence data and the coming days' templates for all children."""
         child_ids = [child.id for child in self.profile.children]
-        today = dt_util.now().date()
+        now = dt_util.now()
+        today = now.date()
 
         async with _aula_api_errors(self.token_manager):
             overview_results, templates = await asyncio.gather(
                 asyncio.gather(
-                    *(self.client.get_daily_overview(cid) for cid in child_ids)
+                    *(
+                        self.async_call_shared(self.client.get_daily_overview, cid)
+                        for cid in child_ids
+                    )
                 ),
-                self.client.get_presence_templates(
+                # The plan for the days ahead costs nothing extra and tells
+                # the scheduler when to wake up after a weekend or a holiday.
+                self.async_call_shared(
+                    self.client.get_presence_templates,
                     institution_profile_ids=child_ids,
                     from_date=today,
-                    to_date=today,
+                    to_date=today + timedelta(days=PRESENCE_PLAN_DAYS),
                 ),
             )
 
         self_decider_map = _extract_self_decider_times(templates, today)
+        self.plan_boundaries = _plan_boundaries(templates)
+        on_site = any(
+            overview is not None and overview.status in _ON_SITE_STATES
+            for overview in overview_results
+        )
+        self.update_interval = _presence_poll_interval(
+            now, self.plan_boundaries, on_site=on_site
+        )
 
         return {
             child.id: _PresenceChildData(
@@ -177,6 +535,117 @@ class AulaPresenceCoordinator(
             )
         }
 
+    def _fingerprint(
+        self, data: dict[int, _PresenceChildData]
+    ) -> dict[int | None, str | None]:
+        """Return a digest of each child's presence."""
+        return {
+            child_id: _payload_digest(
+                [
+                    child_data.overview,
+                    child_data.self_decider_start,
+                    child_data.self_decider_end,
+                ]
+            )
+            for child_id, child_data in data.items()
+        }
+
+    def _dump_snapshot(self, data: dict[int, _PresenceChildData]) -> Any:
+        """Serialize presence data for the snapshot store."""
+        return _dump_per_child(
+            data,
+            lambda child_data: {
+                "overview": _model_raw(child_data.overview),
+                "self_decider_start": child_data.self_decider_start,
+                "self_decider_end": child_data.self_decider_end,
+            },
+        )
+
+    def _load_snapshot(self, payload: Any) -> dict[int, _PresenceChildData]:
+        """Rebuild presence data from a snapshot."""
+        return _load_per_child(
+            payload,
+            lambda value: _PresenceChildData(
+                overview=DailyOverview.from_dict(value["overview"])
+                if value["overview"]
+                else None,
+                self_decider_start=value["self_decider_start"],
+                self_decider_end=value["self_decider_end"],
+            ),
+        )
+
+
+# Statuses in which a child is at the institution, so presence keeps polling at
+# the daytime rate even past the last planned time.
+_ON_SITE_STATES = frozenset(
+    {
+        PresenceState.PRESENT,
+        PresenceState.FIELDTRIP,
+        PresenceState.SLEEPING,
+        PresenceState.SPARE_TIME_ACTIVITY,
+        PresenceState.PHYSICAL_PLACEMENT,
+    }
+)
+
+
+def _plan_boundaries(templates: list[PresenceWeekTemplate]) -> list[datetime]:
+    """Collect the planned check-in, check-out and self-decider times, sorted."""
+    tz = dt_util.get_default_time_zone()
+    boundaries: list[datetime] = []
+    for week_tmpl in templates:
+        for day in week_tmpl.day_templates:
+            if day.is_on_vacation or not day.by_date:
+                continue
+            day_date = dt_util.parse_date(day.by_date[:10])
+            if day_date is None:
+                continue
+            sta = day.spare_time_activity
+            for value in (
+                day.entry_time,
+                day.exit_time,
+                sta.start_time if sta else None,
+                sta.end_time if sta else None,
+            ):
+                planned = dt_util.parse_time(value) if value else None
+                if planned is not None:
+                    boundaries.append(datetime.combine(day_date, planned, tz))
+    return sorted(boundaries)
+
+
+def _presence_poll_interval(
+    now: datetime,
+    boundaries: list[datetime],
+    *,
+    on_site: bool,
+) -> timedelta:
+    """
+    Return how long to wait before the next presence poll.
+
+    Polls fast within PRESENCE_BOUNDARY_WINDOW of a planned time, at the midday
+    rate between the day's planned times (or while a child is on site), and
+    otherwise sleeps until the next planned window opens, capped at the idle
+    ceiling. With no plan at all, the fixed PRESENCE_POLL_INTERVAL applies.
+    """
+    if not boundaries:
+        return timedelta(seconds=PRESENCE_POLL_INTERVAL)
+
+    window = timedelta(seconds=PRESENCE_BOUNDARY_WINDOW)
+    fast = timedelta(seconds=PRESENCE_BOUNDARY_POLL_INTERVAL)
+    upcoming = [b for b in boundaries if b >= now - window]
+    if any(abs(b - now) <= window for b in upcoming):
+        return fast
+
+    today = [b for b in boundaries if b.date() == now.date()]
+    in_hours = on_site or bool(today and today[0] - window <= now <= today[-1])
+    ceiling = timedelta(
+        seconds=PRESENCE_MIDDAY_POLL_INTERVAL
+        if in_hours
+        else PRESENCE_IDLE_POLL_INTERVAL
+    )
+    if not upcoming:
+        return ceiling
+    return max(fast, min(ceiling, upcoming[0] - window - now))
+
 
 def _extract_self_decider_times(
     templates: list[PresenceWeekTemplate],
@@ -198,12 +667,45 @@ def _extract_self_decider_times(
     return result
 
 
+class _CalendarBucket:
+    """Calendar events fetched together, and when they were fetched."""
+
+    __slots__ = ("events", "fetched_at")
+
+    def __init__(self, fetched_at: datetime, events: list[CalendarEvent]) -> None:
+        self.fetched_at = fetched_at
+        self.events = events
+
+
+def _calendar_day_max_age(offset: int) -> timedelta:
+    """Return how long a day's bucket stays fresh, by its distance from today."""
+    if offset < CALENDAR_NEAR_DAYS:
+        return timedelta(0)
+    if offset < CALENDAR_MID_DAYS:
+        return timedelta(seconds=CALENDAR_MID_REFRESH_INTERVAL)
+    return timedelta(seconds=CALENDAR_FAR_REFRESH_INTERVAL)
+
+
+def _day_runs(days: list[date]) -> list[tuple[date, date]]:
+    """Group sorted days into (first, last) runs of consecutive days."""
+    runs: list[tuple[date, date]] = []
+    for day in days:
+        if runs and day - runs[-1][1] == timedelta(days=1):
+            runs[-1] = (runs[-1][0], day)
+        else:
+            runs.append((day, day))
+    return runs
+
+
 class AulaCalendarCoordinator(
-    DataUpdateCoordinator[dict[int, list[CalendarEvent]]],
+    _AulaCoordinator[dict[int, list[CalendarEvent]]],
 ):
     """Coordinator for fetching calendar events for all children."""
 
     config_entry: AulaConfigEntry
+    snapshot_key = "calendar"
+    # 2: day buckets instead of events per child.
+    snapshot_schema = 2
 
     def __init__(
         self,
@@ -222,36 +724,322 @@ class AulaCalendarCoordinator(
         self.client = client
         self.profile = profile
         self.token_manager = token_manager
-
-    async def _async_update_data(self) -> dict[int, list[CalendarEvent]]:
-        """Fetch calendar events for all children."""
+        # Events of every child by the local day they start on, with when
+        # each day was last fetched.
+        self._days: dict[date, _CalendarBucket] = {}
+        # Ranges outside the window that calendar views asked for, per child,
+        # least recently used first.
+        self._ranges: OrderedDict[tuple[int, datetime, datetime], _CalendarBucket] = (
+            OrderedDict()
+        )
+        # Range requests collecting children before they go out together.
+        self._pending_ranges: dict[
+            tuple[datetime, datetime],
+            tuple[set[int], asyncio.Future[list[CalendarEvent]]],
+        ] = {}
+        # Each child's timeline, and the data generation it was built from.
+        self._timelines: dict[int, EventTimeline] = {}
+        self._timelines_generation: int | None = None
+
+    async def _async_fetch_data(self) -> dict[int, list[CalendarEvent]]:
+        """Refetch the stale days of the calendar window for all children."""
+        now = dt_util.now()
+        today = now.date()
+        window = [today + timedelta(days=n) for n in range(CALENDAR_WINDOW_DAYS)]
+        # Past days fall out; the day that rolls into the window has no
+        # bucket yet, so it is fetched like any other stale day.
+        self._days = {day: bucket for day, bucket in self._days.items() if day >= today}
+        stale = [
+            day
+            for offset, day in enumerate(window)
+            if day not in self._days
+            or now - self._days[day].fetched_at >= _calendar_day_max_age(offset)
+        ]
+
+        all_child_ids = [child.id for child in self.profile.children]
         async with _aula_api_errors(self.token_manager):
-            now = dt_util.now()
-            start = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            end = start + timedelta(days=30)
+            for first, last in _day_runs(stale):
+                events = await self.async_call_shared(
+                    self.client.get_calendar_events,
+                    institution_profile_ids=all_child_ids,
+                    start=dt_util.start_of_local_day(first),
+                    end=dt_util.start_of_local_day(last + timedelta(days=1)),
+                )
+                self._store_days(first, last, events, now)
+
+        return self._events_per_child(window)
+
+    def _store_days(
+        self,
+        first: date,
+        last: date,
+        events: list[CalendarEvent],
+        fetched_at: datetime,
+    ) -> None:
+        """Replace the buckets of one fetched run of days."""
+        buckets: dict[date, list[CalendarEvent]] = {}
+        day = first
+        while day <= last:
+            buckets[day] = []
+            day += timedelta(days=1)
+        for event in events:
+            # Events already running when the run starts belong to its first day.
+            start_day = max(dt_util.as_local(event.start_datetime).date(), first)
+            if start_day in buckets:
+                buckets[start_day].append(event)
+        for day, day_events in buckets.items():
+            self._days[day] = _CalendarBucket(fetched_at, day_events)
+
+    async def async_get_events(
+        self, child_id: int, start: datetime, end: datetime
+    ) -> list[CalendarEvent]:
+        """
+        Return one child's events overlapping a range, sorted by start.
+
+        Days inside the synced window are answered from memory. Only the days
+        outside it are fetched, one request per run of days, and kept for a
+        while so reopening the same view is free.
+        """
+        events: dict[tuple[int, datetime], CalendarEvent] = {}
+        for bucket in self._days.values():
+            for event in bucket.events:
+                if event.belongs_to == child_id:
+                    events[(event.id, event.start_datetime)] = event
+
+        first_day = dt_util.as_local(start).date()
+        last_day = dt_util.as_local(end - timedelta(microseconds=1)).date()
+        missing: list[date] = []
+        day = first_day
+        while day <= last_day:
+            if day not in self._days:
+                missing.append(day)
+            day += timedelta(days=1)
+
+        for first, last in _day_runs(missing):
+            fetched = await self._async_get_range(
+                child_id,
+                dt_util.start_of_local_day(first),
+                dt_util.start_of_local_day(last + timedelta(days=1)),
+            )
+            for event in fetched:
+                events.setdefault((event.id, event.start_datetime), event)
+
+        return sorted(
+            (
+                e
+                for e in events.values()
+                if e.start_datetime < end and e.end_datetime > start
+            ),
+            key=lambda e: e.start_datetime,
+        )
+
+    async def _async_get_range(
+        self, child_id: int, start: datetime, end: datetime
+    ) -> list[CalendarEvent]:
+        """Fetch one child's events for a range outside the window, via the cache."""
+        key = (child_id, start, end)
+        cached = self._ranges.get(key)
+        now = dt_util.utcnow()
+        if cached is not None and now - cached.fetched_at < timedelta(
+            seconds=CALENDAR_RANGE_CACHE_TTL
+        ):
+            self._ranges.move_to_end(key)
+            return cached.events
+
+        try:
+            events = await self._async_fetch_range(child_id, start, end)
+        except (
+            AulaAuthenticationError,
+            AulaConnectionError,
+            AulaServerError,
+            AulaRateLimitError,
+        ) as err:
+            if cached is not None:
+                LOGGER.debug("Serving stale calendar events after error: %s", err)
+                return cached.events
+            LOGGER.warning(
+                "Could not fetch calendar events from %s to %s: %s", start, end, err
+            )
+            return []
+
+        self._ranges[key] = _CalendarBucket(now, events)
+        self._ranges.move_to_end(key)
+        while len(self._ranges) > CALENDAR_RANGE_CACHE_SIZE:
+            self._ranges.popitem(last=False)
+        return events
 
-            all_child_ids = [child.id for child in self.profile.children]
-            events = await self.client.get_calendar_events(
-                institution_profile_ids=all_child_ids,
+    async def _async_fetch_range(
+        self, child_id: int, start: datetime, end: datetime
+    ) -> list[CalendarEvent]:
+        """
+        Fetch one child's events for a range, batched with their siblings'.
+
+        Calendar cards ask per child, all at once. Requests for the same range
+        that arrive within a short delay go out as one multi-child request,
+        whose events are then split by the child they belong to.
+        """
+        pending = self._pending_ranges.get((start, end))
+        if pending is None:
+            pending = (set(), self.hass.loop.create_future())
+            self._pending_ranges[(start, end)] = pending
+            self.config_entry.async_create_background_task(
+                self.hass,
+                self._async_flush_range(start, end),
+                "Aula calendar range fetch",
+            )
+        child_ids, future = pending
+        child_ids.add(child_id)
+        events = await asyncio.shield(future)
+        return [event for event in events if event.belongs_to == child_id]
+
+    async def _async_flush_range(self, start: datetime, end: datetime) -> None:
+        """Send the batched request for one range to Aula."""
+        key = (start, end)
+        child_ids, future = batch = self._pending_ranges[key]
+        try:
+            await asyncio.sleep(CALENDAR_BATCH_DELAY)
+            # Lookups from here on start a batch of their own.
+            del self._pending_ranges[key]
+            events = await self.async_call_shared(
+                self.client.get_calendar_events,
+                institution_profile_ids=sorted(child_ids),
                 start=start,
                 end=end,
             )
-
-            result: dict[int, list[CalendarEvent]] = {
-                child.id: [] for child in self.profile.children
-            }
-            for event in events:
+        except Exception as err:  # noqa: BLE001 - handed to every waiting child
+            future.set_exception(err)
+        else:
+            future.set_result(events)
+        finally:
+            if self._pending_ranges.get(key) is batch:
+                del self._pending_ranges[key]
+            # Cancelled by unload or shutdown: release the waiting lookups.
+            if not future.done():
+                future.cancel()
+
+    def timeline(self, child_id: int) -> EventTimeline:
+        """Return a child's events in the window, built once per data generation."""
+        if self._timelines_generation != self.data_generation:
+            self._timelines = {}
+            self._timelines_generation = self.data_generation
+        timeline = self._timelines.get(child_id)
+        if timeline is None:
+            events = (self.data or {}).get(child_id, [])
+            timeline = self._timelines[child_id] = EventTimeline(events)
+        return timeline
+
+    def _events_per_child(self, days: Iterable[date]) -> dict[int, list[CalendarEvent]]:
+        """Distribute the events of the given day buckets to the children."""
+        result: dict[int, list[CalendarEvent]] = {
+            child.id: [] for child in self.profile.children
+        }
+        # An event spanning several days can sit in more than one bucket.
+        seen: set[tuple[int, datetime]] = set()
+        for day in days:
+            for event in self._days[day].events:
+                key = (event.id, event.start_datetime)
+                if key in seen:
+                    continue
+                seen.add(key)
                 if event.belongs_to is not None and event.belongs_to in result:
                     result[event.belongs_to].append(event)
-            return result
+        return result
+
+    def _dump_snapshot(self, data: dict[int, list[CalendarEvent]]) -> Any:  # noqa: ARG002
+        """Serialize the day buckets for the snapshot store."""
+        return {
+            day.isoformat(): {
+                "fetched_at": bucket.fetched_at.isoformat(),
+                "events": _dump_models(bucket.events),
+            }
+            for day, bucket in self._days.items()
+        }
+
+    def _load_snapshot(self, payload: Any) -> dict[int, list[CalendarEvent]]:
+        """Rebuild the day buckets, and the events per child, from a snapshot."""
+        days: dict[date, _CalendarBucket] = {}
+        for day, bucket in payload.items():
+            fetched_at = dt_util.parse_datetime(bucket["fetched_at"])
+            if fetched_at is None:
+                msg = f"Invalid fetch time for {day}"
+                raise ValueError(msg)
+            days[date.fromisoformat(day)] = _CalendarBucket(
+                fetched_at, _load_models(CalendarEvent, bucket["events"])
+            )
+        self._days = days
+        return self._events_per_child(sorted(days))
+
+
+# The announced-ID index lives in its own slot: unlike the notifications
+# themselves it is written on every poll and must load even without them.
+_SEEN_IDS_SLOT = "notifications_seen"
+_SEEN_IDS_SCHEMA = 1
+
+
+class _SeenIds:
+    """
+    Notification IDs already announced, with when each was last listed.
+
+    An ID is dropped once Aula has not listed it for a while, or when the
+    index outgrows its bound, oldest listing first. IDs still being listed
+    are never dropped, so no listed notification is announced twice.
+    """
+
+    __slots__ = ("_last_listed",)
+
+    def __init__(self, last_listed: dict[str, float] | None = None) -> None:
+        # Kept in order of last listing, oldest first.
+        self._last_listed = dict(
+            sorted((last_listed or {}).items(), key=lambda item: item[1])
+        )
+
+    def __contains__(self, notification_id: object) -> bool:
+        return notification_id in self._last_listed
+
+    def __len__(self) -> int:
+        return len(self._last_listed)
+
+    def mark(self, notification_ids: Iterable[str], now: float) -> None:
+        """Record IDs as listed now, then evict what has aged or overflowed."""
+        for notification_id in notification_ids:
+            self._last_listed.pop(notification_id, None)
+            self._last_listed[notification_id] = now
+        cutoff = now - NOTIFICATIONS_SEEN_MAX_AGE
+        while self._last_listed and (
+            len(self._last_listed) > NOTIFICATIONS_SEEN_MAX_IDS
+            or next(iter(self._last_listed.values())) < cutoff
+        ):
+            del self._last_listed[next(iter(self._last_listed))]
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the index for the snapshot store."""
+        return dict(self._last_listed)
+
+
+def _index_notifications(
+    notifications: list[Notification],
+) -> dict[int | None, ChildNotifications]:
+    """Group notifications by child, counting them by type as they go."""
+    index: dict[int | None, ChildNotifications] = {}
+    for notification in notifications:
+        child = index.get(notification.institution_profile_id)
+        if child is None:
+            child = index[notification.institution_profile_id] = ChildNotifications()
+        child.count += 1
+        event_type = notification.event_type or "unknown"
+        child.by_type[event_type] = child.by_type.get(event_type, 0) + 1
+        if len(child.recent) < NOTIFICATIONS_RECENT_ITEMS:
+            child.recent.append(notification)
+    return index
 
 
 class AulaNotificationsCoordinator(
-    DataUpdateCoordinator[list[Notification]],
+    _AulaCoordinator[list[Notification]],
 ):
     """Coordinator for fetching notifications for the active profile."""
 
     config_entry: AulaConfigEntry
+    snapshot_key = "notifications"
 
     def __init__(
         self,
@@ -268,21 +1056,59 @@ class AulaNotificationsCoordinator(
         )
         self.client = client
         self.token_manager = token_manager
-        self._known_ids: set[str] | None = None
-
-    async def _async_update_data(self) -> list[Notification]:
-        """Fetch notifications for the active profile."""
+        # Kept in the snapshot store, so notifications that arrive while Home
+        # Assistant is down are still announced once it is back.
+        self._known_ids: _SeenIds | None = None
+        # When the whole list was last fetched, rather than only its new top.
+        self._full_synced_at: float | None = None
+        # What the last poll cost, for diagnostics.
+        self.fetch_stats: dict[str, Any] = {}
+        self._bytes_total = 0
+        # Each child's notifications, and the data generation they index.
+        self._by_child: dict[int | None, ChildNotifications] = {}
+        self._by_child_generation: int | None = None
+
+    async def _async_fetch_data(self) -> list[Notification]:
+        """Fetch the notifications that are new since the last poll."""
+        now = time.time()
+        full = (
+            self._full_synced_at is None
+            or now - self._full_synced_at >= NOTIFICATIONS_FULL_SYNC_INTERVAL
+        )
         async with _aula_api_errors(self.token_manager):
-            notifications = await self.client.get_notifications_for_active_profile(
-                limit=50
+            fetched, pages, size = await self._async_fetch_new(full=full)
+
+        if full:
+            notifications = fetched
+            self._full_synced_at = now
+        else:
+            # The fetched top of the list replaces everything down to its last
+            # item, so notifications read since the last poll drop out there.
+            # Below it, the list is carried over until the next full sync.
+            held = self.data or []
+            tail_at = next(
+                (i for i, n in enumerate(held) if fetched and n.id == fetched[-1].id),
+                None,
             )
+            notifications = fetched
+            if tail_at is not None:
+                notifications = fetched + held[tail_at + 1 :]
+        notifications = notifications[:NOTIFICATIONS_MAX_ITEMS]
+
+        self._bytes_total += size
+        self.fetch_stats = {
+            "full_sync": full,
+            "pages": pages,
+            "items": len(fetched),
+            "bytes": size,
+            "bytes_total": self._bytes_total,
+        }
 
-        new_ids = {n.id for n in notifications}
         if self._known_ids is None:
-            # First fetch — populate without firing events
-            self._known_ids = new_ids
+            # Very first fetch for this entry — populate without firing events
+            self._known_ids = _SeenIds()
         else:
-            for n in notifications:
+            for n in fetched:
                 if n.id not in self._known_ids:
                     self.hass.bus.async_fire(
                         EVENT_NOTIFICATION,
@@ -295,10 +1121,147 @@ class AulaNotificationsCoordinator(
                             "created_at": n.created_at,
                         },
                     )
-            self._known_ids = new_ids
+        self._known_ids.mark((n.id for n in fetched), now)
+        if self.snapshot_store is not None:
+            self.snapshot_store.async_set(
+                _SEEN_IDS_SLOT, _SEEN_IDS_SCHEMA, self._known_ids.as_dict()
+            )
 
         return notifications
 
+    async def _async_fetch_new(
+        self, *, full: bool
+    ) -> tuple[list[Notification], int, int]:
+        """
+        Page through the list from the top until reaching a seen notification.
+
+        Returns the notifications fetched, newest first, with the number of
+        pages and the approximate payload size it took. A steady-state poll is
+        one small page. After downtime, the following pages draw on the
+        account's request budget like any other request, which throttles a
+        long catch-up instead of sending it in one burst.
+        """
+        page_size = NOTIFICATIONS_FULL_PAGE_SIZE if full else NOTIFICATIONS_PAGE_SIZE
+        fetched: list[Notification] = []
+        fetched_ids: set[str] = set()
+        pages = size = 0
+        while True:
+            if pages and self.request_scheduler is not None:
+                await self.request_scheduler.async_acquire(self.request_priority)
+            page = await self.client.get_notifications_for_active_profile(
+                offset=len(fetched), limit=page_size
+            )
+            pages += 1
+            size += sum(len(json.dumps(_model_raw(n) or {})) for n in page)
+            new = [n for n in page if n.id not in fetched_ids]
+            fetched.extend(new)
+            fetched_ids.update(n.id for n in new)
+            if (
+                self._known_ids is None
+                or any(n.id in self._known_ids for n in page)
+                or len(page) < page_size
+                or not new
+                or len(fetched) >= NOTIFICATIONS_CATCH_UP_LIMIT
+            ):
+                return fetched, pages, size
+            page_size = NOTIFICATIONS_FULL_PAGE_SIZE
+
+    @callback
+    def async_restore_snapshot(self, store: AulaSnapshotStore) -> bool:
+        """Take the announced IDs from the store along with the last data."""
+        seen = store.async_get(_SEEN_IDS_SLOT, _SEEN_IDS_SCHEMA)
+        if seen is not None and isinstance(seen[0], dict):
+            self._known_ids = _SeenIds(seen[0])
+        return super().async_restore_snapshot(store)
+
+    def child_notifications(self, child_id: int) -> ChildNotifications:
+        """
+        Return a child's notifications.
+
+        All children are indexed in one pass over the list, once per data
+        generation, so each child's sensor reads its share without scanning.
+        """
+        if self._by_child_generation != self.data_generation:
+            self._by_child = _index_notifications(self.data or [])
+            self._by_child_generation = self.data_generation
+        return self._by_child.get(child_id) or ChildNotifications()
+
+    def _fingerprint(self, data: list[Notification]) -> dict[int | None, str | None]:
+        """Return a digest of each child's notifications."""
+        per_child: dict[int | None, list[Notification]] = {}
+        for notification in data:
+            per_child.setdefault(notification.institution_profile_id, []).append(
+                notification
+            )
+        return {
+            child_id: _payload_digest(notifications)
+            for child_id, notifications in per_child.items()
+        }
+
+    def _dump_snapshot(self, data: list[Notification]) -> Any:
+        """Serialize notifications for the snapshot store."""
+        return _dump_models(data)
+
+    def _load_snapshot(self, payload: Any) -> list[Notification]:
+        """Rebuild notifications from a snapshot."""
+        return _load_models(Notification, payload)
+
+
+def _thread_read_flags(threads: list[MessageThread]) -> dict[str, bool] | None:
+    """Return each thread's read flag, or None unless every thread has one."""
+    # TODO(aula-package): MessageThread does not expose the read flag as a  # noqa: TD003, FIX002
+    # public field. Add it to the aula package, then replace this _raw access.
+    flags: dict[str, bool] = {}
+    for thread in threads:
+        read = (thread._raw or {}).get("read")  # noqa: SLF001
+        if not isinstance(read, bool):
+            return None
+        flags[thread.thread_id] = read
+    return flags
+
+
+def _thread_marker(thread: MessageThread) -> str | None:
+    """Return what changes about a thread whenever a message is added to it."""
+    # TODO(aula-package): MessageThread does not expose lastUpdatedDate as a  # noqa: TD003, FIX002
+    # public field. Add it to the aula package, then replace this _raw access.
+    return (thread._raw or {}).get("lastUpdatedDate")  # noqa: SLF001
+
+
+def _listing_digest(threads: list[MessageThread]) -> str | None:
+    """
+    Digest what a new message or a changed read flag changes in a listing.
+
+    None when a thread carries no last-updated marker, as then a new message
+    could go unnoticed.
+    """
+    entries: list[tuple[str, str, Any]] = []
+    for thread in threads:
+        marker = _thread_marker(thread)
+        if marker is None:
+            return None
+        read = (thread._raw or {}).get("read")  # noqa: SLF001
+        entries.append((thread.thread_id, marker, read))
+    return _payload_digest(entries)
+
+
+@dataclass(frozen=True, slots=True)
+class _UnreadListing:
+    """The unread listing as last fetched, and how to tell it still holds."""
+
+    thread_ids: frozenset[str]
+    count: int
+    # Digest of the thread listing fetched with it. While the thread listing
+    # digests the same, no thread has had a new message since.
+    listing_digest: str | None
+    # Whether the thread listing's read flags named the same unread threads.
+    flags_agree: bool
+    fetched_at: datetime
+
+    @property
+    def reusable(self) -> bool:
+        """Return whether a thread listing alone may answer for it later."""
+        return self.flags_agree or self.listing_digest is not None
+
 
 def _message_preview(
     thread: MessageThread,
@@ -336,11 +1299,12 @@ def _message_preview(
 
 
 class AulaMessagesCoordinator(
-    DataUpdateCoordinator[MessagesData],
+    _AulaCoordinator[MessagesData],
 ):
     """Coordinator for fetching the latest message threads for the active profile."""
 
     config_entry: AulaConfigEntry
+    snapshot_key = "messages"
 
     def __init__(
         self,
@@ -357,37 +1321,218 @@ class AulaMessagesCoordinator(
         )
         self.client = client
         self.token_manager = token_manager
+        # The preview built for each listed thread, with the thread's
+        # last-updated marker at the time. While the marker holds, the
+        # thread has no new message and its preview is reused as is.
+        self._previews: dict[str, tuple[str, MessagePreview]] = {}
+        # Shown threads whose preview the last poll had to fetch; the next
+        # poll is expected to miss about as many.
+        self._preview_misses = MAX_MESSAGE_ITEMS
+        # The unread listing last fetched, kept to answer later polls whose
+        # thread listing shows no change.
+        self._unread: _UnreadListing | None = None
+        # Whether the next poll tries the thread listing alone. After it
+        # failed to answer, the next poll asks both listings at once.
+        self._try_listing_alone = True
+
+    def _request_cost(self) -> int:
+        """Return the thread listings plus the previews expected to miss."""
+        listings = 1 if self._listing_may_answer(dt_util.utcnow()) else 2
+        return listings + self._preview_misses
+
+    def _listing_may_answer(self, now: datetime) -> bool:
+        """Return whether a poll now tries the thread listing alone."""
+        unread = self._unread
+        return (
+            self._try_listing_alone
+            and unread is not None
+            and unread.reusable
+            and now - unread.fetched_at
+            < timedelta(seconds=MESSAGES_UNREAD_RECHECK_INTERVAL)
+        )
 
-    async def _async_update_data(self) -> MessagesData:
-        """Fetch the latest threads plus the newest message in each."""
+    async def _async_fetch_data(self) -> MessagesData:
+        """Fetch the latest threads plus the newest message in each changed one."""
         async with _aula_api_errors(self.token_manager):
-            threads = await self.client.get_message_threads()
-            unread_threads = await self.client.get_message_threads(filter_on="unread")
+            threads, unread_ids, unread_count = await self._async_fetch_threads()
             latest = threads[:MAX_MESSAGE_ITEMS]
+            changed = [
+                thread for thread in latest if self._cached_preview(thread) is None
+            ]
+            self._preview_misses = len(changed)
             # A single unreadable thread must not fail the whole update. An auth
-            # problem would already have surfaced on the two calls above.
+            # problem would already have surfaced on the listings above.
             thread_messages = await asyncio.gather(
                 *(
-                    self.client.get_messages_for_thread(thread.thread_id, limit=1)
-                    for thread in latest
+                    self.async_call_shared(
+                        self.client.get_messages_for_thread, thread.thread_id, limit=1
+                    )
+                    for thread in changed
                 ),
                 return_exceptions=True,
             )
 
+        fetched = dict(
+            zip((thread.thread_id for thread in changed), thread_messages, strict=True)
+        )
+        previews: dict[str, tuple[str, MessagePreview]] = {}
+        messages: list[MessagePreview] = []
+        for thread in latest:
+            marker = _thread_marker(thread)
+            cached = self._cached_preview(thread)
+            if cached is not None:
+                preview = replace(
+                    cached,
+                    subject=thread.subject,
+                    unread=thread.thread_id in unread_ids,
+                )
+            else:
+                result = fetched[thread.thread_id]
+                preview = _message_preview(thread, result, unread_ids)
+                if isinstance(result, BaseException):
+                    marker = None
+            if marker is not None:
+                previews[thread.thread_id] = (marker, preview)
+            messages.append(preview)
+        # Threads that dropped off the list are forgotten.
+        self._previews = previews
+
+        return MessagesData(unread_count=unread_count, messages=messages)
+
+    async def _async_fetch_threads(
+        self,
+    ) -> tuple[list[MessageThread], set[str], int]:
+        """
+        List the threads and tell which are unread, and how many in total.
+
+        The unread listing is skipped while the thread listing can answer for
+        it: when its read flags named the same unread threads as the unread
+        listing last did, or when no thread has a new message, or a changed
+        read flag, since that listing. A thread only turns unread otherwise by
+        being marked so by hand, and is only read elsewhere without a change
+        to the listing when it carries no read flag; the unread listing is
+        fetched again at least every recheck interval to catch both.
+        """
+        now = dt_util.utcnow()
+        if self._listing_may_answer(now):
+            threads = await self.async_call_shared(self.client.get_message_threads)
+            answer = self._unread_from_listing(threads)
+            if answer is not None:
+                return threads, *answer
+            # The inbox is moving; ask both listings at once next time.
+            self._try_listing_alone = False
+            unread_threads = await self.async_call_shared(
+                self.client.get_message_threads, filter_on="unread"
+            )
+        else:
+            threads, unread_threads = await asyncio.gather(
+                self.async_call_shared(self.client.get_message_threads),
+                self.async_call_shared(
+                    self.client.get_message_threads, filter_on="unread"
+                ),
+            )
+            self._try_listing_alone = True
+
         unread_ids = {thread.thread_id for thread in unread_threads}
-        return MessagesData(
-            unread_count=len(unread_threads),
-            messages=[
-                _message_preview(thread, messages, unread_ids)
-                for thread, messages in zip(latest, thread_messages, strict=True)
-            ],
+        read_flags = _thread_read_flags(threads)
+        self._unread = _UnreadListing(
+            thread_ids=frozenset(unread_ids),
+            count=len(unread_threads),
+            listing_digest=_listing_digest(threads),
+            flags_agree=read_flags is not None
+            and {tid for tid, read in read_flags.items() if not read} == unread_ids,
+            fetched_at=now,
         )
+        return threads, unread_ids, len(unread_threads)
+
+    def _unread_from_listing(
+        self, threads: list[MessageThread]
+    ) -> tuple[set[str], int] | None:
+        """Return the unread threads and count the thread listing answers for."""
+        unread = self._unread
+        if unread is None:
+            return None
+        read_flags = _thread_read_flags(threads)
+        # A page of nothing but unread threads may continue past the page.
+        if unread.flags_agree and read_flags is not None and any(read_flags.values()):
+            unread_ids = {tid for tid, read in read_flags.items() if not read}
+            return unread_ids, len(unread_ids)
+        digest = unread.listing_digest
+        if digest is not None and _listing_digest(threads) == digest:
+            return set(unread.thread_ids), unread.count
+        return None
+
+    def _cached_preview(self, thread: MessageThread) -> MessagePreview | None:
+        """Return the cached preview of a thread, unless it has changed since."""
+        cached = self._previews.get(thread.thread_id)
+        marker = _thread_marker(thread)
+        if cached is None or marker is None or cached[0] != marker:
+            return None
+        return cached[1]
+
+    def _dump_snapshot(self, data: MessagesData) -> Any:
+        """Serialize inbox data, and the marker behind each preview, for the store."""
+        return {
+            **asdict(data),
+            "markers": {
+                thread_id: marker for thread_id, (marker, _) in self._previews.items()
+            },
+        }
+
+    def _load_snapshot(self, payload: Any) -> MessagesData:
+        """Rebuild inbox data, and the preview cache, from a snapshot."""
+        data = MessagesData(
+            unread_count=payload["unread_count"],
+            messages=[MessagePreview(**message) for message in payload["messages"]],
+        )
+        markers: dict[str, str] = payload.get("markers", {})
+        self._previews = {
+            message.thread_id: (markers[message.thread_id], message)
+            for message in data.messages
+            if message.thread_id in markers
+        }
+        self._preview_misses = MAX_MESSAGE_ITEMS - len(self._previews)
+        return data
+
+
+def _iso_week(moment: datetime) -> str:
+    """Return the ISO week a moment falls in, as widgets take it: 2026-W33."""
+    return moment.strftime("%G-W%V")
+
+
+@dataclass(frozen=True, slots=True)
+class _WeekCachePolicy:
+    """How a widget coordinator caches what it fetches for each ISO week."""
 
+    # Seconds the current week's response is reused; the poll interval means
+    # the current week is fetched on every poll.
+    ttl: float
+    # Seconds a later week's response is reused.
+    next_week_ttl: float = WIDGET_NEXT_WEEK_TTL
+    # Weekday (Monday is 0) from which next week is fetched alongside the
+    # current one, for widgets that only show the current week. None for never.
+    prefetch_weekday: int | None = WIDGET_PREFETCH_WEEKDAY
 
-class _AulaWidgetCoordinator[T](DataUpdateCoordinator[T]):
+
+class _WeekEntry:
+    """One week's distributed data, its response digest and its expiry."""
+
+    __slots__ = ("digest", "expires_at", "value")
+
+    def __init__(self, digest: str | None, expires_at: datetime, value: Any) -> None:
+        self.digest = digest
+        self.expires_at = expires_at
+        self.value = value
+
+
+class _AulaWidgetCoordinator[T](_AulaCoordinator[T]):
     """Shared base for all widget coordinators."""
 
     config_entry: AulaConfigEntry
+    request_priority = RequestPriority.BACKGROUND
+    # Unique ID suffixes of the sensors this coordinator feeds, one sensor
+    # per child and suffix: "<child id>_<suffix>".
+    entity_keys: tuple[str, ...] = ()
 
     def __init__(  # noqa: PLR0913
         self,
@@ -411,21 +1556,127 @@ class _AulaWidgetCoordinator[T](DataUpdateCoordinator[T]):
         self.profile = profile
         self.widget_context = widget_context
         self.token_manager = token_manager
-        # Pre-build name lookup for child matching
-        self._child_by_name: dict[str, Child] = {
-            child.name: child for child in profile.children
-        }
+        self.child_index = ChildNameIndex(profile.children)
 
     def _match_child(self, name: str) -> Child | None:
-        """Match a name string to a child, with partial-match fallback."""
-        child = self._child_by_name.get(name)
-        if child:
-            return child
-        # Fallback: partial match
-        for child_name, child in self._child_by_name.items():
-            if child_name in name or name in child_name:
-                return child
-        return None
+        """Match a name string to a child; see ChildNameIndex."""
+        return self.child_index.match(name)
+
+
+class _AulaWeeklyWidgetCoordinator[T](_AulaWidgetCoordinator[T]):
+    """
+    Shared base for widget coordinators that fetch by ISO week.
+
+    Subclasses declare a week_cache_policy and implement _async_fetch_week
+    and _distribute_week; _async_get_weeks then serves each week from the
+    cache until its TTL runs out. A refetched response whose content is
+    unchanged keeps the data distributed from it last time.
+    """
+
+    week_cache_policy: _WeekCachePolicy
+
+    def __init__(  # noqa: PLR0913
+        self,
+        hass: HomeAssistant,
+        client: AulaApiClient,
+        profile: Profile,
+        widget_context: WidgetContext,
+        token_manager: AulaTokenManager,
+        *,
+        name: str,
+        update_interval: timedelta,
+    ) -> None:
+        """Initialize the widget coordinator with an empty week cache."""
+        super().__init__(
+            hass,
+            client,
+            profile,
+            widget_context,
+            token_manager,
+            name=name,
+            update_interval=update_interval,
+        )
+        self._weeks: dict[str, _WeekEntry] = {}
+        self.week_cache_stats: dict[str, int] = {
+            "hits": 0,
+            "fetches": 0,
+            "unchanged": 0,
+            "prefetches": 0,
+        }
+
+    def _weeks_wanted(self) -> list[str]:
+        """Return the weeks a poll needs, current week first."""
+        policy = self.week_cache_policy
+        now = dt_util.now()
+        weeks = [_iso_week(now)]
+        if (
+            policy.prefetch_weekday is not None
+            and now.weekday() >= policy.prefetch_weekday
+        ):
+            weeks.append(_iso_week(now + timedelta(weeks=1)))
+        return weeks
+
+    def _stale_weeks(self, weeks: list[str]) -> list[str]:
+        """Return the weeks whose cached data has expired, or was never fetched."""
+        # Expire a little early, so a poll landing a moment before the TTL
+        # runs out still refreshes the week.
+        horizon = dt_util.utcnow() + timedelta(seconds=WIDGET_WEEK_CACHE_MARGIN)
+        return [
+            week
+            for week in weeks
+            if (entry := self._weeks.get(week)) is None or entry.expires_at <= horizon
+        ]
+
+    def _week_request_cost(self) -> int:
+        """Return roughly how many requests fetching one week makes."""
+        return 1
+
+    def _request_cost(self) -> int:
+        """Return the cost of fetching the weeks not in the cache."""
+        stale = self._stale_weeks(self._weeks_wanted())
+        return self._week_request_cost() * len(stale)
+
+    @abstractmethod
+    async def _async_fetch_week(self, week: str) -> Any:
+        """Fetch one ISO week's response from Aula."""
+
+    @abstractmethod
+    def _distribute_week(self, payload: Any) -> Any:
+        """Turn one week's response into this coordinator's data for that week."""
+
+    async def _async_get_weeks(self, weeks: list[str]) -> list[Any]:
+        """
+        Return the data for each of the given weeks.
+
+        Weeks not cached, or expired, are fetched at the same time. The
+        earliest week asked for is taken as the current one; weeks before it
+        do not change and are not shown, so they are dropped from the cache.
+        """
+        policy = self.week_cache_policy
+        current_week = min(weeks)
+        stale = self._stale_weeks(weeks)
+        self.week_cache_stats["hits"] += len(weeks) - len(stale)
+        payloads = await asyncio.gather(*(self._async_fetch_week(w) for w in stale))
+
+        fetched_at = dt_util.utcnow()
+        for week, payload in zip(stale, payloads, strict=True):
+            self.week_cache_stats["fetches"] += 1
+            if week != current_week:
+                self.week_cache_stats["prefetches"] += 1
+            digest = _payload_digest(payload)
+            entry = self._weeks.get(week)
+            if entry is not None and digest is not None and digest == entry.digest:
+                self.week_cache_stats["unchanged"] += 1
+                value = entry.value
+            else:
+                value = self._distribute_week(payload)
+            ttl = policy.ttl if week == current_week else policy.next_week_ttl
+            expires_at = fetched_at + timedelta(seconds=ttl)
+            self._weeks[week] = _WeekEntry(digest, expires_at, value)
+
+        for week in [week for week in self._weeks if week < current_week]:
+            del self._weeks[week]
+        return [self._weeks[week].value for week in weeks]
 
 
 class AulaLibraryCoordinator(
@@ -433,6 +1684,9 @@ class AulaLibraryCoordinator(
 ):
     """Coordinator for fetching library loan data."""
 
+    snapshot_key = "library"
+    entity_keys = ("library_loans",)
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -452,7 +1706,7 @@ class AulaLibraryCoordinator(
             update_interval=timedelta(seconds=LIBRARY_POLL_INTERVAL),
         )
 
-    async def _async_update_data(self) -> dict[int, LibraryChildData]:
+    async def _async_fetch_data(self) -> dict[int, LibraryChildData]:
         """Fetch library status and distribute to children."""
         async with _aula_api_errors(self.token_manager):
             status = await self.client.widgets.get_library_status(
@@ -482,12 +1736,38 @@ class AulaLibraryCoordinator(
 
         return result
 
+    def _dump_snapshot(self, data: dict[int, LibraryChildData]) -> Any:
+        """Serialize library data for the snapshot store."""
+        return _dump_per_child(
+            data,
+            lambda child_data: {
+                "loans": _dump_models(child_data.loans),
+                "longterm_loans": _dump_models(child_data.longterm_loans),
+                "reservations": child_data.reservations,
+            },
+        )
+
+    def _load_snapshot(self, payload: Any) -> dict[int, LibraryChildData]:
+        """Rebuild library data from a snapshot."""
+        return _load_per_child(
+            payload,
+            lambda value: LibraryChildData(
+                loans=_load_models(LibraryLoan, value["loans"]),
+                longterm_loans=_load_models(LibraryLoan, value["longterm_loans"]),
+                reservations=value["reservations"],
+            ),
+        )
+
 
 class AulaMUTasksCoordinator(
-    _AulaWidgetCoordinator[dict[int, list[MUTask]]],
+    _AulaWeeklyWidgetCoordinator[dict[int, list[MUTask]]],
 ):
     """Coordinator for fetching Min Uddannelse tasks."""
 
+    snapshot_key = "mu_tasks"
+    entity_keys = ("mu_tasks",)
+    week_cache_policy = _WeekCachePolicy(ttl=MU_TASKS_POLL_INTERVAL)
+
     def __init__(  # noqa: PLR0913
         self,
         hass: HomeAssistant,
@@ -515,29 +1795,43 @@ class AulaMUTasksCoordinator(
             update_interval=timedelta(seconds=MU_TASKS_POLL_INTERVAL),
         )
 
-    async def _async_update_data(self) -> dict[int, list[MUTask]]:
-        """Fetch MU tasks and distribute to children."""
-        week = dt_util.now().strftime("%G-W%V")
-        async with _aula_api_errors(self.token_manager):
-            tasks = await self.client.widgets.get_mu_tasks(
-                widget_id=self.widget_id,
-                child_filter=self.widget_context.child_filter,
-                institution_filter=self.widget_context.institution_filter,
-                week=week,
-                session_uuid=self.widget_context.session_uuid,
-            )
+    async def _async_fetch_week(self, week: str) -> list[MUTask]:
+        """Fetch one week's MU tasks."""
+        return await self.client.widgets.get_mu_tasks(
+            widget_id=self.widget_id,
+            child_filter=self.widget_context.child_filter,
+            institution_filter=self.widget_context.institution_filter,
+            week=week,
+            session_uuid=self.widget_context.session_uuid,
+        )
 
+    def _distribute_week(self, payload: list[MUTask]) -> dict[int, list[MUTask]]:
+        """Distribute one week's MU tasks to children."""
         result: dict[int, list[MUTask]] = {
             child.id: [] for child in self.profile.children
         }
 
-        for task in tasks:
+        for task in payload:
             child = self._match_child(task.student_name)
             if child and child.id in result:
                 result[child.id].append(task)
 
         return result
 
+    async def _async_fetch_data(self) -> dict[int, list[MUTask]]:
+        """Fetch this week's MU tasks, per child."""
+        async with _aula_api_errors(self.token_manager):
+            weeks = await self._async_get_weeks(self._weeks_wanted())
+        return weeks[0]
+
+    def _dump_snapshot(self, data: dict[int, list[MUTask]]) -> Any:
+        """Serialize MU tasks for the snapshot store."""
+        return _dump_per_child(data, _dump_models)
+
+    def _load_snapshot(self, payload: Any) -> dict[int, list[MUTask]]:
+        """Rebuild MU tasks from a snapshot."""
+        return _load_per_child(payload, lambda raws: _load_models(MUTask, raws))
+
 
 class _MUUgeplanData:
     """Data container for MU weekly notes (current + next week)."""
@@ -554,10 +1848,17 @@ class _MUUgeplanData:
 
 
 class AulaMUUgeplanCoordinator(
-    _AulaWidgetCoordinator[_MUUgeplanData],
+    _AulaWeeklyWidgetCoordinator[_MUUgeplanData],
 ):
     """Coordinator for fetching Min Uddannelse weekly notes (ugenoter)."""
 
+    snapshot_key = "mu_ugeplan"
+    entity_keys = ("mu_weekly_notes",)
+    # Next week is shown too, so it is wanted every day of the week.
+    week_cache_policy = _WeekCachePolicy(
+        ttl=MU_UGEPLAN_POLL_INTERVAL, prefetch_weekday=0
+    )
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -577,9 +1878,9 @@ class AulaMUUgeplanCoordinator(
             update_interval=timedelta(seconds=MU_UGEPLAN_POLL_INTERVAL),
         )
 
-    async def _fetch_week(self, week: str) -> dict[int, list[MUWeeklyLetter]]:
-        """Fetch MU weekly notes for a single week and distribute to children."""
-        persons: list[MUWeeklyPerson] = await self.client.widgets.get_ugeplan(
+    async def _async_fetch_week(self, week: str) -> list[MUWeeklyPerson]:
+        """Fetch MU weekly notes for a single week."""
+        return await self.client.widgets.get_ugeplan(
             widget_id=WIDGET_MIN_UDDANNELSE_UGEPLAN,
             child_filter=self.widget_context.child_filter,
             institution_filter=self.widget_context.institution_filter,
@@ -587,11 +1888,15 @@ class AulaMUUgeplanCoordinator(
             session_uuid=self.widget_context.session_uuid,
         )
 
+    def _distribute_week(
+        self, payload: list[MUWeeklyPerson]
+    ) -> dict[int, list[MUWeeklyLetter]]:
+        """Distribute one week's MU weekly notes to children."""
         result: dict[int, list[MUWeeklyLetter]] = {
             child.id: [] for child in self.profile.children
         }
 
-        for person in persons:
+        for person in payload:
             child = self._match_child(person.name)
             if child and child.id in result:
                 for institution in person.institutions:
@@ -599,24 +1904,49 @@ class AulaMUUgeplanCoordinator(
 
         return result
 
-    async def _async_update_data(self) -> _MUUgeplanData:
+    async def _async_fetch_data(self) -> _MUUgeplanData:
         """Fetch MU weekly notes for current and next week."""
-        now = dt_util.now()
-        current_week = now.strftime("%G-W%V")
-        next_week = (now + timedelta(weeks=1)).strftime("%G-W%V")
-
         async with _aula_api_errors(self.token_manager):
-            current = await self._fetch_week(current_week)
-            next_week_data = await self._fetch_week(next_week)
+            current, next_week = await self._async_get_weeks(self._weeks_wanted())
+        return _MUUgeplanData(current=current, next_week=next_week)
+
+    def _fingerprint(self, data: _MUUgeplanData) -> dict[int | None, str | None]:
+        """Return a digest of each child's notes for both weeks."""
+        return {
+            child_id: _payload_digest(
+                [data.current.get(child_id), data.next_week.get(child_id)]
+            )
+            for child_id in data.current.keys() | data.next_week.keys()
+        }
+
+    def _dump_snapshot(self, data: _MUUgeplanData) -> Any:
+        """Serialize weekly notes for the snapshot store."""
+        return {
+            "current": _dump_per_child(data.current, _dump_models),
+            "next_week": _dump_per_child(data.next_week, _dump_models),
+        }
 
-        return _MUUgeplanData(current=current, next_week=next_week_data)
+    def _load_snapshot(self, payload: Any) -> _MUUgeplanData:
+        """Rebuild weekly notes from a snapshot."""
+
+        def load(raws: list[dict[str, Any]]) -> list[MUWeeklyLetter]:
+            return _load_models(MUWeeklyLetter, raws)
+
+        return _MUUgeplanData(
+            current=_load_per_child(payload["current"], load),
+            next_week=_load_per_child(payload["next_week"], load),
+        )
 
 
 class AulaEasyIQCoordinator(
-    _AulaWidgetCoordinator[dict[int, EasyIQChildData]],
+    _AulaWeeklyWidgetCoordinator[dict[int, EasyIQChildData]],
 ):
     """Coordinator for fetching EasyIQ weekplan and homework."""
 
+    snapshot_key = "easyiq"
+    entity_keys = ("easyiq_weekplan", "easyiq_homework")
+    week_cache_policy = _WeekCachePolicy(ttl=EASYIQ_POLL_INTERVAL)
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -636,11 +1966,18 @@ class AulaEasyIQCoordinator(
             update_interval=timedelta(seconds=EASYIQ_POLL_INTERVAL),
         )
 
-    async def _async_update_data(self) -> dict[int, EasyIQChildData]:
-        """Fetch EasyIQ weekplan and homework per child."""
-        week = dt_util.now().strftime("%G-W%V")
+    def _week_request_cost(self) -> int:
+        """Return a weekplan and a homework fetch per child."""
+        return 2 * len(self.profile.children)
+
+    async def _async_fetch_week(
+        self, week: str
+    ) -> list[tuple[int, list[Appointment], list[EasyIQHomework]]]:
+        """Fetch one week's EasyIQ weekplan and homework per child."""
 
-        async def _fetch_child(child: Child) -> tuple[int, EasyIQChildData]:
+        async def _fetch_child(
+            child: Child,
+        ) -> tuple[int, list[Appointment], list[EasyIQHomework]]:
             child_id_str = _get_child_widget_id(child)
             inst_code = _get_child_institution_code(child)
             if not inst_code and self.widget_context.institution_filter:
@@ -669,21 +2006,59 @@ class AulaEasyIQCoordinator(
                     all_child_user_ids=self.widget_context.child_filter,
                 ),
             )
-            return child.id, EasyIQChildData(weekplan=weekplan, homework=homework)
+            return child.id, weekplan, homework
 
-        async with _aula_api_errors(self.token_manager):
-            results = await asyncio.gather(
+        return list(
+            await asyncio.gather(
                 *(_fetch_child(child) for child in self.profile.children)
             )
+        )
 
-        return dict(results)
+    def _distribute_week(
+        self, payload: list[tuple[int, list[Appointment], list[EasyIQHomework]]]
+    ) -> dict[int, EasyIQChildData]:
+        """Key one week's EasyIQ data by child."""
+        return {
+            child_id: EasyIQChildData(weekplan=weekplan, homework=homework)
+            for child_id, weekplan, homework in payload
+        }
+
+    async def _async_fetch_data(self) -> dict[int, EasyIQChildData]:
+        """Fetch this week's EasyIQ weekplan and homework, per child."""
+        async with _aula_api_errors(self.token_manager):
+            weeks = await self._async_get_weeks(self._weeks_wanted())
+        return weeks[0]
+
+    def _dump_snapshot(self, data: dict[int, EasyIQChildData]) -> Any:
+        """Serialize EasyIQ data for the snapshot store."""
+        return _dump_per_child(
+            data,
+            lambda child_data: {
+                "weekplan": _dump_models(child_data.weekplan),
+                "homework": _dump_models(child_data.homework),
+            },
+        )
+
+    def _load_snapshot(self, payload: Any) -> dict[int, EasyIQChildData]:
+        """Rebuild EasyIQ data from a snapshot."""
+        return _load_per_child(
+            payload,
+            lambda value: EasyIQChildData(
+                weekplan=_load_models(Appointment, value["weekplan"]),
+                homework=_load_models(EasyIQHomework, value["homework"]),
+            ),
+        )
 
 
 class AulaMeebookCoordinator(
-    _AulaWidgetCoordinator[dict[int, list[MeebookTask]]],
+    _AulaWeeklyWidgetCoordinator[dict[int, list[MeebookTask]]],
 ):
     """Coordinator for fetching Meebook weekplan data."""
 
+    snapshot_key = "meebook"
+    entity_keys = ("meebook_weekplan",)
+    week_cache_policy = _WeekCachePolicy(ttl=MEEBOOK_POLL_INTERVAL)
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -703,22 +2078,24 @@ class AulaMeebookCoordinator(
             update_interval=timedelta(seconds=MEEBOOK_POLL_INTERVAL),
         )
 
-    async def _async_update_data(self) -> dict[int, list[MeebookTask]]:
-        """Fetch Meebook weekplan and distribute tasks to children."""
-        week = dt_util.now().strftime("%G-W%V")
-        async with _aula_api_errors(self.token_manager):
-            student_plans = await self.client.widgets.get_meebook_weekplan(
-                child_filter=self.widget_context.child_filter,
-                institution_filter=self.widget_context.institution_filter,
-                week=week,
-                session_uuid=self.widget_context.session_uuid,
-            )
+    async def _async_fetch_week(self, week: str) -> list[MeebookStudentPlan]:
+        """Fetch one week's Meebook weekplan."""
+        return await self.client.widgets.get_meebook_weekplan(
+            child_filter=self.widget_context.child_filter,
+            institution_filter=self.widget_context.institution_filter,
+            week=week,
+            session_uuid=self.widget_context.session_uuid,
+        )
 
+    def _distribute_week(
+        self, payload: list[MeebookStudentPlan]
+    ) -> dict[int, list[MeebookTask]]:
+        """Distribute one week's Meebook tasks to children."""
         result: dict[int, list[MeebookTask]] = {
             child.id: [] for child in self.profile.children
         }
 
-        for plan in student_plans:
+        for plan in payload:
             child = self._match_child(plan.name)
             if child and child.id in result:
                 for day_plan in plan.week_plan:
@@ -726,12 +2103,29 @@ class AulaMeebookCoordinator(
 
         return result
 
+    async def _async_fetch_data(self) -> dict[int, list[MeebookTask]]:
+        """Fetch this week's Meebook tasks, per child."""
+        async with _aula_api_errors(self.token_manager):
+            weeks = await self._async_get_weeks(self._weeks_wanted())
+        return weeks[0]
+
+    def _dump_snapshot(self, data: dict[int, list[MeebookTask]]) -> Any:
+        """Serialize Meebook tasks for the snapshot store."""
+        return _dump_per_child(data, _dump_models)
+
+    def _load_snapshot(self, payload: Any) -> dict[int, list[MeebookTask]]:
+        """Rebuild Meebook tasks from a snapshot."""
+        return _load_per_child(payload, lambda raws: _load_models(MeebookTask, raws))
+
 
 class AulaHuskelistenCoordinator(
     _AulaWidgetCoordinator[dict[int, HuskelistenChildData]],
 ):
     """Coordinator for fetching Huskelisten reminders."""
 
+    snapshot_key = "huskelisten"
+    entity_keys = ("huskelisten_reminders",)
+
     def __init__(
         self,
         hass: HomeAssistant,
@@ -751,7 +2145,7 @@ class AulaHuskelistenCoordinator(
             update_interval=timedelta(seconds=HUSKELISTEN_POLL_INTERVAL),
         )
 
-    async def _async_update_data(self) -> dict[int, HuskelistenChildData]:
+    async def _async_fetch_data(self) -> dict[int, HuskelistenChildData]:
         """Fetch Huskelisten reminders and distribute to children."""
         now = dt_util.now()
         from_date = now.strftime("%Y-%m-%d")
@@ -779,3 +2173,25 @@ class AulaHuskelistenCoordinator(
                 )
 
         return result
+
+    def _dump_snapshot(self, data: dict[int, HuskelistenChildData]) -> Any:
+        """Serialize Huskelisten reminders for the snapshot store."""
+        return _dump_per_child(
+            data,
+            lambda child_data: {
+                "team_reminders": _dump_models(child_data.team_reminders),
+                "assignment_reminders": _dump_models(child_data.assignment_reminders),
+            },
+        )
+
+    def _load_snapshot(self, payload: Any) -> dict[int, HuskelistenChildData]:
+        """Rebuild Huskelisten reminders from a snapshot."""
+        return _load_per_child(
+            payload,
+            lambda value: HuskelistenChildData(
+                team_reminders=_load_models(TeamReminder, value["team_reminders"]),
+                assignment_reminders=_load_models(
+                    AssignmentReminder, value["assignment_reminders"]
+                ),
+            ),
+        )
@@ -3,16 +3,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from collections.abc import Iterator
 
     from aula import AulaApiClient, Profile
-    from aula.models import Appointment, EasyIQHomework, LibraryLoan
+    from aula.models import Appointment, EasyIQHomework, LibraryLoan, Notification
     from aula.models.momo_huskeliste import AssignmentReminder, TeamReminder
     from homeassistant.config_entries import ConfigEntry
-    from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
     from .coordinator import (
         AulaCalendarCoordinator,
@@ -25,7 +24,11 @@ if TYPE_CHECKING:
         AulaMUUgeplanCoordinator,
         AulaNotificationsCoordinator,
         AulaPresenceCoordinator,
+        _AulaCoordinator,
     )
+    from .scheduler import AulaRequestScheduler
+    from .singleflight import AulaSingleFlight
+    from .store import AulaSnapshotStore
     from .token_manager import AulaTokenManager
 
 type AulaConfigEntry = ConfigEntry[AulaRuntimeData]
@@ -65,6 +68,16 @@ class HuskelistenChildData:
     assignment_reminders: list[AssignmentReminder] = field(default_factory=list)
 
 
+@dataclass
+class ChildNotifications:
+    """One child's notifications, as its notification sensor shows them."""
+
+    count: int = 0
+    by_type: dict[str, int] = field(default_factory=dict)
+    # The newest few, in the order Aula lists them.
+    recent: list[Notification] = field(default_factory=list)
+
+
 @dataclass
 class MessagePreview:
     """A single message shown by the latest-messages sensor."""
@@ -92,6 +105,9 @@ class AulaRuntimeData:
     client: AulaApiClient
     token_manager: AulaTokenManager
     profile: Profile
+    request_scheduler: AulaRequestScheduler
+    single_flight: AulaSingleFlight
+    snapshot_store: AulaSnapshotStore
     presence_coordinator: AulaPresenceCoordinator
     calendar_coordinator: AulaCalendarCoordinator
     notifications_coordinator: AulaNotificationsCoordinator
@@ -104,7 +120,7 @@ class AulaRuntimeData:
     huskelisten_coordinator: AulaHuskelistenCoordinator | None = None
 
     @property
-    def all_coordinators(self) -> Iterator[DataUpdateCoordinator]:
+    def all_coordinators(self) -> Iterator[_AulaCoordinator[Any]]:
         """Yield all active coordinators."""
         for coord in (
             self.presence_coordinator,
@@ -67,6 +67,48 @@ async def async_get_config_entry_diagnostics(
         },
     }
 
+    # How old each coordinator's data is, and whether setup restored it from
+    # a snapshot rather than waiting on Aula.
+    snapshots: dict[str, Any] = {}
+    # How far each coordinator has backed off during an Aula outage.
+    backoff: dict[str, Any] = {}
+    for coordinator in runtime_data.all_coordinators:
+        age = coordinator.data_age
+        snapshots[coordinator.snapshot_key] = {
+            "restored": coordinator.restored_from_snapshot,
+            "data_age_seconds": round(age.total_seconds()) if age else None,
+        }
+        backoff[coordinator.snapshot_key] = coordinator.backoff.as_dict()
+    result["snapshots"] = snapshots
+    result["backoff"] = backoff
+    # How confidently widget names were matched to children; no names here.
+    result["child_matching"] = {
+        coordinator.snapshot_key: coordinator.child_index.as_dict()
+        for coordinator in runtime_data.all_coordinators
+        if hasattr(coordinator, "child_index")
+    }
+    # How often widgets answered a week from their cache instead of Aula.
+    result["week_caches"] = {
+        coordinator.snapshot_key: coordinator.week_cache_stats
+        for coordinator in runtime_data.all_coordinators
+        if getattr(coordinator, "week_cache_policy", None) is not None
+    }
+    # Entity callbacks made and skipped because a poll changed nothing for them.
+    result["listener_updates"] = {
+        coordinator.snapshot_key: coordinator.listener_stats
+        for coordinator in runtime_data.all_coordinators
+    }
+    # How often sensors reused a value derived from the same data.
+    result["entity_caches"] = {
+        coordinator.snapshot_key: coordinator.entity_cache_stats
+        for coordinator in runtime_data.all_coordinators
+    }
+    result["request_budget"] = runtime_data.request_scheduler.as_dict()
+    result["shared_requests"] = runtime_data.single_flight.as_dict()
+    result["notifications_fetch"] = runtime_data.notifications_coordinator.fetch_stats
+    # Token refresh latency on a fresh connection versus a kept-open one.
+    result["token_refresh"] = runtime_data.token_manager.refresh_stats
+
     # Widget data summaries
     widgets: dict[str, Any] = {}
 
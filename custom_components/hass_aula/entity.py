@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Self, overload
 
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.update_coordinator import (
@@ -13,10 +13,67 @@ from homeassistant.helpers.update_coordinator import (
 from .const import DOMAIN
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from aula import Child, Profile
 
 
+def cached_per_generation[R](
+    method: Callable[[Any], R],
+) -> _GenerationCachedProperty[R]:
+    """
+    Turn an entity method into a property computed once per data generation.
+
+    The value is kept until the coordinator's data generation moves on, so a
+    state written twice for one poll, or read from another property, is not
+    rebuilt. Hits and misses are counted on the coordinator.
+    """
+    return _GenerationCachedProperty(method)
+
+
+class _GenerationCachedProperty[R]:
+    """A property read through its entity's generation cache; typed as R."""
+
+    def __init__(self, method: Callable[[Any], R]) -> None:
+        """Wrap the method computing the value."""
+        self._method = method
+        self._name = method.__name__
+        self.__doc__ = method.__doc__
+
+    @overload
+    def __get__(self, instance: None, owner: type | None = None) -> Self: ...
+
+    @overload
+    def __get__(self, instance: object, owner: type | None = None) -> R: ...
+
+    def __get__(self, instance: Any, owner: type | None = None) -> Self | R:
+        """Return the value for this generation, computing it on a miss."""
+        if instance is None:
+            return self
+        coordinator = instance.coordinator
+        generation = coordinator.data_generation
+        cached = instance._generation_values.get(self._name)  # noqa: SLF001
+        if cached is not None and cached[0] == generation:
+            coordinator.entity_cache_stats["hits"] += 1
+            return cached[1]
+        coordinator.entity_cache_stats["misses"] += 1
+        value = self._method(instance)
+        instance._generation_values[self._name] = (generation, value)  # noqa: SLF001
+        return value
+
+
+class _GenerationCacheMixin:
+    """Keeps the values of an entity's cached_per_generation properties."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        """Start with nothing cached, then initialize the entity."""
+        # Values of cached_per_generation properties, with their generation.
+        self._generation_values: dict[str, tuple[int, Any]] = {}
+        super().__init__(*args, **kwargs)
+
+
 class AulaEntity[CoordT: DataUpdateCoordinator[Any]](
+    _GenerationCacheMixin,
     CoordinatorEntity[CoordT],
 ):
     """Base class for Aula entities."""
@@ -29,7 +86,9 @@ class AulaEntity[CoordT: DataUpdateCoordinator[Any]](
         child: Child,
     ) -> None:
         """Initialize the entity."""
-        super().__init__(coordinator)
+        # The child's ID as context, so a poll that leaves this child's data
+        # unchanged does not call the entity back.
+        super().__init__(coordinator, context=child.id)
         self._child = child
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, str(child.id))},
@@ -39,8 +98,19 @@ class AulaEntity[CoordT: DataUpdateCoordinator[Any]](
             entry_type=DeviceEntryType.SERVICE,
         )
 
+    @property
+    def available(self) -> bool:
+        """
+        Return whether the coordinator has data for the entity to show.
+
+        A widget coordinator without a snapshot has none until its deferred
+        first refresh, which has not failed, so it is not marked failed.
+        """
+        return super().available and self.coordinator.data is not None
+
 
 class AulaAccountEntity[CoordT: DataUpdateCoordinator[Any]](
+    _GenerationCacheMixin,
     CoordinatorEntity[CoordT],
 ):
     """Base class for profile-level Aula entities."""
@@ -0,0 +1,127 @@
+"""aula's HttpClient on Home Assistant's shared aiohttp connection pool."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import ClientError, ClientTimeout, CookieJar
+from aula import AulaConnectionError, HttpResponse
+from aula.const import USER_AGENT
+from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession
+    from homeassistant.core import HomeAssistant
+
+# The timeouts aula's own httpx client uses.
+_REQUEST_TIMEOUT = ClientTimeout(total=None, connect=30, sock_read=60)
+_DOWNLOAD_TIMEOUT = ClientTimeout(total=None, connect=30, sock_read=120)
+
+
+def _query_params(params: dict[str, Any]) -> list[tuple[str, str]]:
+    """
+    Encode query parameters the way aula's httpx client did.
+
+    yarl rejects booleans and None, which httpx accepted: booleans go out as
+    "true" and "false", None values are left out, and a list repeats its key
+    once per item.
+    """
+    pairs: list[tuple[str, str]] = []
+    for key, value in params.items():
+        items = value if isinstance(value, (list, tuple)) else (value,)
+        for item in items:
+            if item is None:
+                continue
+            if isinstance(item, bool):
+                pairs.append((key, "true" if item else "false"))
+            else:
+                pairs.append((key, str(item)))
+    return pairs
+
+
+@callback
+def async_create_http_client(
+    hass: HomeAssistant, cookies: dict[str, str]
+) -> AulaHttpClient:
+    """
+    Create an HTTP client for one Aula session.
+
+    The client has a cookie jar of its own, seeded with the stored cookies, so
+    the session it logs in to cannot mix with another client's; the one being
+    replaced keeps working until it is closed. Connections come from Home
+    Assistant's shared pool, which keeps them to Aula and the widget providers
+    open across client rebuilds, and loads no SSL context of its own.
+    """
+    cookie_jar = CookieJar()
+    cookie_jar.update_cookies(cookies)
+    session = async_create_clientsession(
+        hass, auto_cleanup=False, cookie_jar=cookie_jar
+    )
+    return AulaHttpClient(session)
+
+
+class AulaHttpClient:
+    """aula HttpClient backed by an aiohttp session."""
+
+    def __init__(self, session: ClientSession) -> None:
+        """Initialize the client on a session it owns, but not its connector."""
+        self._session = session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: dict[str, str] | None = None,
+        params: dict[str, Any] | None = None,
+        json: Any | None = None,
+    ) -> HttpResponse:
+        """Send a request and return the response with its JSON parsed."""
+        try:
+            async with self._session.request(
+                method,
+                url,
+                # Home Assistant's sessions identify as Home Assistant unless a
+                # request says otherwise; Aula expects a browser.
+                headers={"User-Agent": USER_AGENT, **(headers or {})},
+                params=_query_params(params) if params else None,
+                json=json,
+                timeout=_REQUEST_TIMEOUT,
+            ) as response:
+                try:
+                    data = await response.json(content_type=None)
+                except (ValueError, UnicodeDecodeError):
+                    data = None
+                return HttpResponse(
+                    status_code=response.status,
+                    data=data,
+                    headers=dict(response.headers),
+                )
+        except (ClientError, TimeoutError) as err:
+            msg = f"Request to {url} failed: {err}"
+            raise AulaConnectionError(msg) from err
+
+    async def download_bytes(self, url: str) -> bytes:
+        """Download a file, raising aula's error for a failed status."""
+        try:
+            async with self._session.get(
+                url, headers={"User-Agent": USER_AGENT}, timeout=_DOWNLOAD_TIMEOUT
+            ) as response:
+                HttpResponse(status_code=response.status).raise_for_status()
+                return await response.read()
+        except (ClientError, TimeoutError) as err:
+            msg = f"Download of {url} failed: {err}"
+            raise AulaConnectionError(msg) from err
+
+    def get_cookie(self, name: str) -> str | None:
+        """Return a cookie from this client's jar."""
+        for cookie in self._session.cookie_jar:
+            if cookie.key == name:
+                return cookie.value
+        return None
+
+    async def close(self) -> None:
+        """Close the session, leaving the shared connection pool open."""
+        # close() would close Home Assistant's shared connector along with it.
+        self._session.detach()
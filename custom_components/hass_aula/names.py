@@ -0,0 +1,118 @@
+"""Matching of names in widget data to the profile's children."""
+
+from __future__ import annotations
+
+import unicodedata
+from collections import Counter, defaultdict
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from aula import Child
+
+# Resolved names kept per index; widget data repeats a handful of names, so
+# this is only reached if something feeds it free text.
+_MEMO_MAX_SIZE = 1024
+
+
+def normalize_name(name: str) -> str:
+    """Return a name case-folded, without accents and with single spaces."""
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.casefold().split())
+
+
+class ChildNameIndex:
+    """
+    Resolve the names widgets report to the profile's children.
+
+    Widgets give a child's name as their own system spells it: sometimes the
+    full name, sometimes without a middle name, in other casing or without
+    accents. A name is matched, in order of confidence:
+
+    - exact: it normalizes to a child's normalized name;
+    - tokens: its words are all among a child's words, or a child's words are
+      all among its words, and no other child fits as well;
+    - partial: it is contained in, or contains, exactly one child's name.
+
+    A name that fits two children equally well matches neither, so a
+    sibling whose name is a prefix of another's is never picked by mistake.
+    Resolved names are memoized, so distributing a payload is linear in its
+    items.
+    """
+
+    def __init__(self, children: Iterable[Child]) -> None:
+        """Build the index for a profile's children."""
+        self._children = list(children)
+        self._names = [normalize_name(child.name) for child in self._children]
+        self._tokens = [frozenset(name.split()) for name in self._names]
+
+        by_name: defaultdict[str, list[int]] = defaultdict(list)
+        self._by_token: defaultdict[str, list[int]] = defaultdict(list)
+        for index, (name, tokens) in enumerate(
+            zip(self._names, self._tokens, strict=True)
+        ):
+            by_name[name].append(index)
+            for token in tokens:
+                self._by_token[token].append(index)
+        # Names two children share cannot tell them apart.
+        self._by_name = {
+            name: indexes[0] for name, indexes in by_name.items() if len(indexes) == 1
+        }
+
+        self._memo: dict[str, int | None] = {}
+        self.stats: Counter[str] = Counter()
+
+    def match(self, name: str) -> Child | None:
+        """Return the child a name refers to, or None if it is not clear."""
+        try:
+            index = self._memo[name]
+        except KeyError:
+            pass
+        else:
+            self.stats["memo_hits"] += 1
+            return None if index is None else self._children[index]
+
+        index, confidence = self._resolve(normalize_name(name))
+        self.stats[confidence] += 1
+        if len(self._memo) >= _MEMO_MAX_SIZE:
+            self._memo.clear()
+        self._memo[name] = index
+        return None if index is None else self._children[index]
+
+    def _resolve(self, name: str) -> tuple[int | None, str]:
+        """Return the index of the child a normalized name refers to."""
+        if not name:
+            return None, "unmatched"
+        if (index := self._by_name.get(name)) is not None:
+            return index, "exact"
+
+        tokens = frozenset(name.split())
+        overlap: Counter[int] = Counter()
+        for token in tokens:
+            overlap.update(self._by_token.get(token, ()))
+        fits = [
+            (shared, index)
+            for index, shared in overlap.items()
+            if shared in (len(tokens), len(self._tokens[index]))
+        ]
+        if fits:
+            best = max(shared for shared, _ in fits)
+            leaders = [index for shared, index in fits if shared == best]
+            if len(leaders) == 1:
+                return leaders[0], "tokens"
+            return None, "ambiguous"
+
+        partial = [
+            index
+            for index, child_name in enumerate(self._names)
+            if child_name and (child_name in name or name in child_name)
+        ]
+        if len(partial) == 1:
+            return partial[0], "partial"
+        return None, "ambiguous" if partial else "unmatched"
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return match counts by confidence for diagnostics."""
+        return {"memoized": len(self._memo), **self.stats}
@@ -0,0 +1,126 @@
+"""Per-account request budget for the Aula integration."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import Counter
+from enum import IntEnum
+from typing import Any
+
+from .const import LOGGER, REQUEST_BUDGET_CAPACITY, REQUEST_BUDGET_REFILL_RATE
+
+
+class RequestPriority(IntEnum):
+    """How urgently a unit of work needs Aula; lower values go first."""
+
+    # Actions a user is waiting on, such as update_presence.
+    USER = 0
+    # Polls behind the core entities: presence, calendar, notifications and
+    # messages.
+    CORE = 1
+    # Widget polls, which can fall behind without anyone noticing.
+    BACKGROUND = 2
+
+
+class AulaRequestScheduler:
+    """
+    Token bucket shared by every coordinator and action of one account.
+
+    Without it, up to ten coordinators poll on their own clocks, line up, and
+    together trip Aula's rate limit. Work states its priority and how many
+    requests it is about to make:
+
+    - USER work never waits. It may overdraw the bucket, which pushes
+      everything else back instead.
+    - CORE work waits for budget, but ahead of any BACKGROUND waiter.
+    - BACKGROUND work that already has data is deferred rather than queued,
+      and catches up on its next poll.
+    """
+
+    def __init__(
+        self,
+        capacity: float = REQUEST_BUDGET_CAPACITY,
+        refill_rate: float = REQUEST_BUDGET_REFILL_RATE,
+    ) -> None:
+        """Initialize the scheduler with a full bucket."""
+        self._capacity = capacity
+        self._refill_rate = refill_rate
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._waiting: Counter[RequestPriority] = Counter()
+        self._granted: Counter[RequestPriority] = Counter()
+        self._deferred: Counter[RequestPriority] = Counter()
+
+    @property
+    def tokens(self) -> float:
+        """Return the budget left right now; negative when overdrawn."""
+        self._refill()
+        return self._tokens
+
+    async def async_acquire(
+        self,
+        priority: RequestPriority,
+        cost: float = 1,
+        *,
+        can_defer: bool = False,
+    ) -> bool:
+        """
+        Take ``cost`` requests' worth of budget, waiting if need be.
+
+        Returns False, without taking anything, when the work was deferred;
+        only BACKGROUND work with ``can_defer`` set is ever deferred.
+        """
+        cost = min(cost, self._capacity)
+        if priority is RequestPriority.USER:
+            self._refill()
+            # Bounded, so a burst of actions cannot starve polling for long.
+            self._tokens = max(self._tokens - cost, -self._capacity)
+            self._granted[priority] += 1
+            return True
+
+        if self._try_take(priority, cost):
+            return True
+        if can_defer and priority is RequestPriority.BACKGROUND:
+            self._deferred[priority] += 1
+            LOGGER.debug("Request budget is low, deferring background poll")
+            return False
+
+        self._waiting[priority] += 1
+        try:
+            while not self._try_take(priority, cost):
+                shortfall = max(cost - self._tokens, 1)
+                await asyncio.sleep(shortfall / self._refill_rate)
+        finally:
+            self._waiting[priority] -= 1
+        return True
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the budget state for diagnostics."""
+        return {
+            "tokens": round(self.tokens, 2),
+            "capacity": self._capacity,
+            "refill_per_minute": self._refill_rate * 60,
+            "waiting": {p.name.lower(): self._waiting[p] for p in RequestPriority},
+            "granted": {p.name.lower(): self._granted[p] for p in RequestPriority},
+            "deferred": {p.name.lower(): self._deferred[p] for p in RequestPriority},
+        }
+
+    def _try_take(self, priority: RequestPriority, cost: float) -> bool:
+        """Take budget unless it is short or more urgent work is waiting."""
+        self._refill()
+        if any(self._waiting[p] for p in RequestPriority if p < priority):
+            return False
+        if self._tokens < cost:
+            return False
+        self._tokens -= cost
+        self._granted[priority] += 1
+        return True
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self._capacity,
+            self._tokens + (now - self._updated) * self._refill_rate,
+        )
+        self._updated = now
@@ -12,6 +12,7 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 
+from .const import NOTIFICATIONS_RECENT_ITEMS
 from .const import PARALLEL_UPDATES as PARALLEL_UPDATES  # noqa: PLC0414
 from .coordinator import (
     AulaEasyIQCoordinator,
@@ -25,7 +26,7 @@ from .coordinator import (
     AulaPresenceCoordinator,
     _PresenceChildData,
 )
-from .entity import AulaAccountEntity, AulaEntity
+from .entity import AulaAccountEntity, AulaEntity, cached_per_generation
 
 if TYPE_CHECKING:
     from aula import Child, Profile
@@ -35,6 +36,7 @@ if TYPE_CHECKING:
 
     from .data import (
         AulaConfigEntry,
+        ChildNotifications,
         EasyIQChildData,
         HuskelistenChildData,
         LibraryChildData,
@@ -162,7 +164,7 @@ class AulaPresenceSensor(AulaEntity[AulaPresenceCoordinator], SensorEntity):
     def _child_data(self) -> _PresenceChildData | None:
         return self.coordinator.data.get(self._child.id)
 
-    @property
+    @cached_per_generation
     def native_value(self) -> str | None:
         """Return the presence status."""
         child_data = self._child_data
@@ -171,7 +173,7 @@ class AulaPresenceSensor(AulaEntity[AulaPresenceCoordinator], SensorEntity):
         overview = child_data.overview
         return overview.status.name.lower() if overview.status else None
 
-    @property
+    @cached_per_generation
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return time and location details as attributes."""
         child_data = self._child_data
@@ -211,13 +213,13 @@ class AulaNotificationsSensor(
         super().__init__(coordinator, profile)
         self._attr_unique_id = f"{profile.profile_id}_unread_notifications"
 
-    @property
+    @cached_per_generation
     def native_value(self) -> int:
         """Return the number of notifications."""
         notifications = self.coordinator.data or []
         return len(notifications)
 
-    @property
+    @cached_per_generation
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return total count and recent notification titles."""
         notifications = self.coordinator.data or []
@@ -230,7 +232,7 @@ class AulaNotificationsSensor(
                     "related_child_name": n.related_child_name,
                     "created_at": n.created_at,
                 }
-                for n in notifications[:5]
+                for n in notifications[:NOTIFICATIONS_RECENT_ITEMS]
             ],
         }
 
@@ -253,28 +255,23 @@ class AulaChildNotificationsSensor(
         self._attr_unique_id = f"{child.id}_unread_notifications"
 
     @property
-    def _child_notifications(self) -> list:
+    def _child_notifications(self) -> ChildNotifications:
         """Return notifications for this child."""
-        notifications = self.coordinator.data or []
-        return [n for n in notifications if n.institution_profile_id == self._child.id]
+        return self.coordinator.child_notifications(self._child.id)
 
-    @property
+    @cached_per_generation
     def native_value(self) -> int:
         """Return the number of notifications for this child."""
-        return len(self._child_notifications)
+        return self._child_notifications.count
 
-    @property
+    @cached_per_generation
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return by-type counts and recent notifications."""
         child_notifs = self._child_notifications
-        if not child_notifs:
+        if not child_notifs.count:
             return {}
-        by_type: dict[str, int] = {}
-        for n in child_notifs:
-            key = n.event_type or "unknown"
-            by_type[key] = by_type.get(key, 0) + 1
         return {
-            "by_type": by_type,
+            "by_type": dict(child_notifs.by_type),
             "recent": [
                 {
                     "title": n.title,
@@ -282,7 +279,7 @@ class AulaChildNotificationsSensor(
                     "event_type": n.event_type,
                     "created_at": n.created_at,
                 }
-                for n in child_notifs[:5]
+                for n in child_notifs.recent
             ],
         }
 
@@ -309,7 +306,7 @@ class AulaLatestMessagesSensor(
         """Return the coordinator's inbox data."""
         return self.coordinator.data
 
-    @property
+    @cached_per_generation
     def native_value(self) -> int:
         """Return the number of unread message threads."""
         data = self._messages_data
@@ -317,7 +314,7 @@ class AulaLatestMessagesSensor(
             return 0
         return data.unread_count
 
-    @property
+    @cached_per_generation
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return the latest messages."""
         data = self._messages_data
@@ -360,7 +357,7 @@ class AulaLibraryLoansSensor(AulaEntity[AulaLibraryCoordinator], SensorEntity):
             return None
         return self.coordinator.data.get(self._child.id)
 
-    @property
+    @cached_per_generation
     def native_value(self) -> int:
         """Return the number of active loans."""
         data = self._child_data
@@ -368,7 +365,7 @@ class AulaLibraryLoansSensor(AulaEntity[AulaLibraryCoordinator], SensorEntity):
             return 0
         return len(data.loans) + len(data.longterm_loans)
 
-    @property
+    @cached_per_generation
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return loan details."""
         data = self._child_data
@@ -411,12 +408,12 @@ class AulaMUTasksSensor(AulaEntity[AulaMUTasksCoordinator], SensorEntity):
             return []
         return self.coordinator.data.get(self._child.id, [])
 
-    @property
+    @cached_per_generation
     def native_value(self) -> int:
         """Return the number of incomplete tasks."""
         return sum(1 for t in self._tasks if not t.is_completed)
 
-    @property
+    @cached_per_generation
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return task details."""
         tasks = self._tasks
@@ -463,7 +460,7 @@ class AulaMUWeeklyNotesSensor(AulaEntity[AulaMUUgeplanCoordinator], SensorEntity
             return []
         return self.coordinator.data.next_week.get(self._child.id, [])
 
-    @property
+    @cached_per_generation
     def native_value(self) -> int:
         """Return the number of weekly notes."""
         return len(self._letters)
@@ -472,7 +469,7 @@ class AulaMUWeeklyNotesSensor(AulaEntity[AulaMUUgeplanCoordinator], SensorEntity
     def _format_letters(letters: list[MUWeeklyLetter]) -> list[str]:
         return [letter.content_html for letter in letters[:MAX_ATTRIBUTE_ITEMS]]
 
-    @property
+    @cached_per_generation
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return weekly note details for current and next week."""
         letters = self._letters
@@ -508,7 +505,7 @@ class AulaEasyIQWeekplanSensor(AulaEntity[AulaEasyIQCoordinator], SensorEntity):
             return None
         return self.coordinator.data.get(self._child.id)
 
-    @property
+    @cached_per_generation
     def native_value(self) -> int:
         """Return the number of appointments."""
         data = self._child_data
@@ -516,7 +513,7 @@ class AulaEasyIQWeekplanSensor(AulaEntity[AulaEasyIQCoordinator], SensorEntity):
             return 0
         return len(data.weekplan)
 
-    @property
+    @cached_per_generation
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return appointment details."""
         data = self._child_data
@@ -558,7 +555,7 @@ class AulaEasyIQHomeworkSensor(AulaEntity[AulaEasyIQCoordinator], SensorEntity):
             return None
         return self.coordinator.data.get(self._child.id)
 
-    @property
+    @cached_per_generation
     def native_value(self) -> int:
         """Return the number of incomplete homework items."""
         data = self._child_data
@@ -566,7 +563,7 @@ class AulaEasyIQHomeworkSensor(AulaEntity[AulaEasyIQCoordinator], SensorEntity):
             return 0
         return sum(1 for h in data.homework if not h.is_completed)
 
-    @property
+    @cached_per_generation
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return homework details."""
         data = self._child_data
@@ -608,12 +605,12 @@ class AulaMeebookWeekplanSensor(AulaEntity[AulaMeebookCoordinator], SensorEntity
             return []
         return self.coordinator.data.get(self._child.id, [])
 
-    @property
+    @cached_per_generation
     def native_value(self) -> int:
         """Return the number of tasks this week."""
         return len(self._tasks)
 
-    @property
+    @cached_per_generation
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return task details."""
         tasks = self._tasks
@@ -652,7 +649,7 @@ class AulaHuskelistenSensor(AulaEntity[AulaHuskelistenCoordinator], SensorEntity
             return None
         return self.coordinator.data.get(self._child.id)
 
-    @property
+    @cached_per_generation
     def native_value(self) -> int:
         """Return the total number of reminders."""
         data = self._child_data
@@ -660,7 +657,7 @@ class AulaHuskelistenSensor(AulaEntity[AulaHuskelistenCoordinator], SensorEntity
             return 0
         return len(data.team_reminders) + len(data.assignment_reminders)
 
-    @property
+    @cached_per_generation
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return reminder details."""
         data = self._child_data
@@ -45,6 +45,7 @@ from .const import (
     SERVICE_GET_THREAD_MESSAGES,
     SERVICE_UPDATE_PRESENCE,
 )
+from .scheduler import RequestPriority
 
 if TYPE_CHECKING:
     from collections.abc import Callable, Coroutine
@@ -55,6 +56,7 @@ if TYPE_CHECKING:
     from homeassistant.helpers.device_registry import DeviceEntry
 
     from .data import AulaConfigEntry
+    from .singleflight import AulaSingleFlight
 
 UPDATE_PRESENCE_SCHEMA = vol.Schema(
     {
@@ -275,9 +277,12 @@ def _build_update(call: ServiceCall) -> _PresenceUpdate:
 async def _async_call_aula[T](
     entry: AulaConfigEntry,
     operation: Callable[[AulaApiClient], Coroutine[Any, Any, T]],
+    cost: int = 1,
 ) -> T:
     """Run an Aula API operation, refreshing the session once on auth failure."""
     runtime = entry.runtime_data
+    # Actions go ahead of any poll; the polls make up for the spent budget.
+    await runtime.request_scheduler.async_acquire(RequestPriority.USER, cost)
     try:
         try:
             return await operation(runtime.client)
@@ -300,6 +305,7 @@ async def _async_call_aula[T](
 
 async def _async_template_ids(
     client: AulaApiClient,
+    single_flight: AulaSingleFlight,
     child_ids: list[int],
     by_date: date,
 ) -> dict[int, int]:
@@ -309,7 +315,8 @@ async def _async_template_ids(
     Passing the existing ID makes Aula update that template instead of adding
     another one for the same day.
     """
-    templates = await client.get_presence_templates(
+    templates = await single_flight.async_call(
+        client.get_presence_templates,
         institution_profile_ids=child_ids,
         from_date=by_date,
         to_date=by_date,
@@ -334,10 +341,13 @@ async def _async_apply(
     update: _PresenceUpdate,
 ) -> None:
     """Write one presence update to every targeted child of a config entry."""
+    single_flight = entry.runtime_data.single_flight
 
     async def operation(client: AulaApiClient) -> None:
         # Re-resolved on retry, so replaying the whole operation stays idempotent.
-        template_ids = await _async_template_ids(client, child_ids, update.by_date)
+        template_ids = await _async_template_ids(
+            client, single_flight, child_ids, update.by_date
+        )
         results = await asyncio.gather(
             *(
                 client.update_presence_template(
@@ -376,7 +386,8 @@ async def _async_apply(
         if failure is not None:
             raise failure
 
-    await _async_call_aula(entry, operation)
+    # One template lookup plus a write per child.
+    await _async_call_aula(entry, operation, cost=1 + len(child_ids))
     await entry.runtime_data.presence_coordinator.async_request_refresh()
 
 
@@ -396,9 +407,12 @@ async def _async_get_thread_messages(call: ServiceCall) -> ServiceResponse:
     # The subject is deliberately not resolved here: it would cost a second
     # request per call, and the latest-messages sensor already pairs each
     # thread_id with its subject.
+    single_flight = entry.runtime_data.single_flight
     messages = await _async_call_aula(
         entry,
-        lambda client: client.get_messages_for_thread(thread_id, limit=limit),
+        lambda client: single_flight.async_call(
+            client.get_messages_for_thread, thread_id, limit=limit
+        ),
     )
 
     return {
@@ -0,0 +1,86 @@
+"""Coalescing of identical in-flight Aula requests."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+
+
+def _freeze(value: Any) -> Hashable:
+    """Turn call arguments into something usable as a dict key."""
+    if isinstance(value, (set, frozenset)):
+        # Same members, same key, whatever order they iterate in.
+        return frozenset(_freeze(item) for item in value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    return value
+
+
+class AulaSingleFlight:
+    """
+    Share one Aula request between callers that ask for the same thing at once.
+
+    A call made while an identical one (same method of the same client, same
+    arguments) is still running waits for that one's result instead of going
+    to Aula again. Callers therefore share the result object and must not
+    mutate it. A client rebuilt after a token refresh is another client, so
+    its calls never join one still running on the client it replaced.
+    """
+
+    def __init__(self) -> None:
+        """Initialize with nothing in flight."""
+        self._in_flight: dict[Hashable, asyncio.Future[Any]] = {}
+        self._calls: Counter[str] = Counter()
+        self._shared: Counter[str] = Counter()
+
+    async def async_call[**P, R](
+        self,
+        method: Callable[P, Awaitable[R]],
+        *args: P.args,
+        **kwargs: P.kwargs,
+    ) -> R:
+        """Call a client method, or join an identical call already running."""
+        name: str = getattr(method, "__name__", None) or repr(method)
+        # A bound method's object stays alive while its call is in flight,
+        # so its id cannot be reused by another client meanwhile.
+        owner = id(getattr(method, "__self__", None))
+        qualname = getattr(method, "__qualname__", None) or name
+        try:
+            key = (owner, qualname, _freeze(args), _freeze(kwargs))
+            future = self._in_flight.get(key)
+        except TypeError:
+            # Arguments we cannot key on; not worth sharing.
+            return await method(*args, **kwargs)
+
+        self._calls[name] += 1
+        if future is not None:
+            self._shared[name] += 1
+        else:
+            future = asyncio.ensure_future(method(*args, **kwargs))
+            self._in_flight[key] = future
+            future.add_done_callback(partial(self._async_call_done, key))
+        # Shielded, so one caller giving up does not cancel it for the rest.
+        return await asyncio.shield(future)
+
+    def _async_call_done(self, key: Hashable, future: asyncio.Future[Any]) -> None:
+        """Forget a finished call."""
+        self._in_flight.pop(key, None)
+        # Retrieve a failure here, in case every waiter gave up before it
+        # came; asyncio would otherwise log it as never retrieved.
+        if not future.cancelled():
+            future.exception()
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return call and sharing counts for diagnostics."""
+        return {
+            "in_flight": len(self._in_flight),
+            "calls": dict(self._calls),
+            "shared": dict(self._shared),
+        }
@@ -0,0 +1,90 @@
+"""Persistent snapshots of coordinator data for the Aula integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, SNAPSHOT_SAVE_DELAY, SNAPSHOT_STORAGE_VERSION
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant
+
+
+class AulaSnapshotStore:
+    """
+    Last good data of every coordinator of one config entry, kept on disk.
+
+    Each coordinator owns one slot, stamped with the schema version of its
+    serialized shape and the time it was saved. A slot written under another
+    schema is dropped on read rather than migrated: the next poll rebuilds it.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the snapshot store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass,
+            SNAPSHOT_STORAGE_VERSION,
+            f"{DOMAIN}.{entry_id}.snapshots",
+            private=True,
+        )
+        self._slots: dict[str, dict[str, Any]] = {}
+        self._pending = False
+        self._closed = False
+
+    async def async_load(self) -> None:
+        """Read the stored snapshots into memory."""
+        stored = await self._store.async_load()
+        if stored and isinstance(stored.get("slots"), dict):
+            self._slots = stored["slots"]
+
+    @callback
+    def async_get(self, key: str, schema: int) -> tuple[Any, datetime] | None:
+        """Return a slot's data and save time, or None if missing or outdated."""
+        slot = self._slots.get(key)
+        if not slot or slot.get("schema") != schema:
+            return None
+        saved_at = dt_util.parse_datetime(slot.get("saved_at") or "")
+        if saved_at is None:
+            return None
+        return slot.get("data"), saved_at
+
+    @callback
+    def async_set(self, key: str, schema: int, data: Any) -> None:
+        """Replace a slot and schedule a write, unless the store was flushed."""
+        if self._closed:
+            return
+        self._slots[key] = {
+            "schema": schema,
+            "saved_at": dt_util.utcnow().isoformat(),
+            "data": data,
+        }
+        self._pending = True
+        self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    async def async_flush(self) -> None:
+        """
+        Write a scheduled change now, and take no more.
+
+        Called when the entry unloads, so a delayed write cannot land after a
+        reload has read the file, or after the entry's removal deleted it.
+        """
+        self._closed = True
+        if self._pending:
+            self._pending = False
+            # Replaces the delayed write rather than adding to it.
+            await self._store.async_save(self._data_to_save())
+
+    async def async_remove(self) -> None:
+        """Delete the stored snapshots."""
+        self._slots = {}
+        await self._store.async_remove()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        return {"slots": self._slots}
@@ -0,0 +1,62 @@
+"""A child's calendar events, ordered for finding the next one."""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from itertools import accumulate
+from typing import TYPE_CHECKING
+
+from homeassistant.components.calendar import CalendarEvent
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from datetime import datetime
+
+    from aula import CalendarEvent as AulaCalendarEvent
+
+
+def convert_event(event: AulaCalendarEvent) -> CalendarEvent:
+    """Convert an Aula calendar event to a HA calendar event."""
+    description_parts: list[str] = []
+    if event.teacher_name:
+        description_parts.append(f"Teacher: {event.teacher_name}")
+    if event.has_substitute and event.substitute_name:
+        description_parts.append(f"Substitute: {event.substitute_name}")
+    if event.location:
+        description_parts.append(f"Location: {event.location}")
+
+    return CalendarEvent(
+        summary=event.title,
+        start=event.start_datetime,
+        end=event.end_datetime,
+        description="\n".join(description_parts) if description_parts else None,
+        location=event.location,
+    )
+
+
+class EventTimeline:
+    """
+    A child's events sorted by start and converted for Home Assistant once.
+
+    The next event is the earliest-starting one that has not ended. Next to
+    the events, the latest end of any event so far is kept; it only grows,
+    so the first event with an end after a moment is found by bisecting it,
+    however events overlap.
+    """
+
+    __slots__ = ("_ends", "_events")
+
+    def __init__(self, events: Iterable[AulaCalendarEvent]) -> None:
+        """Sort and convert a child's events."""
+        ordered = sorted(events, key=lambda event: event.start_datetime)
+        self._events = [convert_event(event) for event in ordered]
+        self._ends = list(accumulate((event.end_datetime for event in ordered), max))
+
+    def __len__(self) -> int:
+        """Return the number of events."""
+        return len(self._events)
+
+    def next_event(self, now: datetime) -> CalendarEvent | None:
+        """Return the event under way or coming up next, if any."""
+        index = bisect_right(self._ends, now)
+        return self._events[index] if index < len(self._events) else None
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import ssl
 import time
 from typing import TYPE_CHECKING, Any
 
@@ -11,9 +10,10 @@ import httpx
 from aula import AulaAuthenticationError, create_client
 from aula.auth.exceptions import MitIDAuthError
 from aula.auth.mitid_client import MitIDAuthClient
-from aula.http_httpx import HttpxHttpClient
 
+from .auth_transport import async_get_auth_transport
 from .const import CONF_TOKEN_DATA, LOGGER
+from .http_client import async_create_http_client
 
 if TYPE_CHECKING:
     from aula import AulaApiClient
@@ -32,6 +32,12 @@ class AulaTokenManager:
         self._hass = hass
         self._entry = entry
         self._lock = asyncio.Lock()
+        # Refreshes made on a fresh connection (cold) and on one kept open
+        # from an earlier auth request (warm), with the latest duration of each.
+        self.refresh_stats: dict[str, dict[str, Any]] = {
+            "cold": {"count": 0, "last_ms": None},
+            "warm": {"count": 0, "last_ms": None},
+        }
 
     async def async_refresh_token(self) -> tuple[AulaApiClient, dict[str, Any]]:
         """Refresh token and return a new client for setup-time use."""
@@ -77,11 +83,11 @@ class AulaTokenManager:
         self, token_data: dict[str, Any], refresh_token: str
     ) -> dict[str, Any]:
         """Perform the actual token refresh via MitIDAuthClient."""
-        ssl_context = await self._hass.async_add_executor_job(
-            ssl.create_default_context,
-        )
+        transport = async_get_auth_transport(self._hass)
+        warmth = "warm" if transport.is_warm else "cold"
+        started = time.monotonic()
         httpx_client = httpx.AsyncClient(
-            verify=ssl_context,
+            transport=transport,
             follow_redirects=False,
             timeout=30,
         )
@@ -97,6 +103,12 @@ class AulaTokenManager:
         finally:
             await httpx_client.aclose()
 
+        elapsed_ms = round((time.monotonic() - started) * 1000)
+        stats = self.refresh_stats[warmth]
+        stats["count"] += 1
+        stats["last_ms"] = elapsed_ms
+        LOGGER.debug("Token refreshed in %d ms on a %s connection", elapsed_ms, warmth)
+
         username = token_data.get("username", "")
         cookies = token_data.get("cookies", {})
         return {
@@ -110,7 +122,7 @@ class AulaTokenManager:
     async def _async_create_client(self, token_data: dict[str, Any]) -> AulaApiClient:
         """Create a new AulaApiClient from token data."""
         cookies = token_data.get("cookies", {})
-        http_client = await self._hass.async_add_executor_job(HttpxHttpClient, cookies)
+        http_client = async_create_http_client(self._hass, cookies)
         try:
             return await create_client(token_data, http_client=http_client)
         except Exception:
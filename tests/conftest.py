@@ -153,6 +153,8 @@ def mock_presence_templates(
     by_date: str = "2024-01-15",
     self_decider_start: str | None = None,
     self_decider_end: str | None = None,
+    entry_time: str | None = None,
+    exit_time: str | None = None,
 ) -> list[MagicMock]:
     """Create a mock PresenceWeekTemplate list with spare time activity."""
     from aula.models.presence_template import (
@@ -169,6 +171,9 @@ def mock_presence_templates(
 
     day = MagicMock(spec=DayTemplate)
     day.by_date = by_date
+    day.is_on_vacation = False
+    day.entry_time = entry_time
+    day.exit_time = exit_time
     day.spare_time_activity = sta
 
     ip = MagicMock()
@@ -231,6 +236,7 @@ def mock_message_thread(
     subject: str = "Skolefest",
     participants: list[str] | None = None,
     last_updated: str | None = "2026-08-10T07:00:00+00:00",
+    read: bool | None = None,
 ) -> MagicMock:
     """Create a mock MessageThread object."""
     thread = MagicMock(spec=MessageThread)
@@ -242,6 +248,8 @@ def mock_message_thread(
         "participants": [{"name": n} for n in (participants or ["Anne Jensen"])],
         "lastUpdatedDate": last_updated,
     }
+    if read is not None:
+        thread._raw["read"] = read
     return thread
 
 
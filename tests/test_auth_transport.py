@@ -0,0 +1,43 @@
+"""Tests for the shared auth transport."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import httpx
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE
+from homeassistant.core import HomeAssistant
+
+from custom_components.hass_aula.auth_transport import async_get_auth_transport
+
+
+def _respond(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"url": str(request.url)})
+
+
+async def test_transport_outlives_its_clients(hass: HomeAssistant) -> None:
+    """Test clients share one transport, and closing one leaves it usable."""
+    transport = async_get_auth_transport(hass)
+    assert async_get_auth_transport(hass) is transport
+    transport._transport = httpx.MockTransport(_respond)
+    assert not transport.is_warm
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        await client.get("https://login.aula.dk/token")
+    assert transport.is_warm
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        response = await client.get("https://login.aula.dk/token")
+    assert response.json() == {"url": "https://login.aula.dk/token"}
+    assert transport.requests == 2
+
+
+async def test_transport_closes_with_home_assistant(hass: HomeAssistant) -> None:
+    """Test the pool is closed when Home Assistant stops."""
+    transport = async_get_auth_transport(hass)
+    transport._transport = AsyncMock()
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_CLOSE)
+    await hass.async_block_till_done()
+
+    transport._transport.aclose.assert_awaited_once()
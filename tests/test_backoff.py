@@ -0,0 +1,32 @@
+"""Tests for the Aula poll backoff."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+from custom_components.hass_aula.backoff import AulaBackoff
+
+
+def test_backoff_grows_within_ceiling() -> None:
+    """Test delays stay between the interval and the doubling window."""
+    backoff = AulaBackoff(ceiling=1000)
+    interval = timedelta(seconds=100)
+
+    delays = [backoff.next_delay(interval).total_seconds() for _ in range(6)]
+
+    assert 100 <= delays[0] <= 200
+    assert 100 <= delays[1] <= 400
+    assert all(delay <= 1000 for delay in delays)
+    assert backoff.failures == 6
+
+
+def test_backoff_resets_after_success() -> None:
+    """Test one good poll ends the failure streak but keeps the counters."""
+    backoff = AulaBackoff(ceiling=10000)
+
+    backoff.next_delay(timedelta(seconds=60))
+    assert backoff.active is True
+    backoff.reset()
+
+    assert backoff.active is False
+    assert backoff.as_dict()["backoffs"] == 1
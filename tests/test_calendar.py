@@ -2,11 +2,23 @@
 
 from __future__ import annotations
 
+import asyncio
+from datetime import datetime, timedelta
 from unittest.mock import AsyncMock
 
+import pytest
+from aula import AulaServerError
+from freezegun.api import FrozenDateTimeFactory
 from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
 
-from .conftest import make_config_entry, mock_calendar_event
+from .conftest import (
+    make_config_entry,
+    mock_calendar_event,
+    mock_child,
+    mock_profile,
+)
 
 
 async def test_calendar_entity_created(
@@ -61,6 +73,89 @@ async def test_calendar_empty(
     assert state.state == "off"
 
 
+async def test_calendar_state_follows_event_between_polls(
+    hass: HomeAssistant,
+    mock_aula_client: AsyncMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the state turns on and off at the event's times without a poll."""
+    tz = dt_util.get_default_time_zone()
+    freezer.move_to(datetime(2024, 1, 15, 7, 0, tzinfo=tz))
+    event = mock_calendar_event(
+        start=datetime(2024, 1, 15, 7, 30, tzinfo=tz),
+        end=datetime(2024, 1, 15, 7, 45, tzinfo=tz),
+        belongs_to=1,
+    )
+    mock_aula_client.get_calendar_events = AsyncMock(return_value=[event])
+
+    entry = make_config_entry()
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    fetches = mock_aula_client.get_calendar_events.await_count
+
+    assert hass.states.get("calendar.test_child_school_calendar").state == "off"
+
+    freezer.move_to(datetime(2024, 1, 15, 7, 30, 1, tzinfo=tz))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get("calendar.test_child_school_calendar").state == "on"
+
+    freezer.move_to(datetime(2024, 1, 15, 7, 45, 1, tzinfo=tz))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    assert hass.states.get("calendar.test_child_school_calendar").state == "off"
+
+    assert mock_aula_client.get_calendar_events.await_count == fetches
+
+
+async def test_calendar_state_moves_on_to_overlapping_event(
+    hass: HomeAssistant,
+    mock_aula_client: AsyncMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the timers set at one event's end move the state to the next."""
+    tz = dt_util.get_default_time_zone()
+    freezer.move_to(datetime(2024, 1, 15, 7, 0, tzinfo=tz))
+    mock_aula_client.get_calendar_events = AsyncMock(
+        return_value=[
+            mock_calendar_event(
+                title="Excursion",
+                start=datetime(2024, 1, 15, 7, 30, tzinfo=tz),
+                end=datetime(2024, 1, 15, 8, 0, tzinfo=tz),
+                belongs_to=1,
+            ),
+            mock_calendar_event(
+                event_id=2,
+                title="Math",
+                start=datetime(2024, 1, 15, 7, 45, tzinfo=tz),
+                end=datetime(2024, 1, 15, 8, 30, tzinfo=tz),
+                belongs_to=1,
+            ),
+        ]
+    )
+
+    entry = make_config_entry()
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    fetches = mock_aula_client.get_calendar_events.await_count
+
+    for moment, state, message in (
+        (datetime(2024, 1, 15, 7, 30, 1, tzinfo=tz), "on", "Excursion"),
+        (datetime(2024, 1, 15, 8, 0, 1, tzinfo=tz), "on", "Math"),
+        (datetime(2024, 1, 15, 8, 30, 1, tzinfo=tz), "off", None),
+    ):
+        freezer.move_to(moment)
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        calendar = hass.states.get("calendar.test_child_school_calendar")
+        assert calendar.state == state
+        assert calendar.attributes.get("message") == message
+
+    assert mock_aula_client.get_calendar_events.await_count == fetches
+
+
 async def test_calendar_event_with_substitute(
     hass: HomeAssistant,
     mock_aula_client: AsyncMock,
@@ -103,3 +198,139 @@ async def test_calendar_event_with_location(
 
     state = hass.states.get("calendar.test_child_school_calendar")
     assert state is not None
+
+
+async def _get_events(
+    hass: HomeAssistant, start: datetime, end: datetime
+) -> list[dict[str, object]]:
+    response = await hass.services.async_call(
+        "calendar",
+        "get_events",
+        {"start_date_time": start, "end_date_time": end},
+        target={"entity_id": "calendar.test_child_school_calendar"},
+        blocking=True,
+        return_response=True,
+    )
+    return response["calendar.test_child_school_calendar"]["events"]
+
+
+async def test_get_events_inside_window_uses_no_request(
+    hass: HomeAssistant,
+    mock_aula_client: AsyncMock,
+) -> None:
+    """Test a range inside the synced window is answered from memory."""
+    today = dt_util.start_of_local_day()
+    event = mock_calendar_event(
+        start=today + timedelta(days=2, hours=9),
+        end=today + timedelta(days=2, hours=10),
+    )
+    mock_aula_client.get_calendar_events = AsyncMock(return_value=[event])
+
+    entry = make_config_entry()
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    mock_aula_client.get_calendar_events.reset_mock()
+
+    events = await _get_events(hass, today, today + timedelta(days=7))
+
+    assert [e["summary"] for e in events] == ["Math Class"]
+    mock_aula_client.get_calendar_events.assert_not_called()
+
+
+async def test_get_events_outside_window_is_cached(
+    hass: HomeAssistant,
+    mock_aula_client: AsyncMock,
+) -> None:
+    """Test an earlier range is fetched once, then served stale on errors."""
+    entry = make_config_entry()
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    today = dt_util.start_of_local_day()
+    past = mock_calendar_event(
+        start=today - timedelta(days=3, hours=-9),
+        end=today - timedelta(days=3, hours=-10),
+    )
+    mock_aula_client.get_calendar_events = AsyncMock(return_value=[past])
+    start, end = today - timedelta(days=7), today
+
+    assert len(await _get_events(hass, start, end)) == 1
+    assert len(await _get_events(hass, start, end)) == 1
+    mock_aula_client.get_calendar_events.assert_awaited_once()
+    assert mock_aula_client.get_calendar_events.await_args.kwargs[
+        "institution_profile_ids"
+    ] == [1]
+
+    coordinator = entry.runtime_data.calendar_coordinator
+    for key, bucket in coordinator._ranges.items():
+        coordinator._ranges[key] = type(bucket)(
+            bucket.fetched_at - timedelta(hours=1), bucket.events
+        )
+    mock_aula_client.get_calendar_events.side_effect = AulaServerError("Down", 503)
+
+    assert len(await _get_events(hass, start, end)) == 1
+
+
+async def test_sibling_lookups_share_one_request(
+    hass: HomeAssistant,
+    mock_aula_client: AsyncMock,
+) -> None:
+    """Test siblings asking for the same range at once cost one request."""
+    mock_aula_client.get_profile = AsyncMock(
+        return_value=mock_profile(
+            children=[mock_child(), mock_child(child_id=2, name="Other Child")]
+        )
+    )
+    entry = make_config_entry()
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    today = dt_util.start_of_local_day()
+    start, end = today - timedelta(days=7), today
+    mock_aula_client.get_calendar_events = AsyncMock(
+        return_value=[
+            mock_calendar_event(event_id=1, belongs_to=1, start=start, end=end),
+            mock_calendar_event(event_id=2, belongs_to=2, start=start, end=end),
+        ]
+    )
+    coordinator = entry.runtime_data.calendar_coordinator
+
+    first, second = await asyncio.gather(
+        coordinator.async_get_events(1, start, end),
+        coordinator.async_get_events(2, start, end),
+    )
+
+    assert [event.id for event in first] == [1]
+    assert [event.id for event in second] == [2]
+    mock_aula_client.get_calendar_events.assert_awaited_once()
+    assert mock_aula_client.get_calendar_events.await_args.kwargs[
+        "institution_profile_ids"
+    ] == [1, 2]
+
+
+async def test_range_lookup_released_when_unloaded(
+    hass: HomeAssistant,
+    mock_aula_client: AsyncMock,
+) -> None:
+    """Test a lookup waiting on a batch is released when the entry unloads."""
+    entry = make_config_entry()
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    today = dt_util.start_of_local_day()
+    start, end = today - timedelta(days=7), today
+    mock_aula_client.get_calendar_events = AsyncMock(return_value=[])
+    coordinator = entry.runtime_data.calendar_coordinator
+
+    lookup = asyncio.ensure_future(coordinator.async_get_events(1, start, end))
+    await asyncio.sleep(0)
+    await hass.config_entries.async_unload(entry.entry_id)
+
+    with pytest.raises(asyncio.CancelledError):
+        await lookup
+    assert coordinator._pending_ranges == {}
+    mock_aula_client.get_calendar_events.assert_not_awaited()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -11,12 +12,23 @@ from aula import (
     AulaRateLimitError,
     AulaServerError,
 )
+from freezegun.api import FrozenDateTimeFactory
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed
 from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util import dt as dt_util
 
 from custom_components.hass_aula.const import (
+    BACKOFF_MAX_INTERVAL,
+    CALENDAR_NEAR_DAYS,
+    CALENDAR_WINDOW_DAYS,
+    MAX_MESSAGE_ITEMS,
     MAX_PREVIEW_CHARS,
+    MESSAGES_UNREAD_RECHECK_INTERVAL,
+    PRESENCE_BOUNDARY_POLL_INTERVAL,
+    PRESENCE_IDLE_POLL_INTERVAL,
+    PRESENCE_MIDDAY_POLL_INTERVAL,
+    PRESENCE_POLL_INTERVAL,
     WIDGET_MIN_UDDANNELSE_SSO,
     WIDGET_MIN_UDDANNELSE_TASKS,
 )
@@ -30,10 +42,16 @@ from custom_components.hass_aula.coordinator import (
     AulaMUTasksCoordinator,
     AulaMUUgeplanCoordinator,
     AulaPresenceCoordinator,
+    _presence_poll_interval,
 )
 from custom_components.hass_aula.data import (
     WidgetContext,
 )
+from custom_components.hass_aula.scheduler import (
+    AulaRequestScheduler,
+    RequestPriority,
+)
+from custom_components.hass_aula.store import AulaSnapshotStore
 
 from .conftest import (
     mock_appointment,
@@ -48,6 +66,7 @@ from .conftest import (
     mock_mu_task,
     mock_mu_weekly_letter,
     mock_mu_weekly_person,
+    mock_presence_templates,
     mock_profile,
     mock_team_reminder,
     mock_user_reminders,
@@ -199,6 +218,115 @@ async def test_presence_coordinator_rate_limit_error(hass: HomeAssistant) -> Non
         await coordinator._async_update_data()
 
 
+async def test_presence_coordinator_backs_off_until_recovery(
+    hass: HomeAssistant,
+) -> None:
+    """Test Aula failures stretch the interval until the next good poll."""
+    client = AsyncMock()
+    client.get_daily_overview = AsyncMock(
+        side_effect=AulaServerError("Unavailable", 503)
+    )
+    client.get_presence_templates = AsyncMock(return_value=[])
+    coordinator = AulaPresenceCoordinator(
+        hass, client, mock_profile(), _create_token_manager()
+    )
+    coordinator.config_entry = _create_config_entry()
+    regular = coordinator.update_interval
+
+    for _ in range(3):
+        with pytest.raises(UpdateFailed):
+            await coordinator._async_update_data()
+        assert (
+            regular
+            <= coordinator.update_interval
+            <= timedelta(seconds=BACKOFF_MAX_INTERVAL)
+        )
+    assert coordinator.backoff.failures == 3
+    assert coordinator.backoff.polls_saved >= 0
+
+    client.get_daily_overview = AsyncMock(return_value=mock_daily_overview())
+    await coordinator._async_update_data()
+
+    # No plan to poll by, so presence is back on its regular interval.
+    assert coordinator.update_interval == regular
+    assert coordinator.backoff.as_dict()["active"] is False
+    assert coordinator.backoff.backoffs == 3
+
+
+def _plan(*hours_minutes: tuple[int, int]) -> list[datetime]:
+    """Build planned boundary times on 2024-01-15 (a Monday), in UTC."""
+    return [datetime(2024, 1, 15, h, m, tzinfo=UTC) for h, m in hours_minutes]
+
+
+def test_presence_poll_interval_without_plan() -> None:
+    """Test the fixed interval applies when no plan is known."""
+    now = datetime(2024, 1, 15, 12, 0, tzinfo=UTC)
+
+    assert _presence_poll_interval(now, [], on_site=False) == timedelta(
+        seconds=PRESENCE_POLL_INTERVAL
+    )
+
+
+def test_presence_poll_interval_near_boundary() -> None:
+    """Test presence polls fast around a planned check-out."""
+    now = datetime(2024, 1, 15, 14, 55, tzinfo=UTC)
+
+    assert _presence_poll_interval(
+        now, _plan((8, 0), (15, 0)), on_site=True
+    ) == timedelta(seconds=PRESENCE_BOUNDARY_POLL_INTERVAL)
+
+
+def test_presence_poll_interval_midday() -> None:
+    """Test presence slows down between the day's planned times."""
+    now = datetime(2024, 1, 15, 11, 0, tzinfo=UTC)
+
+    assert _presence_poll_interval(
+        now, _plan((8, 0), (15, 0)), on_site=True
+    ) == timedelta(seconds=PRESENCE_MIDDAY_POLL_INTERVAL)
+
+
+def test_presence_poll_interval_wakes_for_next_window() -> None:
+    """Test presence sleeps until shortly before the next planned time."""
+    now = datetime(2024, 1, 15, 6, 0, tzinfo=UTC)
+
+    # 08:00 check-in, with the 15-minute window opening at 07:45.
+    assert _presence_poll_interval(
+        now, _plan((8, 0), (15, 0)), on_site=False
+    ) == timedelta(hours=1, minutes=45)
+
+
+def test_presence_poll_interval_idle_ceiling() -> None:
+    """Test presence never sleeps past the idle ceiling outside hours."""
+    now = datetime(2024, 1, 15, 18, 0, tzinfo=UTC)
+    plan = [*_plan((8, 0), (15, 0)), datetime(2024, 1, 18, 8, 0, tzinfo=UTC)]
+
+    assert _presence_poll_interval(now, plan, on_site=False) == timedelta(
+        seconds=PRESENCE_IDLE_POLL_INTERVAL
+    )
+
+
+async def test_presence_coordinator_adapts_interval(hass: HomeAssistant) -> None:
+    """Test the presence coordinator sets its interval from the templates."""
+    today = datetime.now(UTC).date().isoformat()
+    client = AsyncMock()
+    client.get_daily_overview = AsyncMock(return_value=mock_daily_overview())
+    client.get_presence_templates = AsyncMock(
+        return_value=mock_presence_templates(
+            by_date=today, entry_time="00:00", exit_time="23:59"
+        )
+    )
+
+    coordinator = AulaPresenceCoordinator(
+        hass, client, mock_profile(), _create_token_manager()
+    )
+    coordinator.config_entry = _create_config_entry()
+
+    await coordinator._async_update_data()
+
+    assert len(coordinator.plan_boundaries) == 2
+    assert coordinator.update_interval != timedelta(seconds=PRESENCE_POLL_INTERVAL)
+
+
 # --- Calendar Coordinator Tests ---
 
 
@@ -222,6 +350,37 @@ async def test_calendar_coordinator_fetch(hass: HomeAssistant) -> None:
     assert data[1][0] is event
 
 
+async def test_calendar_coordinator_refetches_only_stale_days(
+    hass: HomeAssistant,
+) -> None:
+    """Test a second poll refetches the near days and keeps the rest."""
+    client = AsyncMock()
+    today = dt_util.start_of_local_day()
+    later = mock_calendar_event(
+        event_id=2, start=today + timedelta(days=20, hours=9), belongs_to=1
+    )
+    client.get_calendar_events = AsyncMock(return_value=[mock_calendar_event(), later])
+    coordinator = AulaCalendarCoordinator(
+        hass, client, mock_profile(), _create_token_manager()
+    )
+    coordinator.config_entry = _create_config_entry()
+
+    await coordinator._async_update_data()
+    first = client.get_calendar_events.await_args.kwargs
+    assert first["start"] == today
+    assert first["end"] == today + timedelta(days=CALENDAR_WINDOW_DAYS)
+
+    client.get_calendar_events = AsyncMock(return_value=[])
+    data = await coordinator._async_update_data()
+
+    client.get_calendar_events.assert_awaited_once()
+    second = client.get_calendar_events.await_args.kwargs
+    assert second["start"] == today
+    assert second["end"] == today + timedelta(days=CALENDAR_NEAR_DAYS)
+    # The near days came back empty; the far-off event is still cached.
+    assert data[1] == [later]
+
+
 async def test_calendar_coordinator_auth_error(hass: HomeAssistant) -> None:
     """Test calendar coordinator raises ConfigEntryAuthFailed on auth error."""
     client = AsyncMock()
@@ -293,6 +452,56 @@ async def test_library_coordinator_fetch(hass: HomeAssistant) -> None:
     assert len(data[1].reservations) == 1
 
 
+async def test_unchanged_child_is_not_called_back(hass: HomeAssistant) -> None:
+    """Only listeners of a child whose data changed are called back."""
+    from .conftest import mock_child
+
+    def loan(patron: str, title: str) -> MagicMock:
+        item = mock_library_loan(title=title, patron_display_name=patron)
+        item._raw = {"title": title, "patronDisplayName": patron}
+        return item
+
+    client = AsyncMock()
+    client.widgets = MagicMock()
+    client.widgets.get_library_status = AsyncMock(
+        return_value=mock_library_status(
+            loans=[loan("Alice", "Matilda"), loan("Bob", "Momo")]
+        )
+    )
+    profile = mock_profile(
+        [mock_child(child_id=1, name="Alice"), mock_child(child_id=2, name="Bob")]
+    )
+    coordinator = AulaLibraryCoordinator(
+        hass, client, profile, _create_widget_context(), _create_token_manager()
+    )
+    coordinator.config_entry = _create_config_entry()
+    called: list[int | None] = []
+    removers = [
+        coordinator.async_add_listener(
+            lambda context=context: called.append(context), context
+        )
+        for context in (1, 2, None)
+    ]
+
+    await coordinator.async_refresh()
+    assert sorted(called, key=str) == [1, 2, None]
+
+    called.clear()
+    client.widgets.get_library_status.return_value = mock_library_status(
+        loans=[loan("Alice", "Matilda"), loan("Bob", "Ronja")]
+    )
+    await coordinator.async_refresh()
+    assert sorted(called, key=str) == [2, None]
+
+    called.clear()
+    await coordinator.async_refresh()
+    assert called == []
+    assert coordinator.listener_stats == {"called": 5, "skipped": 4}
+
+    for remove in removers:
+        remove()
+
+
 async def test_library_coordinator_auth_error(hass: HomeAssistant) -> None:
     """Test library coordinator raises ConfigEntryAuthFailed on auth error."""
     client = AsyncMock()
@@ -704,6 +913,118 @@ async def test_mu_ugeplan_coordinator_fetch(hass: HomeAssistant) -> None:
     assert data.next_week[1][0].week_number == 6
 
 
+async def test_mu_ugeplan_rolls_next_week_over_without_refetch(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """On a new week, last week's next week becomes current without a fetch."""
+    tz = dt_util.get_default_time_zone()
+    freezer.move_to(datetime(2026, 8, 16, 23, 50, tzinfo=tz))  # Sunday, week 33
+    client = AsyncMock()
+    client.widgets = MagicMock()
+    client.widgets.get_ugeplan = AsyncMock(
+        side_effect=lambda **kwargs: [
+            mock_mu_weekly_person(
+                name="Test Child",
+                letters=[mock_mu_weekly_letter(group_name=kwargs["week"])],
+            )
+        ]
+    )
+    coordinator = AulaMUUgeplanCoordinator(
+        hass,
+        client,
+        mock_profile(),
+        _create_widget_context(),
+        _create_token_manager(),
+    )
+    coordinator.config_entry = _create_config_entry()
+
+    def fetched_weeks() -> list[str]:
+        weeks = [c.kwargs["week"] for c in client.widgets.get_ugeplan.await_args_list]
+        client.widgets.get_ugeplan.reset_mock()
+        return weeks
+
+    await coordinator._async_update_data()
+    assert fetched_weeks() == ["2026-W33", "2026-W34"]
+
+    freezer.move_to(datetime(2026, 8, 17, 0, 20, tzinfo=tz))  # Monday, week 34
+    data = await coordinator._async_update_data()
+    assert fetched_weeks() == ["2026-W35"]
+    assert data.current[1][0].group_name == "2026-W34"
+    assert data.next_week[1][0].group_name == "2026-W35"
+
+    # Once its next-week TTL runs out, the current week is fetched again.
+    freezer.move_to(datetime(2026, 8, 17, 3, 0, tzinfo=tz))
+    await coordinator._async_update_data()
+    assert fetched_weeks() == ["2026-W34"]
+
+
+async def test_week_cache_prefetches_next_week_late_in_the_week(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Late in the week, next week is fetched ahead and Monday finds it cached."""
+    tz = dt_util.get_default_time_zone()
+    freezer.move_to(datetime(2026, 8, 20, 12, 0, tzinfo=tz))  # Thursday, week 34
+    client = AsyncMock()
+    client.widgets = MagicMock()
+    client.widgets.get_mu_tasks = AsyncMock(return_value=[])
+    coordinator = AulaMUTasksCoordinator(
+        hass,
+        client,
+        mock_profile(),
+        _create_widget_context(),
+        _create_token_manager(),
+        WIDGET_MIN_UDDANNELSE_TASKS,
+    )
+    coordinator.config_entry = _create_config_entry()
+
+    await coordinator._async_update_data()
+    assert client.widgets.get_mu_tasks.await_count == 1
+
+    freezer.move_to(datetime(2026, 8, 23, 23, 50, tzinfo=tz))  # Sunday
+    await coordinator._async_update_data()
+    assert client.widgets.get_mu_tasks.await_count == 3
+
+    freezer.move_to(datetime(2026, 8, 24, 0, 20, tzinfo=tz))  # Monday, week 35
+    await coordinator._async_update_data()
+    assert client.widgets.get_mu_tasks.await_count == 3
+    assert coordinator.week_cache_stats["prefetches"] == 1
+    assert coordinator.week_cache_stats["hits"] == 1
+
+
+async def test_week_cache_keeps_data_for_an_unchanged_response(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """A refetched week with the same content is not distributed again."""
+    freezer.move_to(datetime(2026, 8, 18, 12, 0, tzinfo=UTC))  # Tuesday
+    task = mock_mu_task(student_name="Test Child")
+    task._raw = {"id": "1", "title": "Math Homework"}
+    client = AsyncMock()
+    client.widgets = MagicMock()
+    client.widgets.get_mu_tasks = AsyncMock(return_value=[task])
+    coordinator = AulaMUTasksCoordinator(
+        hass,
+        client,
+        mock_profile(),
+        _create_widget_context(),
+        _create_token_manager(),
+        WIDGET_MIN_UDDANNELSE_TASKS,
+    )
+    coordinator.config_entry = _create_config_entry()
+    first = await coordinator._async_update_data()
+
+    # Expire the cached week, as the next poll would find it.
+    for entry in coordinator._weeks.values():
+        entry.expires_at = dt_util.utcnow()
+    second = await coordinator._async_update_data()
+
+    assert client.widgets.get_mu_tasks.await_count == 2
+    assert second is first
+    assert coordinator.week_cache_stats["unchanged"] == 1
+
+
 async def test_mu_ugeplan_coordinator_auth_error(hass: HomeAssistant) -> None:
     """Test MU ugeplan coordinator raises ConfigEntryAuthFailed on auth error."""
     client = AsyncMock()
@@ -773,6 +1094,123 @@ async def test_messages_coordinator_builds_previews(hass: HomeAssistant) -> None
     assert data.messages[1].unread is False
 
 
+async def test_messages_coordinator_refetches_only_changed_threads(
+    hass: HomeAssistant,
+) -> None:
+    """Test unchanged threads reuse their preview and keep their unread flag fresh."""
+    client = AsyncMock()
+    threads = [
+        mock_message_thread(thread_id="1", subject="Skolefest"),
+        mock_message_thread(thread_id="2", subject="Lejrskole"),
+    ]
+    unread: list[MagicMock] = []
+    client.get_message_threads = AsyncMock(
+        side_effect=lambda filter_on=None: unread if filter_on == "unread" else threads
+    )
+    client.get_messages_for_thread = AsyncMock(return_value=[mock_message()])
+
+    coordinator = AulaMessagesCoordinator(hass, client, _create_token_manager())
+    coordinator.config_entry = _create_config_entry()
+    assert coordinator._request_cost() == 2 + MAX_MESSAGE_ITEMS
+    await coordinator._async_update_data()
+    assert client.get_messages_for_thread.await_count == 2
+
+    # Both previews were fetched; unchanged, the next poll fetches none.
+    assert coordinator._request_cost() == 1 + 2
+    await coordinator._async_update_data()
+    assert client.get_messages_for_thread.await_count == 2
+    assert coordinator._request_cost() == 1
+
+    threads[1] = mock_message_thread(
+        thread_id="2", subject="Lejrskole", last_updated="2026-08-11T09:00:00+00:00"
+    )
+    unread.append(threads[0])
+    data = await coordinator._async_update_data()
+
+    assert client.get_messages_for_thread.await_count == 3
+    assert client.get_messages_for_thread.await_args.args == ("2",)
+    assert data.messages[0].unread is True
+    assert data.messages[0].preview == mock_message().content
+
+
+async def test_messages_coordinator_reads_unread_state_from_listing(
+    hass: HomeAssistant,
+) -> None:
+    """Test read flags stand in for the unread listing once they agree with it."""
+    client = AsyncMock()
+    threads = [
+        mock_message_thread(thread_id="1", read=False),
+        mock_message_thread(thread_id="2", read=True),
+    ]
+    client.get_message_threads = AsyncMock(
+        side_effect=lambda filter_on=None: (
+            threads[:1] if filter_on == "unread" else threads
+        )
+    )
+    client.get_messages_for_thread = AsyncMock(return_value=[mock_message()])
+
+    coordinator = AulaMessagesCoordinator(hass, client, _create_token_manager())
+    coordinator.config_entry = _create_config_entry()
+    await coordinator._async_update_data()
+    assert client.get_message_threads.await_count == 2
+
+    data = await coordinator._async_update_data()
+    assert client.get_message_threads.await_count == 3
+    assert data.unread_count == 1
+    assert [message.unread for message in data.messages] == [True, False]
+
+    # A page of nothing but unread threads may go on past the page, so the
+    # unread listing is asked for the count.
+    threads[1] = mock_message_thread(thread_id="2", read=False)
+    await coordinator._async_update_data()
+    assert client.get_message_threads.await_count == 5
+
+
+async def test_messages_coordinator_reuses_unread_listing_while_unchanged(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test an unchanged thread listing answers for the unread listing."""
+    client = AsyncMock()
+    threads = [
+        mock_message_thread(thread_id="1", subject="Skolefest"),
+        mock_message_thread(thread_id="2", subject="Lejrskole"),
+    ]
+    client.get_message_threads = AsyncMock(
+        side_effect=lambda filter_on=None: (
+            threads[:1] if filter_on == "unread" else threads
+        )
+    )
+    client.get_messages_for_thread = AsyncMock(return_value=[mock_message()])
+
+    coordinator = AulaMessagesCoordinator(hass, client, _create_token_manager())
+    coordinator.config_entry = _create_config_entry()
+    await coordinator._async_update_data()
+    assert client.get_message_threads.await_count == 2
+
+    data = await coordinator._async_update_data()
+    assert client.get_message_threads.await_count == 3
+    assert data.unread_count == 1
+    assert [message.unread for message in data.messages] == [True, False]
+
+    # A new message misses, and the poll after it asks both listings at once.
+    threads[1] = mock_message_thread(
+        thread_id="2", subject="Lejrskole", last_updated="2026-08-11T09:00:00+00:00"
+    )
+    await coordinator._async_update_data()
+    assert client.get_message_threads.await_count == 5
+    assert coordinator._request_cost() == 2
+    await coordinator._async_update_data()
+    assert client.get_message_threads.await_count == 7
+
+    # Past the recheck interval the unread listing is fetched regardless.
+    await coordinator._async_update_data()
+    assert client.get_message_threads.await_count == 8
+    freezer.tick(timedelta(seconds=MESSAGES_UNREAD_RECHECK_INTERVAL))
+    await coordinator._async_update_data()
+    assert client.get_message_threads.await_count == 10
+
+
 async def test_messages_coordinator_clips_preview(hass: HomeAssistant) -> None:
     """Test messages coordinator clips long message bodies."""
     client = AsyncMock()
@@ -837,3 +1275,56 @@ async def test_messages_coordinator_connection_error(hass: HomeAssistant) -> Non
 
     with pytest.raises(UpdateFailed):
         await coordinator._async_update_data()
+
+
+# --- Snapshot Tests ---
+
+
+async def test_messages_coordinator_snapshot_round_trip(hass: HomeAssistant) -> None:
+    """Test a fetched result is snapshotted and restored by a new coordinator."""
+    client = AsyncMock()
+    client.get_message_threads = AsyncMock(return_value=[mock_message_thread()])
+    client.get_messages_for_thread = AsyncMock(return_value=[mock_message()])
+    store = AulaSnapshotStore(hass, "test_entry")
+
+    coordinator = AulaMessagesCoordinator(hass, client, _create_token_manager())
+    coordinator.config_entry = _create_config_entry()
+    assert coordinator.async_restore_snapshot(store) is False
+    data = await coordinator._async_update_data()
+
+    restored = AulaMessagesCoordinator(hass, client, _create_token_manager())
+    restored.config_entry = _create_config_entry()
+    assert restored.async_restore_snapshot(store) is True
+    assert restored.restored_from_snapshot is True
+    assert restored.data == data
+    assert restored.data_age is not None
+
+    # The restored previews spare the next poll its per-thread fetches.
+    client.get_messages_for_thread.reset_mock()
+    await restored._async_update_data()
+    client.get_messages_for_thread.assert_not_called()
+
+
+# --- Request Budget Tests ---
+
+
+async def test_widget_coordinator_defers_poll_when_budget_is_short(
+    hass: HomeAssistant,
+) -> None:
+    """Test a widget poll keeps its data instead of queueing for budget."""
+    client = AsyncMock()
+    client.widgets = MagicMock()
+    client.widgets.get_ugeplan = AsyncMock(return_value=[])
+    scheduler = AulaRequestScheduler(capacity=2, refill_rate=0.001)
+    await scheduler.async_acquire(RequestPriority.USER, 2)
+
+    coordinator = AulaMUUgeplanCoordinator(
+        hass, client, mock_profile(), _create_widget_context(), _create_token_manager()
+    )
+    coordinator.config_entry = _create_config_entry()
+    coordinator.request_scheduler = scheduler
+    coordinator.data = previous = MagicMock()
+
+    assert await coordinator._async_update_data() is previous
+    client.widgets.get_ugeplan.assert_not_called()
+    assert scheduler.as_dict()["deferred"]["background"] == 1
@@ -47,6 +47,7 @@ async def test_diagnostics_structure(
     assert "calendar_event_counts" in result
     assert "profile_id" in result["profile"]
     assert "children" in result["profile"]
+    assert result["request_budget"]["granted"]["core"] >= 4
 
 
 async def test_diagnostics_presence_data(
@@ -0,0 +1,117 @@
+"""Tests for the aiohttp-backed Aula HTTP client."""
+
+from __future__ import annotations
+
+import aiohttp
+import pytest
+from aula import AulaConnectionError, AulaNotFoundError
+from aula.const import USER_AGENT
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.test_util.aiohttp import (
+    AiohttpClientMocker,
+)
+
+from custom_components.hass_aula.http_client import async_create_http_client
+
+URL = "https://www.aula.dk/api/v24/"
+
+
+async def test_cookies_are_seeded_per_client(hass: HomeAssistant) -> None:
+    """Test each client reads the cookies it was created with, and only those."""
+    first = async_create_http_client(hass, {"Csrfp-Token": "first"})
+    second = async_create_http_client(hass, {"Csrfp-Token": "second"})
+
+    assert first.get_cookie("Csrfp-Token") == "first"
+    assert second.get_cookie("Csrfp-Token") == "second"
+    assert first.get_cookie("PHPSESSID") is None
+
+    await first.close()
+    await second.close()
+
+
+async def test_request_parses_json(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test a JSON response is parsed and the request identifies as a browser."""
+    aioclient_mock.get(URL, json={"status": {"code": 0}})
+    client = async_create_http_client(hass, {})
+
+    response = await client.request("GET", URL, headers={"Accept": "*/*"})
+
+    assert response.status_code == 200
+    assert response.json() == {"status": {"code": 0}}
+    headers = aioclient_mock.mock_calls[0][3]
+    assert headers["User-Agent"] == USER_AGENT
+    assert headers["Accept"] == "*/*"
+    await client.close()
+
+
+async def test_request_encodes_params_like_httpx(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test bool, None and list params are sent the way httpx sent them."""
+    aioclient_mock.get(URL, json={})
+    client = async_create_http_client(hass, {})
+
+    await client.request(
+        "GET",
+        URL,
+        params={
+            "method": "calendar.getEventsByProfileIdsAndResourceIds",
+            "onlyUnread": True,
+            "includeArchived": False,
+            "filter": None,
+            "instProfileIds[]": [1, 2],
+            "limit": 10,
+        },
+    )
+
+    query = aioclient_mock.mock_calls[0][1].query
+    assert query["method"] == "calendar.getEventsByProfileIdsAndResourceIds"
+    assert query["onlyUnread"] == "true"
+    assert query["includeArchived"] == "false"
+    assert "filter" not in query
+    assert query.getall("instProfileIds[]") == ["1", "2"]
+    assert query["limit"] == "10"
+    await client.close()
+
+
+async def test_request_without_json(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test a response that is not JSON leaves the data empty."""
+    aioclient_mock.get(URL, text="<html></html>", status=502)
+    client = async_create_http_client(hass, {})
+
+    response = await client.request("GET", URL)
+
+    assert response.status_code == 502
+    assert response.data is None
+    await client.close()
+
+
+async def test_network_errors_become_connection_errors(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test aiohttp errors are raised as aula's connection error."""
+    aioclient_mock.get(URL, exc=aiohttp.ClientConnectionError())
+    aioclient_mock.get(f"{URL}timeout", exc=TimeoutError())
+    client = async_create_http_client(hass, {})
+
+    with pytest.raises(AulaConnectionError):
+        await client.request("GET", URL)
+    with pytest.raises(AulaConnectionError):
+        await client.download_bytes(f"{URL}timeout")
+    await client.close()
+
+
+async def test_download_raises_for_status(
+    hass: HomeAssistant, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test a failed download raises aula's error for its status."""
+    aioclient_mock.get(f"{URL}file.pdf", status=404)
+    client = async_create_http_client(hass, {})
+
+    with pytest.raises(AulaNotFoundError):
+        await client.download_bytes(f"{URL}file.pdf")
+    await client.close()
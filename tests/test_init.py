@@ -2,18 +2,31 @@
 
 from __future__ import annotations
 
+import time
+from datetime import timedelta
+from typing import Any
 from unittest.mock import AsyncMock, patch
 
 from aula import AulaAuthenticationError, AulaConnectionError
 from homeassistant.config_entries import ConfigEntryState
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STARTED, STATE_UNAVAILABLE
+from homeassistant.core import CoreState, HomeAssistant
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
 
 from custom_components.hass_aula.const import (
+    CONF_MITID_USERNAME,
+    CONF_TOKEN_DATA,
     CONF_WIDGETS,
     CONFIG_ENTRY_MINOR_VERSION,
     DOMAIN,
     LEGACY_WIDGET_EASYIQ,
+    SNAPSHOT_SAVE_DELAY,
     WIDGET_BIBLIOTEKET,
     WIDGET_EASYIQ_HOMEWORK,
     WIDGET_EASYIQ_WEEKPLAN,
@@ -23,6 +36,8 @@ from custom_components.hass_aula.const import (
 )
 
 from .conftest import (
+    MOCK_TOKEN_DATA,
+    MOCK_USERNAME,
     make_config_entry,
     make_widget_config_entry,
     mock_child,
@@ -30,6 +45,65 @@ from .conftest import (
 )
 
 
+def _messages_snapshot(entry_id: str, schema: int = 1) -> dict[str, Any]:
+    """Build stored snapshot data holding only the messages coordinator."""
+    return {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.{entry_id}.snapshots",
+        "data": {
+            "slots": {
+                "messages": {
+                    "schema": schema,
+                    "saved_at": "2026-08-10T07:00:00+00:00",
+                    "data": {
+                        "unread_count": 3,
+                        "messages": [
+                            {
+                                "thread_id": "1",
+                                "subject": "Skolefest",
+                                "sender": "Anne Jensen",
+                                "date": "2026-08-10T07:15:00+00:00",
+                                "unread": True,
+                                "preview": "Kære forældre",
+                            }
+                        ],
+                    },
+                }
+            }
+        },
+    }
+
+
+def _make_session_entry(expires_in: float) -> MockConfigEntry:
+    """Create a config entry whose access token expires this many seconds on."""
+    tokens = {**MOCK_TOKEN_DATA["tokens"], "expires_at": time.time() + expires_in}
+    return make_config_entry(
+        data={
+            CONF_MITID_USERNAME: MOCK_USERNAME,
+            CONF_TOKEN_DATA: {**MOCK_TOKEN_DATA, "tokens": tokens},
+        }
+    )
+
+
+def _profile_snapshot(entry_id: str, raw: dict[str, Any]) -> dict[str, Any]:
+    """Build stored snapshot data holding only a cached profile."""
+    return {
+        "version": 1,
+        "minor_version": 1,
+        "key": f"{DOMAIN}.{entry_id}.snapshots",
+        "data": {
+            "slots": {
+                "profile": {
+                    "schema": 1,
+                    "saved_at": "2026-08-10T07:00:00+00:00",
+                    "data": {"profile": raw, "widget_context": None},
+                }
+            }
+        },
+    }
+
+
 def _make_refreshed_client() -> AsyncMock:
     """Create a mock client as returned by token refresh."""
     client = AsyncMock()
@@ -218,6 +292,33 @@ async def test_unload_entry(
     mock_aula_client.close.assert_called_once()
 
 
+async def test_unload_writes_snapshots_and_removal_deletes_them(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_aula_client: AsyncMock,
+) -> None:
+    """Test unload writes pending snapshots now, and none land after removal."""
+    entry = make_config_entry()
+    entry.add_to_hass(hass)
+    key = f"{DOMAIN}.{entry.entry_id}.snapshots"
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    # Written only after the save delay.
+    assert key not in hass_storage
+
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+    assert hass_storage[key]["data"]["slots"]
+
+    await hass.config_entries.async_remove(entry.entry_id)
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=SNAPSHOT_SAVE_DELAY + 1)
+    )
+    await hass.async_block_till_done()
+    assert key not in hass_storage
+
+
 async def test_stale_device_removal(
     hass: HomeAssistant,
 ) -> None:
@@ -336,6 +437,113 @@ async def test_mu_tasks_prefers_the_opgaver_widget(
     assert coordinator.widget_id == WIDGET_MIN_UDDANNELSE_TASKS
 
 
+async def test_widgets_first_refresh_after_home_assistant_started(
+    hass: HomeAssistant,
+    mock_aula_client: AsyncMock,
+) -> None:
+    """Test widgets do not hold up setup while Home Assistant is starting."""
+    hass.set_state(CoreState.starting)
+    entry = make_widget_config_entry(widgets=[WIDGET_MEEBOOK])
+    entry.add_to_hass(hass)
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    coordinator = entry.runtime_data.meebook_coordinator
+    assert coordinator is not None
+    assert coordinator.last_update_success is True
+    state = hass.states.get("sensor.test_child_meebook_weekplan")
+    assert state.state == STATE_UNAVAILABLE
+    mock_aula_client.widgets.get_meebook_weekplan.assert_not_called()
+    mock_aula_client.get_daily_overview.assert_called()
+
+    hass.set_state(CoreState.running)
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_STARTED)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    mock_aula_client.widgets.get_meebook_weekplan.assert_called_once()
+    state = hass.states.get("sensor.test_child_meebook_weekplan")
+    assert state.state != STATE_UNAVAILABLE
+
+
+async def test_widget_with_all_sensors_disabled_is_not_polled(
+    hass: HomeAssistant,
+    mock_aula_client: AsyncMock,
+) -> None:
+    """Test a widget whose sensors are all disabled gets no coordinator."""
+    entry = make_widget_config_entry(widgets=[WIDGET_BIBLIOTEKET, WIDGET_MEEBOOK])
+    entry.add_to_hass(hass)
+    er.async_get(hass).async_get_or_create(
+        "sensor",
+        DOMAIN,
+        "1_library_loans",
+        config_entry=entry,
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.runtime_data.library_coordinator is None
+    assert entry.runtime_data.meebook_coordinator is not None
+    mock_aula_client.widgets.get_library_status.assert_not_called()
+
+
+async def test_widget_polled_for_a_new_child_with_sibling_disabled(
+    hass: HomeAssistant,
+    mock_aula_client: AsyncMock,
+) -> None:
+    """Test a child new to the profile gets sensors its sibling disabled."""
+    mock_aula_client.get_profile = AsyncMock(
+        return_value=mock_profile(
+            children=[mock_child(), mock_child(child_id=2, name="New Child")]
+        )
+    )
+    entry = make_widget_config_entry(widgets=[WIDGET_BIBLIOTEKET])
+    entry.add_to_hass(hass)
+    er.async_get(hass).async_get_or_create(
+        "sensor",
+        DOMAIN,
+        "1_library_loans",
+        config_entry=entry,
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert entry.runtime_data.library_coordinator is not None
+    registry = er.async_get(hass)
+    assert registry.async_get_entity_id("sensor", DOMAIN, "2_library_loans")
+    assert registry.async_get(
+        registry.async_get_entity_id("sensor", DOMAIN, "1_library_loans")
+    ).disabled
+
+
+async def test_widget_context_skipped_when_no_widget_is_polled(
+    hass: HomeAssistant,
+    mock_aula_client: AsyncMock,
+) -> None:
+    """Test the widget context is not fetched when every widget is disabled."""
+    entry = make_widget_config_entry(widgets=[WIDGET_BIBLIOTEKET])
+    entry.add_to_hass(hass)
+    er.async_get(hass).async_get_or_create(
+        "sensor",
+        DOMAIN,
+        "1_library_loans",
+        config_entry=entry,
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert entry.runtime_data.library_coordinator is None
+    mock_aula_client.get_profile_context.assert_not_called()
+
+
 async def test_mu_tasks_absent_without_either_widget(
     hass: HomeAssistant,
     mock_aula_client: AsyncMock,
@@ -348,3 +556,145 @@ async def test_mu_tasks_absent_without_either_widget(
     await hass.async_block_till_done()
 
     assert entry.runtime_data.mu_tasks_coordinator is None
+
+
+async def test_setup_restores_snapshot_when_aula_is_down(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_aula_client: AsyncMock,
+) -> None:
+    """Test a coordinator with a snapshot does not hold up setup."""
+    mock_aula_client.get_message_threads = AsyncMock(
+        side_effect=AulaConnectionError("Connection failed", 0)
+    )
+    entry = make_config_entry()
+    entry.add_to_hass(hass)
+    hass_storage[f"{DOMAIN}.{entry.entry_id}.snapshots"] = _messages_snapshot(
+        entry.entry_id
+    )
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    coordinator = entry.runtime_data.messages_coordinator
+    assert coordinator.restored_from_snapshot is True
+    assert coordinator.data.unread_count == 3
+    # The background revalidation failed, so the snapshot is still served.
+    assert coordinator.data_age is not None
+    mock_aula_client.get_message_threads.assert_called()
+
+
+async def test_setup_ignores_snapshot_with_other_schema(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_aula_client: AsyncMock,
+) -> None:
+    """Test a snapshot written under another schema is not restored."""
+    mock_aula_client.get_message_threads = AsyncMock(
+        side_effect=AulaConnectionError("Connection failed", 0)
+    )
+    entry = make_config_entry()
+    entry.add_to_hass(hass)
+    hass_storage[f"{DOMAIN}.{entry.entry_id}.snapshots"] = _messages_snapshot(
+        entry.entry_id, schema=0
+    )
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.SETUP_RETRY
+
+
+async def test_setup_uses_the_cached_profile(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_aula_client: AsyncMock,
+) -> None:
+    """Test setup does not wait on the profile when a cached copy exists."""
+    raw = {"profileId": 42, "children": []}
+    cached = mock_profile()
+    cached._raw = raw
+    # A field setup does not build on changes without a reload.
+    fresh = mock_profile()
+    fresh._raw = {**raw, "displayName": "Renamed Parent"}
+    mock_aula_client.get_profile = AsyncMock(return_value=fresh)
+    entry = _make_session_entry(3600)
+    entry.add_to_hass(hass)
+    hass_storage[f"{DOMAIN}.{entry.entry_id}.snapshots"] = _profile_snapshot(
+        entry.entry_id, raw
+    )
+
+    with (
+        patch("custom_components.hass_aula.Profile.from_dict", return_value=cached),
+        patch.object(hass.config_entries, "async_schedule_reload") as mock_reload,
+    ):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert entry.runtime_data.profile is cached
+    # Revalidated in the background, and unchanged.
+    mock_aula_client.get_profile.assert_awaited_once()
+    mock_reload.assert_not_called()
+
+
+async def test_cached_profile_refreshes_an_expired_session(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_aula_client: AsyncMock,
+) -> None:
+    """Test setup from a cached profile refreshes a session past its expiry."""
+    raw = {"profileId": 42, "children": []}
+    cached = mock_profile()
+    cached._raw = raw
+    entry = _make_session_entry(-60)
+    entry.add_to_hass(hass)
+    hass_storage[f"{DOMAIN}.{entry.entry_id}.snapshots"] = _profile_snapshot(
+        entry.entry_id, raw
+    )
+
+    with (
+        patch("custom_components.hass_aula.Profile.from_dict", return_value=cached),
+        patch(
+            "custom_components.hass_aula.AulaTokenManager.async_refresh_token",
+            return_value=(mock_aula_client, {}),
+        ) as mock_refresh,
+        patch(
+            "custom_components.hass_aula.create_client",
+        ) as mock_create,
+    ):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert entry.state is ConfigEntryState.LOADED
+    mock_refresh.assert_awaited_once()
+    mock_create.assert_not_called()
+    assert entry.runtime_data.client is mock_aula_client
+
+
+async def test_changed_profile_reloads_the_entry(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    mock_aula_client: AsyncMock,
+) -> None:
+    """Test the entry is reloaded when the revalidated profile differs."""
+    cached = mock_profile()
+    cached._raw = {"profileId": 42, "children": []}
+    fresh = mock_profile(children=[mock_child(), mock_child(child_id=2)])
+    fresh._raw = {"profileId": 42, "children": [{"id": 1}, {"id": 2}]}
+    mock_aula_client.get_profile = AsyncMock(return_value=fresh)
+    entry = _make_session_entry(3600)
+    entry.add_to_hass(hass)
+    hass_storage[f"{DOMAIN}.{entry.entry_id}.snapshots"] = _profile_snapshot(
+        entry.entry_id, cached._raw
+    )
+
+    with (
+        patch("custom_components.hass_aula.Profile.from_dict", return_value=cached),
+        patch.object(hass.config_entries, "async_schedule_reload") as mock_reload,
+    ):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=True)
+
+    mock_reload.assert_called_once_with(entry.entry_id)
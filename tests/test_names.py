@@ -0,0 +1,70 @@
+"""Tests for matching widget names to children."""
+
+from __future__ import annotations
+
+from custom_components.hass_aula.names import ChildNameIndex, normalize_name
+
+from .conftest import mock_child
+
+
+def test_normalize_name() -> None:
+    """Test case, accents and whitespace do not matter."""
+    assert normalize_name("  Søren   ÅGE Müller ") == "søren age muller"
+
+
+def test_exact_match_ignores_spelling_differences() -> None:
+    """Test a differently cased, unaccented name still matches exactly."""
+    child = mock_child(name="Åse Kjær")
+    index = ChildNameIndex([child])
+
+    assert index.match("ase  KJÆR") is child
+    assert index.stats["exact"] == 1
+
+
+def test_token_match_without_middle_name() -> None:
+    """Test a name missing a middle name matches on its words."""
+    child = mock_child(name="Emma Marie Jensen")
+    sibling = mock_child(child_id=2, name="Oliver Jensen")
+    index = ChildNameIndex([child, sibling])
+
+    assert index.match("Emma Jensen") is child
+    assert index.match("Oliver Bo Jensen") is sibling
+    assert index.stats["tokens"] == 2
+
+
+def test_prefix_sibling_is_not_matched() -> None:
+    """Test a sibling whose name is a prefix of another's is told apart."""
+    ann = mock_child(name="Ann Hansen")
+    anna = mock_child(child_id=2, name="Anna Hansen")
+    index = ChildNameIndex([ann, anna])
+
+    assert index.match("Anna Hansen") is anna
+    assert index.match("Ann Hansen") is ann
+    # Only the shared surname: fits both, so neither.
+    assert index.match("Hansen") is None
+    assert index.stats["ambiguous"] == 1
+
+
+def test_partial_match_when_unique() -> None:
+    """Test a name contained in exactly one child's name still matches."""
+    child = mock_child(name="Frederikke Nielsen")
+    index = ChildNameIndex([child, mock_child(child_id=2, name="Bo Nielsen")])
+
+    assert index.match("Frederik") is child
+    assert index.stats["partial"] == 1
+
+
+def test_resolved_names_are_memoized() -> None:
+    """Test a repeated name is resolved once."""
+    child = mock_child(name="Test Child")
+    index = ChildNameIndex([child])
+
+    for _ in range(3):
+        assert index.match("Test Child") is child
+    assert index.match("Somebody Else") is None
+
+    stats = index.as_dict()
+    assert stats["exact"] == 1
+    assert stats["memo_hits"] == 2
+    assert stats["unmatched"] == 1
+    assert stats["memoized"] == 2
@@ -8,6 +8,7 @@ from homeassistant.core import HomeAssistant
 
 from custom_components.hass_aula.const import EVENT_NOTIFICATION
 from custom_components.hass_aula.coordinator import AulaNotificationsCoordinator
+from custom_components.hass_aula.store import AulaSnapshotStore
 
 from .conftest import mock_notification
 
@@ -28,7 +29,7 @@ async def test_first_fetch_does_not_fire_events(hass: HomeAssistant) -> None:
     await hass.async_block_till_done()
 
     assert len(fired_events) == 0
-    assert coordinator._known_ids == {"1"}
+    assert "1" in coordinator._known_ids
 
 
 async def test_second_fetch_same_notifications_no_events(hass: HomeAssistant) -> None:
@@ -144,3 +145,125 @@ async def test_notification_count_sensor_state(hass: HomeAssistant) -> None:
     data = await coordinator._async_update_data()
 
     assert len(data) == 3
+
+
+async def test_notification_arriving_during_restart_fires_once(
+    hass: HomeAssistant,
+) -> None:
+    """A notification that arrived while HA was down is announced exactly once."""
+    store = AulaSnapshotStore(hass, "test_entry")
+    client = AsyncMock()
+    existing = mock_notification(notification_id="1")
+    client.get_notifications_for_active_profile = AsyncMock(return_value=[existing])
+
+    before = AulaNotificationsCoordinator(hass, client, AsyncMock())
+    before.config_entry = MagicMock()
+    before.async_restore_snapshot(store)
+    await before._async_update_data()
+
+    fired_events = []
+    hass.bus.async_listen(EVENT_NOTIFICATION, fired_events.append)
+    client.get_notifications_for_active_profile = AsyncMock(
+        return_value=[mock_notification(notification_id="2"), existing]
+    )
+
+    after = AulaNotificationsCoordinator(hass, client, AsyncMock())
+    after.config_entry = MagicMock()
+    after.async_restore_snapshot(store)
+    await after._async_update_data()
+    await after._async_update_data()
+    await hass.async_block_till_done()
+
+    assert [event.data["notification_id"] for event in fired_events] == ["2"]
+
+
+async def test_burst_is_paged_until_a_seen_notification(
+    hass: HomeAssistant,
+) -> None:
+    """A burst larger than one page is fetched page by page and fully announced."""
+    inbox = [mock_notification(notification_id="old")]
+
+    async def _list(*, offset: int = 0, limit: int = 50) -> list[MagicMock]:
+        return inbox[offset : offset + limit]
+
+    client = AsyncMock()
+    client.get_notifications_for_active_profile = AsyncMock(side_effect=_list)
+    coordinator = AulaNotificationsCoordinator(hass, client, AsyncMock())
+    coordinator.config_entry = MagicMock()
+    await coordinator._async_update_data()
+
+    fired_events = []
+    hass.bus.async_listen(EVENT_NOTIFICATION, fired_events.append)
+    inbox[:0] = [mock_notification(notification_id=str(i)) for i in range(70)]
+    data = await coordinator._async_update_data()
+    await hass.async_block_till_done()
+
+    assert len(fired_events) == 70
+    assert len(data) == 50
+    # A small first page, then full pages from where it left off.
+    offsets = [
+        (call.kwargs["offset"], call.kwargs["limit"])
+        for call in client.get_notifications_for_active_profile.await_args_list[1:]
+    ]
+    assert offsets == [(0, 10), (10, 50), (60, 50)]
+    assert coordinator.fetch_stats["pages"] == 3
+    assert coordinator.fetch_stats["full_sync"] is False
+
+
+async def test_quiet_poll_fetches_one_small_page(hass: HomeAssistant) -> None:
+    """With nothing new, a poll costs one small page and drops read items."""
+    inbox = [mock_notification(notification_id=str(i)) for i in range(30)]
+
+    async def _list(*, offset: int = 0, limit: int = 50) -> list[MagicMock]:
+        return inbox[offset : offset + limit]
+
+    client = AsyncMock()
+    client.get_notifications_for_active_profile = AsyncMock(side_effect=_list)
+    coordinator = AulaNotificationsCoordinator(hass, client, AsyncMock())
+    coordinator.config_entry = MagicMock()
+    coordinator.data = await coordinator._async_update_data()
+
+    # Notification "3" was read, so Aula no longer lists it.
+    del inbox[3]
+    data = await coordinator._async_update_data()
+
+    assert client.get_notifications_for_active_profile.await_args.kwargs == {
+        "offset": 0,
+        "limit": 10,
+    }
+    assert len(data) == 29
+    assert "3" not in {n.id for n in data}
+
+
+async def test_child_notifications_indexed_once_per_generation(
+    hass: HomeAssistant,
+) -> None:
+    """Each child's share of the list is indexed in one pass and reused."""
+    notifications = [
+        mock_notification("1", event_type="new_message", institution_profile_id=1),
+        mock_notification("2", event_type="new_post", institution_profile_id=2),
+        mock_notification("3", event_type=None, institution_profile_id=1),
+        *(
+            mock_notification(str(i), event_type="new_post", institution_profile_id=1)
+            for i in range(4, 10)
+        ),
+    ]
+    client = AsyncMock()
+    client.get_notifications_for_active_profile = AsyncMock(return_value=notifications)
+    coordinator = AulaNotificationsCoordinator(hass, client, AsyncMock())
+    coordinator.config_entry = MagicMock()
+    coordinator.data = await coordinator._async_update_data()
+
+    first = coordinator.child_notifications(1)
+    assert first.count == 8
+    assert first.by_type == {"new_message": 1, "unknown": 1, "new_post": 6}
+    assert [n.id for n in first.recent] == ["1", "3", "4", "5", "6"]
+    assert coordinator.child_notifications(2).count == 1
+    assert coordinator.child_notifications(3).count == 0
+    assert coordinator.child_notifications(1) is first
+
+    client.get_notifications_for_active_profile.return_value = notifications[:2]
+    coordinator._full_synced_at = None
+    coordinator.data = await coordinator._async_update_data()
+
+    assert coordinator.child_notifications(1).count == 1
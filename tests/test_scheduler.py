@@ -0,0 +1,54 @@
+"""Tests for the Aula request scheduler."""
+
+from __future__ import annotations
+
+import asyncio
+
+from custom_components.hass_aula.scheduler import (
+    AulaRequestScheduler,
+    RequestPriority,
+)
+
+
+async def test_user_requests_overdraw_the_budget() -> None:
+    """Test that actions never wait, but bounded debt is recorded."""
+    scheduler = AulaRequestScheduler(capacity=4, refill_rate=0.001)
+
+    assert await scheduler.async_acquire(RequestPriority.USER, 3)
+    assert await scheduler.async_acquire(RequestPriority.USER, 3)
+    assert await scheduler.async_acquire(RequestPriority.USER, 10)
+
+    assert scheduler.tokens < -3.9
+    assert scheduler.as_dict()["granted"]["user"] == 3
+
+
+async def test_background_poll_is_deferred_when_budget_is_short() -> None:
+    """Test that widget polls with data step aside instead of queueing."""
+    scheduler = AulaRequestScheduler(capacity=2, refill_rate=0.001)
+    await scheduler.async_acquire(RequestPriority.USER, 2)
+
+    granted = await scheduler.async_acquire(
+        RequestPriority.BACKGROUND, 1, can_defer=True
+    )
+
+    assert not granted
+    assert scheduler.as_dict()["deferred"]["background"] == 1
+
+
+async def test_core_waits_ahead_of_background() -> None:
+    """Test that a waiting core poll is served before background work."""
+    scheduler = AulaRequestScheduler(capacity=1, refill_rate=50)
+    await scheduler.async_acquire(RequestPriority.USER, 1)
+    order: list[RequestPriority] = []
+
+    async def _acquire(priority: RequestPriority) -> None:
+        await scheduler.async_acquire(priority, 1)
+        order.append(priority)
+
+    core = asyncio.create_task(_acquire(RequestPriority.CORE))
+    await asyncio.sleep(0)
+    background = asyncio.create_task(_acquire(RequestPriority.BACKGROUND))
+    await asyncio.gather(core, background)
+
+    assert order == [RequestPriority.CORE, RequestPriority.BACKGROUND]
+    assert scheduler.as_dict()["waiting"] == {"user": 0, "core": 0, "background": 0}
@@ -412,6 +412,28 @@ async def test_child_notifications_per_child(
     assert state_total.state == "4"
 
 
+async def test_sensor_values_reused_for_the_same_data(
+    hass: HomeAssistant,
+    mock_aula_client: AsyncMock,
+) -> None:
+    """Writing sensors again for the same data reuses what they derived."""
+    entry = make_config_entry()
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = entry.runtime_data.notifications_coordinator
+    stats = coordinator.entity_cache_stats
+    misses, hits = stats["misses"], stats["hits"]
+    assert misses > 0
+
+    coordinator.async_update_listeners()
+    await hass.async_block_till_done()
+
+    assert stats["misses"] == misses
+    assert stats["hits"] > hits
+
+
 # --- Library Sensor Tests ---
 
 
@@ -432,7 +454,7 @@ async def test_library_loans_sensor(
     entry = make_widget_config_entry(widgets=[WIDGET_BIBLIOTEKET])
     entry.add_to_hass(hass)
     await hass.config_entries.async_setup(entry.entry_id)
-    await hass.async_block_till_done()
+    await hass.async_block_till_done(wait_background_tasks=True)
 
     state = hass.states.get("sensor.test_child_library_loans")
     assert state is not None
@@ -466,7 +488,7 @@ async def test_library_sensor_empty_data(
     entry = make_widget_config_entry(widgets=[WIDGET_BIBLIOTEKET])
     entry.add_to_hass(hass)
     await hass.config_entries.async_setup(entry.entry_id)
-    await hass.async_block_till_done()
+    await hass.async_block_till_done(wait_background_tasks=True)
 
     state = hass.states.get("sensor.test_child_library_loans")
     assert state is not None
@@ -488,7 +510,7 @@ async def test_mu_tasks_sensor(
     entry = make_widget_config_entry(widgets=[WIDGET_MIN_UDDANNELSE_TASKS])
     entry.add_to_hass(hass)
     await hass.config_entries.async_setup(entry.entry_id)
-    await hass.async_block_till_done()
+    await hass.async_block_till_done(wait_background_tasks=True)
 
     state = hass.states.get("sensor.test_child_mu_tasks")
     assert state is not None
@@ -527,7 +549,7 @@ async def test_easyiq_weekplan_sensor(
     )
     entry.add_to_hass(hass)
     await hass.config_entries.async_setup(entry.entry_id)
-    await hass.async_block_till_done()
+    await hass.async_block_till_done(wait_background_tasks=True)
 
     state = hass.states.get("sensor.test_child_weekplan")
     assert state is not None
@@ -551,7 +573,7 @@ async def test_easyiq_homework_sensor(
     )
     entry.add_to_hass(hass)
     await hass.config_entries.async_setup(entry.entry_id)
-    await hass.async_block_till_done()
+    await hass.async_block_till_done(wait_background_tasks=True)
 
     state = hass.states.get("sensor.test_child_homework")
     assert state is not None
@@ -587,7 +609,7 @@ async def test_meebook_weekplan_sensor(
     entry = make_widget_config_entry(widgets=[WIDGET_MEEBOOK])
     entry.add_to_hass(hass)
     await hass.config_entries.async_setup(entry.entry_id)
-    await hass.async_block_till_done()
+    await hass.async_block_till_done(wait_background_tasks=True)
 
     state = hass.states.get("sensor.test_child_meebook_weekplan")
     assert state is not None
@@ -629,7 +651,7 @@ async def test_huskelisten_sensor(
     entry = make_widget_config_entry(widgets=[WIDGET_HUSKELISTEN])
     entry.add_to_hass(hass)
     await hass.config_entries.async_setup(entry.entry_id)
-    await hass.async_block_till_done()
+    await hass.async_block_till_done(wait_background_tasks=True)
 
     state = hass.states.get("sensor.test_child_reminders")
     assert state is not None
@@ -662,7 +684,7 @@ async def test_huskelisten_sensor_empty(
     entry = make_widget_config_entry(widgets=[WIDGET_HUSKELISTEN])
     entry.add_to_hass(hass)
     await hass.config_entries.async_setup(entry.entry_id)
-    await hass.async_block_till_done()
+    await hass.async_block_till_done(wait_background_tasks=True)
 
     state = hass.states.get("sensor.test_child_reminders")
     assert state is not None
@@ -689,7 +711,7 @@ async def test_mu_weekly_notes_sensor(
     entry = make_widget_config_entry(widgets=[WIDGET_MIN_UDDANNELSE_UGEPLAN])
     entry.add_to_hass(hass)
     await hass.config_entries.async_setup(entry.entry_id)
-    await hass.async_block_till_done()
+    await hass.async_block_till_done(wait_background_tasks=True)
 
     state = hass.states.get("sensor.test_child_weekly_notes")
     assert state is not None
@@ -724,7 +746,7 @@ async def test_mu_weekly_notes_sensor_empty(
     entry = make_widget_config_entry(widgets=[WIDGET_MIN_UDDANNELSE_UGEPLAN])
     entry.add_to_hass(hass)
     await hass.config_entries.async_setup(entry.entry_id)
-    await hass.async_block_till_done()
+    await hass.async_block_till_done(wait_background_tasks=True)
 
     state = hass.states.get("sensor.test_child_weekly_notes")
     assert state is not None
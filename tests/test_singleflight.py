@@ -0,0 +1,144 @@
+"""Tests for coalescing identical in-flight Aula requests."""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+from dataclasses import dataclass
+from typing import Any
+from unittest.mock import AsyncMock
+
+from aula import AulaServerError
+
+from custom_components.hass_aula.singleflight import AulaSingleFlight
+
+
+async def test_identical_calls_share_one_request() -> None:
+    """Test overlapping identical calls reach Aula once."""
+    release = asyncio.Event()
+
+    async def get_messages_for_thread(*_: object, **__: object) -> list[str]:
+        await release.wait()
+        return ["message"]
+
+    method = AsyncMock(side_effect=get_messages_for_thread)
+    flight = AulaSingleFlight()
+
+    calls = [
+        asyncio.create_task(flight.async_call(method, "thread-1", limit=5))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*calls)
+
+    assert results == [["message"]] * 3
+    method.assert_awaited_once()
+    stats = flight.as_dict()
+    assert sum(stats["shared"].values()) == 2
+    assert stats["in_flight"] == 0
+
+
+async def test_different_arguments_are_not_shared() -> None:
+    """Test calls with other arguments go to Aula on their own."""
+    method = AsyncMock(return_value=[])
+    flight = AulaSingleFlight()
+
+    await asyncio.gather(
+        flight.async_call(method, 1, limit=1),
+        flight.async_call(method, 2, limit=1),
+    )
+
+    assert method.await_count == 2
+    assert sum(flight.as_dict()["shared"].values()) == 0
+
+
+async def test_failure_reaches_every_waiter() -> None:
+    """Test a shared failure is raised to all callers and not cached."""
+    method = AsyncMock(side_effect=AulaServerError("Unavailable", 503))
+    flight = AulaSingleFlight()
+
+    results = await asyncio.gather(
+        flight.async_call(method, "thread"),
+        flight.async_call(method, "thread"),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, AulaServerError) for result in results)
+    method.reset_mock(side_effect=True)
+    method.return_value = ["message"]
+    assert await flight.async_call(method, "thread") == ["message"]
+
+
+async def test_unhashable_arguments_bypass_sharing() -> None:
+    """Test arguments that cannot be keyed still make the call."""
+
+    @dataclass
+    class Filter:
+        ids: list[int]
+
+    method = AsyncMock(return_value="ok")
+    flight = AulaSingleFlight()
+
+    assert await flight.async_call(method, Filter([1])) == "ok"
+    assert await flight.async_call(method, Filter([1])) == "ok"
+    assert method.await_count == 2
+    assert flight.as_dict()["calls"] == {}
+
+
+async def test_same_method_of_another_client_is_not_shared() -> None:
+    """Test a rebuilt client does not join a call still running on the old one."""
+    release = asyncio.Event()
+
+    class Client:
+        def __init__(self) -> None:
+            self.calls = 0
+
+        async def get_message_threads(self) -> list[str]:
+            self.calls += 1
+            await release.wait()
+            return []
+
+    old, new = Client(), Client()
+    flight = AulaSingleFlight()
+
+    calls = [
+        asyncio.create_task(flight.async_call(old.get_message_threads)),
+        asyncio.create_task(flight.async_call(new.get_message_threads)),
+    ]
+    await asyncio.sleep(0)
+    release.set()
+    await asyncio.gather(*calls)
+
+    assert (old.calls, new.calls) == (1, 1)
+    assert sum(flight.as_dict()["shared"].values()) == 0
+
+
+async def test_failure_without_waiters_is_retrieved() -> None:
+    """Test a call failing after all its callers left logs nothing."""
+    loop = asyncio.get_running_loop()
+    errors: list[dict[str, Any]] = []
+    previous_handler = loop.get_exception_handler()
+    loop.set_exception_handler(lambda _, context: errors.append(context))
+    release = asyncio.Event()
+
+    async def get_thread(_: str) -> None:
+        await release.wait()
+        msg = "Unavailable"
+        raise AulaServerError(msg, 503)
+
+    flight = AulaSingleFlight()
+    try:
+        waiter = asyncio.create_task(flight.async_call(get_thread, "thread"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        release.set()
+        for _ in range(3):
+            await asyncio.sleep(0)
+        del waiter
+        gc.collect()
+    finally:
+        loop.set_exception_handler(previous_handler)
+
+    assert errors == []
+    assert flight.as_dict()["in_flight"] == 0
@@ -0,0 +1,45 @@
+"""Tests for the calendar event timeline."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from custom_components.hass_aula.timeline import EventTimeline
+
+from .conftest import mock_calendar_event
+
+
+def _at(hour: int, minute: int = 0) -> datetime:
+    return datetime(2024, 1, 15, hour, minute, tzinfo=UTC)
+
+
+def _timeline() -> EventTimeline:
+    # Listed out of order; the excursion spans the lessons after it.
+    return EventTimeline(
+        [
+            mock_calendar_event(title="Danish", start=_at(11), end=_at(12)),
+            mock_calendar_event(title="Excursion", start=_at(8), end=_at(10, 30)),
+            mock_calendar_event(title="Math", start=_at(9), end=_at(10)),
+            mock_calendar_event(title="Music", start=_at(13), end=_at(14)),
+        ]
+    )
+
+
+def test_next_event_is_earliest_start_not_ended() -> None:
+    """Test the event under way that started first wins over later ones."""
+    timeline = _timeline()
+
+    assert len(timeline) == 4
+    assert timeline.next_event(_at(7)).summary == "Excursion"
+    assert timeline.next_event(_at(9, 30)).summary == "Excursion"
+    assert timeline.next_event(_at(10, 15)).summary == "Excursion"
+    assert timeline.next_event(_at(10, 30)).summary == "Danish"
+    assert timeline.next_event(_at(12, 30)).summary == "Music"
+    assert timeline.next_event(_at(14)) is None
+
+
+def test_empty_timeline() -> None:
+    """Test a child without events has no next event."""
+    timeline = EventTimeline([])
+
+    assert timeline.next_event(_at(9)) is None
@@ -54,7 +54,6 @@ async def test_async_refresh_token_success(hass: HomeAssistant) -> None:
         patch(
             "custom_components.hass_aula.token_manager.MitIDAuthClient"
         ) as mock_auth_cls,
-        patch("custom_components.hass_aula.token_manager.ssl.create_default_context"),
         patch(
             "custom_components.hass_aula.token_manager.httpx.AsyncClient"
         ) as mock_httpx,
@@ -62,7 +61,7 @@ async def test_async_refresh_token_success(hass: HomeAssistant) -> None:
             "custom_components.hass_aula.token_manager.create_client",
             return_value=mock_client,
         ) as mock_create,
-        patch("custom_components.hass_aula.token_manager.HttpxHttpClient"),
+        patch("custom_components.hass_aula.token_manager.async_create_http_client"),
     ):
         mock_httpx_inst = AsyncMock()
         mock_httpx.return_value = mock_httpx_inst
@@ -108,7 +107,6 @@ async def test_async_refresh_token_oauth_error(hass: HomeAssistant) -> None:
         patch(
             "custom_components.hass_aula.token_manager.MitIDAuthClient"
         ) as mock_auth_cls,
-        patch("custom_components.hass_aula.token_manager.ssl.create_default_context"),
         patch(
             "custom_components.hass_aula.token_manager.httpx.AsyncClient"
         ) as mock_httpx,
@@ -155,7 +153,6 @@ async def test_async_refresh_and_rebuild_client(hass: HomeAssistant) -> None:
         patch(
             "custom_components.hass_aula.token_manager.MitIDAuthClient"
         ) as mock_auth_cls,
-        patch("custom_components.hass_aula.token_manager.ssl.create_default_context"),
         patch(
             "custom_components.hass_aula.token_manager.httpx.AsyncClient"
         ) as mock_httpx,
@@ -163,7 +160,7 @@ async def test_async_refresh_and_rebuild_client(hass: HomeAssistant) -> None:
             "custom_components.hass_aula.token_manager.create_client",
             return_value=new_client,
         ),
-        patch("custom_components.hass_aula.token_manager.HttpxHttpClient"),
+        patch("custom_components.hass_aula.token_manager.async_create_http_client"),
     ):
         mock_httpx.return_value = AsyncMock()
         mock_auth = MagicMock()
@@ -241,7 +238,6 @@ async def test_concurrent_refresh_only_one_call(hass: HomeAssistant) -> None:
         patch(
             "custom_components.hass_aula.token_manager.MitIDAuthClient"
         ) as mock_auth_cls,
-        patch("custom_components.hass_aula.token_manager.ssl.create_default_context"),
         patch(
             "custom_components.hass_aula.token_manager.httpx.AsyncClient"
         ) as mock_httpx,
@@ -249,7 +245,7 @@ async def test_concurrent_refresh_only_one_call(hass: HomeAssistant) -> None:
             "custom_components.hass_aula.token_manager.create_client",
             return_value=new_client,
         ),
-        patch("custom_components.hass_aula.token_manager.HttpxHttpClient"),
+        patch("custom_components.hass_aula.token_manager.async_create_http_client"),
         patch.object(tm, "_async_do_refresh", side_effect=counting_refresh),
     ):
         mock_httpx.return_value = AsyncMock()
@@ -266,3 +262,34 @@ async def test_concurrent_refresh_only_one_call(hass: HomeAssistant) -> None:
     assert call_count == 1
     # Both return a valid client
     assert all(r is not None for r in results)
+
+
+async def test_refresh_stats_split_cold_and_warm(hass: HomeAssistant) -> None:
+    """Test refreshes are counted by whether the auth connection was open."""
+    entry = _make_entry(hass)
+    tm = AulaTokenManager(hass, entry)
+    transport = MagicMock()
+
+    with (
+        patch(
+            "custom_components.hass_aula.token_manager.async_get_auth_transport",
+            return_value=transport,
+        ),
+        patch(
+            "custom_components.hass_aula.token_manager.MitIDAuthClient"
+        ) as mock_auth_cls,
+        patch("custom_components.hass_aula.token_manager.httpx.AsyncClient"),
+    ):
+        mock_auth_cls.return_value.refresh_access_token = AsyncMock(
+            return_value=_make_refreshed_tokens()
+        )
+
+        transport.is_warm = False
+        await tm._async_do_refresh(MOCK_TOKEN_DATA, "mock_refresh_token")
+        transport.is_warm = True
+        await tm._async_do_refresh(MOCK_TOKEN_DATA, "mock_refresh_token")
+        await tm._async_do_refresh(MOCK_TOKEN_DATA, "mock_refresh_token")
+
+    assert tm.refresh_stats["cold"]["count"] == 1
+    assert tm.refresh_stats["warm"]["count"] == 2
+    assert isinstance(tm.refresh_stats["warm"]["last_ms"], int)